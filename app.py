@@ -13,22 +13,32 @@ Features:
 - Net Carry efficiency analysis
 """
 
-import io
 import sys
 import logging
+import operator
+import tempfile
+from dataclasses import astuple
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import importlib
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import streamlit as st
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Serialize figures with orjson when available (native ndarray encoding)
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = "orjson"
+except ImportError:
+    pass
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -48,6 +58,9 @@ from src.module_b.analytics import PortfolioAnalyzer
 from src.module_b.financials import FinancialDataLoader
 from src.utils.constants import SECTOR_COLORS, Z_SCORE_THRESHOLDS
 
+# Parquet copies of parsed portfolio CSVs and derived issuer metrics, kept out of the data folder
+DATA_CACHE_DIR = Path(tempfile.gettempdir()) / "alpha-one-cockpit" / "raw"
+
 # ============================================
 # PAGE CONFIG & THEME
 # ============================================
@@ -599,35 +612,35 @@ SECTOR_NAMES_CN = {
 # ============================================
 # PLOTLY DARK THEME HELPER
 # ============================================
+# Built once at import; Streamlit's plotly theme rewrites template-level
+# layout on the frontend, so these are applied as explicit layout values.
+DARK_BASE_LAYOUT = dict(
+    paper_bgcolor="rgba(13, 17, 23, 0)",
+    plot_bgcolor="rgba(22, 27, 34, 0.5)",
+    font=dict(color="#e6edf3", family="Inter, sans-serif"),
+    hoverlabel=dict(
+        bgcolor="#21262d",
+        bordercolor="#30363d",
+        font=dict(color="#e6edf3", family="Roboto Mono, monospace"),
+    ),
+)
+
+DARK_AXIS_STYLE = dict(
+    gridcolor="rgba(48, 54, 61, 0.5)",
+    linecolor="#30363d",
+    tickfont=dict(color="#8b949e"),
+    title_font=dict(color="#8b949e"),
+)
+
+
 def apply_dark_theme(fig, **kwargs):
     """Apply dark theme to a Plotly figure with optional overrides."""
-    # Base dark theme settings
-    fig.update_layout(
-        paper_bgcolor="rgba(13, 17, 23, 0)",
-        plot_bgcolor="rgba(22, 27, 34, 0.5)",
-        font=dict(color="#e6edf3", family="Inter, sans-serif"),
-        hoverlabel=dict(
-            bgcolor="#21262d",
-            bordercolor="#30363d",
-            font=dict(color="#e6edf3", family="Roboto Mono, monospace"),
-        ),
-        **kwargs
-    )
+    # Base dark theme settings and overrides merged into a single layout update
+    fig.update_layout(DARK_BASE_LAYOUT, **kwargs)
 
     # Update axes
-    fig.update_xaxes(
-        gridcolor="rgba(48, 54, 61, 0.5)",
-        linecolor="#30363d",
-        tickfont=dict(color="#8b949e"),
-        title_font=dict(color="#8b949e"),
-    )
-
-    fig.update_yaxes(
-        gridcolor="rgba(48, 54, 61, 0.5)",
-        linecolor="#30363d",
-        tickfont=dict(color="#8b949e"),
-        title_font=dict(color="#8b949e"),
-    )
+    fig.update_xaxes(DARK_AXIS_STYLE)
+    fig.update_yaxes(DARK_AXIS_STYLE)
 
     return fig
 
@@ -699,6 +712,27 @@ def get_sector_color(sector: str, sector_color_map: dict = None) -> str:
     return new_color
 
 
+@st.cache_data(show_spinner=False)
+def sector_labels_colors(
+    sectors: Tuple[str, ...],
+    color_map_items: Tuple[Tuple[str, str], ...],
+) -> Tuple[list, list, dict]:
+    """
+    Bilingual labels and colors for a set of sectors.
+
+    Cached on the sector keys and the current color-map contents, so reruns
+    with an unchanged allocation are a dict hit.
+
+    Returns:
+        Tuple of (labels, colors, color_map) where color_map includes any
+        newly assigned fallback colors
+    """
+    color_map = dict(color_map_items)
+    labels = [f"{k} / {SECTOR_NAMES_CN.get(k, k)}" for k in sectors]
+    colors = [get_sector_color(k, color_map) for k in sectors]
+    return labels, colors, color_map
+
+
 # ============================================
 # UTILITY FUNCTIONS
 # ============================================
@@ -730,6 +764,29 @@ def format_number(value: float, decimals: int = 2) -> str:
     return f"{value:.{decimals}f}"
 
 
+def format_currency_vec(values) -> np.ndarray:
+    """Vectorized format_currency (short form): one format pass per magnitude bucket."""
+    v = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(v)
+    bucket = np.select(
+        [magnitude >= 1e9, magnitude >= 1e6, magnitude >= 1e3, ~np.isnan(v)],
+        [0, 1, 2, 3],
+        default=-1,
+    )
+    out = np.full(len(v), "—", dtype=object)
+    for i, (divisor, fmt) in enumerate([(1e9, "${:.2f}B"), (1e6, "${:.1f}M"), (1e3, "${:.0f}K"), (1.0, "${:,.0f}")]):
+        mask = bucket == i
+        if mask.any():
+            out[mask] = [fmt.format(x) for x in v[mask] / divisor]
+    return out
+
+
+def format_percentage_vec(values, decimals: int = 2) -> np.ndarray:
+    """Vectorized format_percentage."""
+    v = np.asarray(values, dtype=np.float64)
+    return np.where(np.isnan(v), "—", np.char.mod(f"%.{decimals}f%%", v * 100)).astype(object)
+
+
 def get_z_score_class(z_score: float) -> str:
     """Get CSS class based on Z-score."""
     if pd.isna(z_score):
@@ -807,6 +864,419 @@ def render_bond_card(row: pd.Series) -> str:
     """
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def encode_csv(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as CSV bytes, cached on the frame's contents."""
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def make_csv_exporter(df: pd.DataFrame):
+    """
+    Build a zero-argument CSV serializer for ``st.download_button``.
+
+    Serialization is deferred until the user clicks download; repeat
+    downloads of an unchanged frame reuse the cached bytes.
+    """
+    def export() -> bytes:
+        return encode_csv(df)
+
+    return export
+
+
+def calculate_health_score(latest) -> Tuple[Optional[float], int]:
+    """
+    Fundamental Health Score (0-100) from a quarter's leverage, coverage and margin.
+
+    Component scores are computed as one vector; missing or invalid inputs
+    become NaN and are masked out instead of being branched on one by one.
+
+    Returns:
+        Tuple of (health score or None if no component is available, component count)
+    """
+    leverage, coverage, ebitda, revenue = np.array(
+        [latest.net_leverage, latest.interest_coverage, latest.ebitda, latest.revenue],
+        dtype=np.float64,
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.array([
+            np.maximum(0.0, 100 - leverage * 10),             # Lower leverage = higher score
+            np.minimum(100.0, coverage * 20),                 # Higher coverage = higher score
+            np.minimum(100.0, (ebitda / revenue) * 100 * 2),  # Higher margin = higher score
+        ])
+
+    valid = np.array([leverage > 0, coverage != 0, revenue > 0 and ebitda > 0]) & np.isfinite(scores)
+    scores = scores[valid]
+
+    return (float(scores.mean()) if len(scores) > 0 else None), len(scores)
+
+
+# Mispricing quadrant rules, checked in order:
+# (healthy, z-score test, threshold, quadrant, description, accent, memo recommendation, memo rationale)
+MISPRICING_QUADRANTS = (
+    (True, operator.ge, 0.5, "🟢 Deep Value / 黄金坑", "Good Fundamentals + Cheap Pricing", "green",
+     "**BUY** 🟢", "Deep Value opportunity - Strong fundamentals trading at cheap valuations (黄金坑)"),
+    (False, operator.lt, -0.5, "🔴 Value Trap / 价值陷阱", "Poor Fundamentals + Rich Pricing", "red",
+     "**SELL** 🔴", "Value Trap - Weak fundamentals trading at rich valuations (价值陷阱)"),
+    (True, operator.lt, -0.5, "🟡 Quality Rich / 优质偏贵", "Good Fundamentals but Expensive", "yellow",
+     "**HOLD/TRIM** 🟡", "Quality company but expensive - Consider taking profits"),
+)
+MISPRICING_QUADRANT_DEFAULT = (
+    "🟠 Distressed Cheap / 困境便宜", "Poor Fundamentals but Cheap", "orange",
+    "**OPPORTUNISTIC BUY** 🟠", "Distressed but cheap - Monitor for turnaround",
+)
+
+
+def classify_mispricing_quadrant(health_score: float, avg_z: float) -> Tuple[str, str, str, str, str]:
+    """
+    Place an issuer in the Mispricing Quadrant (health score >= 50 is healthy).
+
+    Returns:
+        Tuple of (quadrant, description, accent, memo recommendation, memo rationale)
+    """
+    healthy = health_score >= 50
+    for rule_healthy, z_test, threshold, *quadrant in MISPRICING_QUADRANTS:
+        if healthy == rule_healthy and z_test(avg_z, threshold):
+            return tuple(quadrant)
+    return MISPRICING_QUADRANT_DEFAULT
+
+
+def get_cached_fundamentals(bond_ticker: str):
+    """Get issuer fundamentals, memoized per session by bond ticker."""
+    fund_cache = st.session_state.fund_cache
+    if bond_ticker not in fund_cache:
+        fund_cache[bond_ticker] = st.session_state.financial_loader.get_issuer_fundamentals(bond_ticker)
+    return fund_cache[bond_ticker]
+
+
+def frame_content_key(df: Optional[pd.DataFrame]) -> Optional[int]:
+    """Content signature of a frame, used as a cache key in its place."""
+    if df is None:
+        return None
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    return hash((tuple(df.columns), row_hashes.tobytes()))
+
+
+def build_filtered_analyzer(df_filtered: pd.DataFrame, model_type: str) -> PortfolioAnalyzer:
+    """
+    Fit sector curves on the filtered portfolio.
+
+    The fitted analyzer is kept in this session's state, keyed on the
+    filtered frame's contents and the model type, so reruns that leave the
+    filters unchanged (tab switches, button presses) reuse it instead of
+    refitting every sector. It is mutable, so it is never shared across
+    sessions. On a miss, sectors whose data is unchanged from the previous
+    analyzer keep their fitted curves and only the affected sectors are refit.
+    """
+    key = (frame_content_key(df_filtered), model_type)
+    previous = st.session_state.filtered_analyzer
+    if previous is not None and st.session_state.filtered_analyzer_key == key:
+        return previous
+    filtered_analyzer = PortfolioAnalyzer(df_filtered, model_type=model_type)
+    filtered_analyzer.fit_sector_curves(previous=previous)
+    st.session_state.filtered_analyzer_key = key
+    return filtered_analyzer
+
+
+def regression_stats_key(regression_results: dict) -> tuple:
+    """Cache key for the regression stats tables: each sector's fitted parameters."""
+    return tuple((sector, astuple(r)) for sector, r in regression_results.items())
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_regression_stats(
+    model_type: str,
+    stats_key: tuple,
+    _regression_results: dict,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the model stats display table and the regression CSV export table.
+
+    Cached on the fitted parameters (``stats_key``), so reruns with unchanged
+    curves skip rebuilding both frames.
+    """
+    stats_data = []
+    for sector, r in _regression_results.items():
+        sector_display = f"{sector} / {SECTOR_NAMES_CN.get(sector, sector)}"
+        base_stats = {
+            f"{LABELS['sector']}": sector_display,
+            "R²": f"{r.r_squared:.4f}",
+            "N": r.sample_count,
+            "Dur Range": f"{r.duration_range[0]:.1f}-{r.duration_range[1]:.1f}",
+            "Residual σ": f"{r.residual_std*100:.2f}%",
+        }
+
+        # Add model-specific parameters
+        if model_type == "nelson_siegel":
+            base_stats.update({
+                "β₀ (Long)": f"{r.beta_0*100:.2f}%",
+                "β₁ (Short)": f"{r.beta_1*100:.2f}%",
+                "β₂ (Curve)": f"{r.beta_2*100:.2f}%",
+                "λ (Decay)": f"{r.lambda_:.2f}",
+            })
+        else:
+            base_stats.update({
+                "Coeff a": f"{r.a:.6f}",
+                "Coeff b": f"{r.b:.4f}",
+                "Coeff c": f"{r.c:.4f}",
+            })
+
+        stats_data.append(base_stats)
+
+    reg_df = pd.DataFrame([r.to_dict() for r in _regression_results.values()])
+    return pd.DataFrame(stats_data), reg_df
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def build_bond_hover(df_filtered: pd.DataFrame) -> pd.Series:
+    """
+    Hover text per bond, indexed like ``df_filtered``.
+
+    Cached on the filtered frame's contents, so the strings are built once per
+    filter state and chart redraws only select the rows they plot.
+    """
+    names = (
+        df_filtered["Name"].fillna("N/A").to_numpy() if "Name" in df_filtered.columns
+        else np.full(len(df_filtered), "N/A")
+    )
+    hover = [
+        f"<b>{ticker}</b><br>"
+        f"名称: {name}<br>"
+        f"━━━━━━━━━━━━<br>"
+        f"YTM: {ytm*100:.2f}%<br>"
+        f"Duration: {dur:.2f}y<br>"
+        f"OAS: {oas:.0f}bp<br>"
+        f"Z-Score: {z:.2f}<br>"
+        f"━━━━━━━━━━━━<br>"
+        f"Notional: {nominal}"
+        for ticker, name, ytm, dur, oas, z, nominal in zip(
+            df_filtered["Ticker"].to_numpy(),
+            names,
+            df_filtered["Yield"].to_numpy(),
+            df_filtered["Duration"].to_numpy(),
+            df_filtered["OAS"].to_numpy(),
+            df_filtered["Z_Score"].to_numpy(),
+            format_currency_vec(df_filtered["Nominal_USD"]),
+        )
+    ]
+    return pd.Series(hover, index=df_filtered.index, dtype=object)
+
+
+@st.cache_data(show_spinner=False)
+def compute_sector_avg_lac(
+    ticker_roots: Tuple[str, ...],
+    oas_values: Tuple[float, ...],
+    metrics_key: Optional[int],
+    _latest_metrics: pd.DataFrame,
+) -> Optional[float]:
+    """
+    Average Leverage-Adjusted Carry (OAS / Net Leverage) across a sector's bonds.
+
+    Cached across reruns, keyed on the sector's ticker roots and OAS values and
+    on ``metrics_key`` (the latest-metrics table's signature, see
+    metrics_table_key), so reloaded fundamentals invalidate the cached averages.
+    """
+    # Structure-of-arrays: one float buffer per metric, NaN where leverage is missing
+    latest_metrics = _latest_metrics
+    oas = np.asarray(oas_values, dtype=np.float64)
+    net_leverage = latest_metrics['Net_Leverage'].reindex(list(ticker_roots)).to_numpy(dtype=np.float64)
+
+    valid = net_leverage > 0
+    if not valid.any():
+        return None
+    return float(np.mean(oas[valid] / net_leverage[valid]))
+
+
+# ============================================
+# FINANCIAL CHART BUILDERS
+# ============================================
+# Figures are cached per issuer and series content, so reruns that do not
+# change the selected issuer reuse the already-built Figure objects.
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_delever_figure(
+    bond_ticker: str,
+    dates: Tuple[str, ...],
+    liabilities_vals: Tuple[float, ...],
+    dates_lev: Tuple[str, ...],
+    leverage_vals: Tuple[float, ...],
+) -> go.Figure:
+    """Deleveraging chart: Total Liabilities bars + Net Leverage line."""
+    fig_delever = go.Figure()
+
+    # Bar chart for Total Liabilities
+    fig_delever.add_trace(go.Bar(
+        x=dates,
+        y=np.asarray(liabilities_vals, dtype=np.float64) / 1e9,  # Convert to billions
+        name='Total Liabilities',
+        marker_color='#58a6ff',
+        yaxis='y',
+        hovertemplate='<b>%{x}</b><br>Total Liabilities: $%{y:.2f}B<extra></extra>'
+    ))
+
+    # Line chart for Net Leverage (right axis)
+    if len(leverage_vals) > 0:
+        fig_delever.add_trace(go.Scatter(
+            x=dates_lev,
+            y=leverage_vals,
+            name='Net Leverage',
+            mode='lines+markers',
+            line=dict(color='#f85149', width=3),
+            marker=dict(size=8, color='#f85149'),
+            yaxis='y2',
+            hovertemplate='<b>%{x}</b><br>Net Leverage: %{y:.2f}x<extra></extra>'
+        ))
+
+    fig_delever.update_layout(
+        yaxis=dict(title='Total Liabilities ($B)', side='left', color='#58a6ff'),
+        yaxis2=dict(title='Net Leverage (x)', side='right', overlaying='y', color='#f85149'),
+        hovermode='x unified',
+        height=280,
+        margin=dict(l=50, r=50, t=20, b=40),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+    )
+
+    apply_dark_theme(fig_delever)
+    return fig_delever
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_liquidity_figure(
+    bond_ticker: str,
+    dates_cash: Tuple[str, ...],
+    cash_vals: Tuple[float, ...],
+    dates_int: Tuple[str, ...],
+    int_exp_vals: Tuple[float, ...],
+) -> go.Figure:
+    """Liquidity chart: stacked areas for Cash vs. Net Interest Expense."""
+    fig_liquidity = go.Figure()
+
+    # Stacked area for Cash
+    fig_liquidity.add_trace(go.Scatter(
+        x=dates_cash,
+        y=np.asarray(cash_vals, dtype=np.float64) / 1e9,
+        name='Cash',
+        mode='lines',
+        fill='tozeroy',
+        line=dict(color='#3fb950', width=2),
+        hovertemplate='<b>%{x}</b><br>Cash: $%{y:.2f}B<extra></extra>'
+    ))
+
+    # Stacked area for Net Interest Expense
+    fig_liquidity.add_trace(go.Scatter(
+        x=dates_int,
+        y=np.abs(np.asarray(int_exp_vals, dtype=np.float64)) / 1e9,
+        name='Net Int Exp',
+        mode='lines',
+        fill='tonexty',
+        line=dict(color='#f85149', width=2),
+        hovertemplate='<b>%{x}</b><br>Net Int Exp: $%{y:.2f}B<extra></extra>'
+    ))
+
+    fig_liquidity.update_layout(
+        yaxis_title='Amount ($B)',
+        hovermode='x unified',
+        height=280,
+        margin=dict(l=50, r=20, t=20, b=40),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+    )
+
+    apply_dark_theme(fig_liquidity)
+    return fig_liquidity
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_profit_figure(
+    bond_ticker: str,
+    dates_rev: Tuple[str, ...],
+    revenue_vals: Tuple[float, ...],
+    dates_margin: Tuple[str, ...],
+    ebitda_margins: Tuple[float, ...],
+) -> go.Figure:
+    """Profitability chart: Revenue bars (left axis) + EBITDA Margin line (right axis)."""
+    fig_profit = go.Figure()
+
+    # Bar chart for Revenue (left Y-axis)
+    fig_profit.add_trace(go.Bar(
+        x=dates_rev,
+        y=np.asarray(revenue_vals, dtype=np.float64) / 1e9,  # Convert to billions
+        name='Revenue',
+        marker_color='#a371f7',
+        yaxis='y',
+        hovertemplate='<b>%{x}</b><br>Revenue: $%{y:.2f}B<extra></extra>'
+    ))
+
+    # Line chart for EBITDA Margin (right Y-axis)
+    if len(ebitda_margins) > 0:
+        fig_profit.add_trace(go.Scatter(
+            x=dates_margin,
+            y=ebitda_margins,
+            name='EBITDA Margin',
+            mode='lines+markers',
+            line=dict(color='#FF9800', width=3),
+            marker=dict(size=8, color='#FF9800'),
+            yaxis='y2',
+            hovertemplate='<b>%{x}</b><br>EBITDA Margin: %{y:.1f}%<extra></extra>'
+        ))
+
+    fig_profit.update_layout(
+        yaxis=dict(title='Revenue ($B)', side='left', color='#a371f7'),
+        yaxis2=dict(title='EBITDA Margin (%)', side='right', overlaying='y', color='#FF9800'),
+        hovermode='x unified',
+        height=280,
+        margin=dict(l=50, r=50, t=20, b=40),
+        showlegend=True,
+        legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+    )
+
+    apply_dark_theme(fig_profit)
+    return fig_profit
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def build_coverage_figure(
+    bond_ticker: str,
+    dates_cov: Tuple[str, ...],
+    coverage_vals: Tuple[float, ...],
+) -> go.Figure:
+    """Interest coverage bars colored by safety threshold."""
+    fig_coverage = go.Figure()
+
+    # Color bars based on coverage level (branchless selection over the whole series)
+    coverage_arr = np.asarray(coverage_vals, dtype=np.float64)
+    colors = np.select(
+        [coverage_arr >= 3, coverage_arr >= 1.5],
+        ['#3fb950', '#d29922'],
+        default='#f85149',
+    ).tolist()
+
+    fig_coverage.add_trace(go.Bar(
+        x=dates_cov,
+        y=coverage_vals,
+        name='Interest Coverage',
+        marker_color=colors,
+        hovertemplate='<b>%{x}</b><br>Coverage: %{y:.1f}x<extra></extra>'
+    ))
+
+    # Add threshold lines
+    if len(dates_cov) > 0:
+        fig_coverage.add_hline(y=3.0, line_dash="dash", line_color="#3fb950", line_width=1, annotation_text="Safe (3x)")
+        fig_coverage.add_hline(y=1.5, line_dash="dash", line_color="#d29922", line_width=1, annotation_text="Warning (1.5x)")
+
+    fig_coverage.update_layout(
+        yaxis_title='Coverage Ratio (x)',
+        hovermode='x unified',
+        height=280,
+        margin=dict(l=50, r=20, t=20, b=40),
+        showlegend=False
+    )
+
+    apply_dark_theme(fig_coverage)
+    return fig_coverage
+
+
 # ============================================
 # MAIN APPLICATION
 # ============================================
@@ -819,6 +1289,9 @@ def main():
         st.session_state.df = None
     if "analyzer" not in st.session_state:
         st.session_state.analyzer = None
+    if "filtered_analyzer" not in st.session_state:
+        st.session_state.filtered_analyzer = None
+        st.session_state.filtered_analyzer_key = None
     if "mobile_view" not in st.session_state:
         st.session_state.mobile_view = False
     if "model_type" not in st.session_state:
@@ -831,6 +1304,15 @@ def main():
         st.session_state.financial_loader = None
     if "fundamentals_loaded" not in st.session_state:
         st.session_state.fundamentals_loaded = False
+    if "fund_cache" not in st.session_state:
+        st.session_state.fund_cache = {}
+    if "latest_metrics" not in st.session_state:
+        st.session_state.latest_metrics = None
+        st.session_state.latest_metrics_key = None
+    if "executive_summary" not in st.session_state:
+        st.session_state.executive_summary = None
+    if "available_sectors" not in st.session_state:
+        st.session_state.available_sectors = ()
 
     # Initialize dynamic sector color map in session state
     if "sector_color_map" not in st.session_state:
@@ -902,7 +1384,7 @@ def main():
             )
 
             if st.session_state.data_loaded and st.session_state.df is not None:
-                available_sectors = sorted(st.session_state.df["Sector_L1"].unique())
+                available_sectors = list(st.session_state.available_sectors)
                 selected_sectors = st.multiselect(
                     f"{LABELS['sector']}",
                     options=available_sectors,
@@ -938,7 +1420,7 @@ def main():
 
     if uploaded_file or use_sample:
         try:
-            loader = DataLoader()
+            loader = DataLoader(cache_dir=DATA_CACHE_DIR)
 
             if uploaded_file:
                 df = loader.load_from_upload(uploaded_file)
@@ -956,6 +1438,8 @@ def main():
             analyzer.fit_sector_curves()
 
             st.session_state.df = df
+            # Sector_L1 is categorical after loading, so its sorted categories are the sector list
+            st.session_state.available_sectors = tuple(df["Sector_L1"].cat.categories)
             st.session_state.analyzer = analyzer
             st.session_state.data_loaded = True
             st.session_state.quality_report = loader.get_quality_report()
@@ -975,10 +1459,13 @@ def main():
     # Load financial fundamentals data (one-time load)
     if not st.session_state.fundamentals_loaded:
         try:
-            financial_loader = FinancialDataLoader()
+            financial_loader = FinancialDataLoader(cache_dir=DATA_CACHE_DIR)
             if financial_loader.load_data():
                 st.session_state.financial_loader = financial_loader
                 st.session_state.fundamentals_loaded = True
+                st.session_state.fund_cache = {}
+                st.session_state.latest_metrics = financial_loader.load_latest_metrics()
+                st.session_state.latest_metrics_key = frame_content_key(st.session_state.latest_metrics)
                 coverage_stats = financial_loader.get_coverage_stats()
                 logger.info(
                     f"Loaded fundamentals for {coverage_stats['bonds_with_fundamentals']} "
@@ -998,9 +1485,20 @@ def main():
         min_liquidity=min_liquidity,
     )
 
-    # Re-fit curves on filtered data with selected model
-    filtered_analyzer = PortfolioAnalyzer(df_filtered, model_type=st.session_state.model_type)
-    filtered_analyzer.fit_sector_curves()
+    # Re-fit curves on filtered data with selected model (reused across reruns in this session)
+    filtered_analyzer = build_filtered_analyzer(df_filtered, st.session_state.model_type)
+    if filtered_analyzer is not st.session_state.filtered_analyzer:
+        st.session_state.executive_summary = None  # Generated from the previous fit
+    st.session_state.filtered_analyzer = filtered_analyzer
+
+    # Per-row sector colors, resolved once per category rather than once per row
+    sector_row_colors = df_filtered["Sector_L1"].map({
+        sector: get_sector_color(sector, st.session_state.sector_color_map)
+        for sector in df_filtered["Sector_L1"].unique()
+    })
+
+    # Per-row hover text for the issuer and sibling charts (cached per filter state)
+    bond_hover = build_bond_hover(df_filtered)
 
     # ============================================
     # KPI METRICS ROW
@@ -1069,18 +1567,25 @@ def main():
 
         # ISSUER SELECTION (Changed to Equity Ticker - Name format)
         # ============================================
-        issuer_select_col1, issuer_select_col2 = st.columns([3, 1])
+        financial_loader = st.session_state.financial_loader
+        if financial_loader is None or financial_loader.bond_equity_map is None:
+            # Nothing to select without the bond-equity map: skip the selector layout entirely
+            st.warning("Financial data not loaded. Please check data files.")
+            st.warning("财务数据未加载，请检查数据文件。")
+            selected_issuer_display = ""
+        else:
+            issuer_select_col1, issuer_select_col2 = st.columns([3, 1])
 
-        with issuer_select_col1:
-            # Get unique issuers from bond_equity_map (Equity Ticker - Name format)
-            if st.session_state.financial_loader is not None and st.session_state.financial_loader.bond_equity_map is not None:
-                bond_equity_map = st.session_state.financial_loader.bond_equity_map
+            with issuer_select_col1:
+                # Get unique issuers from bond_equity_map (Equity Ticker - Name format)
+                bond_equity_map = financial_loader.bond_equity_map
 
                 # Get unique issuers with their equity tickers
                 unique_issuers = bond_equity_map[['Equity_Ticker', 'Issuer_Name', 'Bond_Ticker']].drop_duplicates(subset=['Equity_Ticker'])
 
                 # Filter to only issuers whose bonds are in the portfolio
-                portfolio_bond_tickers = df_filtered['Ticker'].str.split().str[0].unique()
+                portfolio_ticker_roots = df_filtered['Ticker_Root'].to_numpy()
+                portfolio_bond_tickers = pd.unique(portfolio_ticker_roots)
                 available_issuers = unique_issuers[unique_issuers['Bond_Ticker'].isin(portfolio_bond_tickers)].copy()
 
                 # Filter out rows with missing Equity_Ticker or Issuer_Name
@@ -1089,7 +1594,8 @@ def main():
                 # Create display names: "AAPL - Apple Inc"
                 if len(available_issuers) > 0:
                     available_issuers['Display_Name'] = available_issuers['Equity_Ticker'].astype(str) + " - " + available_issuers['Issuer_Name'].astype(str)
-                    issuer_options = sorted(available_issuers['Display_Name'].unique())
+                    # np.unique hashes and sorts in one C call
+                    issuer_options = np.unique(available_issuers['Display_Name'].to_numpy()).tolist()
                 else:
                     issuer_options = []
                     st.info("No issuers with financial data found in current portfolio.")
@@ -1102,25 +1608,21 @@ def main():
                     key="issuer_360_selector",
                     disabled=(len(issuer_options) == 0)
                 )
-            else:
-                st.warning("Financial data not loaded. Please check data files.")
-                st.warning("财务数据未加载，请检查数据文件。")
-                selected_issuer_display = ""
 
-        with issuer_select_col2:
-            st.markdown("**Quick Stats / 快速统计**")
-            if selected_issuer_display:
-                # Extract equity ticker from display name (format: "AAPL - Apple Inc")
-                selected_equity_ticker = selected_issuer_display.split(" - ")[0]
+            with issuer_select_col2:
+                st.markdown("**Quick Stats / 快速统计**")
+                if selected_issuer_display:
+                    # Extract equity ticker from display name (format: "AAPL - Apple Inc")
+                    selected_equity_ticker = selected_issuer_display.split(" - ")[0]
 
-                # Get bond ticker for this equity ticker
-                selected_issuer_row = available_issuers[available_issuers['Equity_Ticker'] == selected_equity_ticker].iloc[0]
-                selected_bond_ticker = selected_issuer_row['Bond_Ticker']
+                    # Get bond ticker for this equity ticker
+                    selected_issuer_row = available_issuers[available_issuers['Equity_Ticker'] == selected_equity_ticker].iloc[0]
+                    selected_bond_ticker = selected_issuer_row['Bond_Ticker']
 
-                # Find all bonds from this issuer
-                issuer_bonds = df_filtered[df_filtered["Ticker"].str.startswith(selected_bond_ticker)]
-                st.metric("Bonds in Portfolio / 组合中债券数", len(issuer_bonds))
-                st.metric("Total Exposure / 总敞口", format_currency(issuer_bonds['Nominal_USD'].sum()))
+                    # Find all bonds from this issuer (computed once, reused by every section below)
+                    issuer_bonds = df_filtered[portfolio_ticker_roots == selected_bond_ticker]
+                    st.metric("Bonds in Portfolio / 组合中债券数", len(issuer_bonds))
+                    st.metric("Total Exposure / 总敞口", format_currency(issuer_bonds['Nominal_USD'].sum()))
 
         if selected_issuer_display and selected_issuer_display != "":
             # Extract issuer info
@@ -1130,9 +1632,8 @@ def main():
             selected_bond_ticker = selected_issuer_row['Bond_Ticker']
 
             # Get issuer sector from first bond
-            issuer_bonds_all = df_filtered[df_filtered["Ticker"].str.startswith(selected_bond_ticker)]
-            if len(issuer_bonds_all) > 0:
-                issuer_sector = issuer_bonds_all.iloc[0]['Sector_L1']
+            if len(issuer_bonds) > 0:
+                issuer_sector = issuer_bonds.iloc[0]['Sector_L1']
             else:
                 issuer_sector = None
 
@@ -1147,9 +1648,9 @@ def main():
 
             # Get fundamentals for quantamental analysis
             if st.session_state.financial_loader is not None:
-                fundamentals = st.session_state.financial_loader.get_issuer_fundamentals(selected_bond_ticker)
+                fundamentals = get_cached_fundamentals(selected_bond_ticker)
 
-                if fundamentals is not None and len(issuer_bonds_all) > 0:
+                if fundamentals is not None and len(issuer_bonds) > 0:
                     latest = fundamentals.latest_quarter
 
                     if latest is not None:
@@ -1161,33 +1662,26 @@ def main():
                             st.markdown("*How much spread am I paid per turn of leverage?*")
                             st.markdown("*每单位杠杆获得多少利差？*")
 
-                            # Calculate LAC for each bond
-                            lac_data = []
-                            for idx, bond in issuer_bonds_all.iterrows():
-                                if latest.net_leverage and latest.net_leverage > 0:
-                                    lac = bond['OAS'] / latest.net_leverage  # OAS in bps / Leverage (x)
-                                    lac_data.append({
-                                        'Bond': bond['Ticker'],
-                                        'OAS (bps)': bond['OAS'],
-                                        'Net Leverage (x)': latest.net_leverage,
-                                        'LAC (bps/x)': lac
-                                    })
-
-                            if lac_data:
-                                lac_df = pd.DataFrame(lac_data)
+                            # Calculate LAC for each bond as whole-column operations
+                            has_lac = bool(latest.net_leverage and latest.net_leverage > 0) and len(issuer_bonds) > 0
+
+                            if has_lac:
+                                issuer_oas = issuer_bonds['OAS'].to_numpy()
+                                lac_df = pd.DataFrame({
+                                    'Bond': issuer_bonds['Ticker'].to_numpy(),
+                                    'OAS (bps)': issuer_oas,
+                                    'Net Leverage (x)': latest.net_leverage,
+                                    'LAC (bps/x)': issuer_oas / latest.net_leverage,  # OAS in bps / Leverage (x)
+                                })
 
                                 # Calculate sector average LAC
                                 sector_bonds = df_filtered[df_filtered['Sector_L1'] == issuer_sector]
-                                sector_lac_values = []
-                                for _, sb in sector_bonds.iterrows():
-                                    sb_ticker = sb['Ticker'].split()[0]
-                                    sb_fundamentals = st.session_state.financial_loader.get_issuer_fundamentals(sb_ticker)
-                                    if sb_fundamentals and sb_fundamentals.latest_quarter and sb_fundamentals.latest_quarter.net_leverage:
-                                        if sb_fundamentals.latest_quarter.net_leverage > 0:
-                                            sector_lac = sb['OAS'] / sb_fundamentals.latest_quarter.net_leverage
-                                            sector_lac_values.append(sector_lac)
-
-                                sector_avg_lac = np.mean(sector_lac_values) if sector_lac_values else None
+                                sector_avg_lac = compute_sector_avg_lac(
+                                    tuple(sector_bonds['Ticker_Root']),
+                                    tuple(sector_bonds['OAS']),
+                                    st.session_state.latest_metrics_key,
+                                    st.session_state.latest_metrics,
+                                )
 
                                 # Display LAC metrics
                                 lac_metric_col1, lac_metric_col2, lac_metric_col3 = st.columns(3)
@@ -1255,48 +1749,17 @@ def main():
 
                             # Calculate Fundamental Health Score
                             # Normalize: Net Leverage (lower is better), Interest Coverage (higher is better), EBITDA Margin (higher is better)
-                            health_components = []
-
-                            # Component 1: Leverage Score (inverse, normalized 0-100)
-                            if latest.net_leverage and latest.net_leverage > 0:
-                                lev_score = max(0, 100 - (latest.net_leverage * 10))  # Lower leverage = higher score
-                                health_components.append(lev_score)
-
-                            # Component 2: Interest Coverage Score (normalized 0-100)
-                            if latest.interest_coverage:
-                                cov_score = min(100, latest.interest_coverage * 20)  # Higher coverage = higher score
-                                health_components.append(cov_score)
-
-                            # Component 3: EBITDA Margin Score (normalized 0-100)
-                            if latest.revenue > 0 and latest.ebitda > 0:
-                                margin = (latest.ebitda / latest.revenue) * 100
-                                margin_score = min(100, margin * 2)  # Higher margin = higher score
-                                health_components.append(margin_score)
-
-                            health_score = np.mean(health_components) if health_components else None
+                            health_score, health_component_count = calculate_health_score(latest)
 
                             # Get Valuation Z-Score (average across all bonds)
-                            avg_z_score = issuer_bonds_all['Z_Score'].mean()
+                            avg_z_score = issuer_bonds['Z_Score'].mean()
 
                             # Display quadrant position
                             if health_score is not None and not pd.isna(avg_z_score):
                                 # Determine quadrant
-                                if health_score >= 50 and avg_z_score >= 0.5:
-                                    quadrant = "🟢 Deep Value / 黄金坑"
-                                    quadrant_desc = "Good Fundamentals + Cheap Pricing"
-                                    quadrant_accent = "green"
-                                elif health_score < 50 and avg_z_score < -0.5:
-                                    quadrant = "🔴 Value Trap / 价值陷阱"
-                                    quadrant_desc = "Poor Fundamentals + Rich Pricing"
-                                    quadrant_accent = "red"
-                                elif health_score >= 50 and avg_z_score < -0.5:
-                                    quadrant = "🟡 Quality Rich / 优质偏贵"
-                                    quadrant_desc = "Good Fundamentals but Expensive"
-                                    quadrant_accent = "yellow"
-                                else:
-                                    quadrant = "🟠 Distressed Cheap / 困境便宜"
-                                    quadrant_desc = "Poor Fundamentals but Cheap"
-                                    quadrant_accent = "orange"
+                                quadrant, quadrant_desc, quadrant_accent, _, _ = classify_mispricing_quadrant(
+                                    health_score, avg_z_score
+                                )
 
                                 st.markdown(render_metric_card(
                                     "Quadrant / 象限",
@@ -1309,7 +1772,7 @@ def main():
                                 st.markdown(render_metric_card(
                                     "Health Score / 健康分数",
                                     f"{health_score:.0f}/100",
-                                    f"Components: {len(health_components)}",
+                                    f"Components: {health_component_count}",
                                     "neutral",
                                     "blue"
                                 ), unsafe_allow_html=True)
@@ -1346,32 +1809,14 @@ def main():
             curve_col1, curve_col2 = st.columns([3, 1])
 
             with curve_col1:
-                # Create scatter + line chart
-                fig_issuer_curve = go.Figure()
-
-                # Get all bonds from this issuer
-                issuer_bonds = df_filtered[df_filtered["Ticker"].str.startswith(selected_bond_ticker)]
+                # Collect scatter + line traces, then build the figure once
+                issuer_curve_traces = []
 
                 if len(issuer_bonds) > 0:
                     # Plot issuer bonds as gold scatter points
-                    hover_text_issuer = issuer_bonds.apply(
-                        lambda row: (
-                            f"<b>{row['Ticker']}</b><br>"
-                            f"名称: {row.get('Name', 'N/A')}<br>"
-                            f"━━━━━━━━━━━━<br>"
-                            f"YTM: {row['Yield']*100:.2f}%<br>"
-                            f"Duration: {row['Duration']:.2f}y<br>"
-                            f"OAS: {row['OAS']:.0f}bp<br>"
-                            f"Z-Score: {row['Z_Score']:.2f}<br>"
-                            f"━━━━━━━━━━━━<br>"
-                            f"Notional: {format_currency(row['Nominal_USD'])}"
-                        ),
-                        axis=1,
-                    )
-
                     sizes_issuer = np.clip(issuer_bonds["Nominal_USD"] / 1e6, 8, 30)
 
-                    fig_issuer_curve.add_trace(go.Scatter(
+                    issuer_curve_traces.append(go.Scatter(
                         x=issuer_bonds["Duration"],
                         y=issuer_bonds["Yield"] * 100,
                         mode="markers",
@@ -1384,13 +1829,12 @@ def main():
                             symbol="diamond"
                         ),
                         hovertemplate="%{hovertext}<extra></extra>",
-                        hovertext=hover_text_issuer,
+                        hovertext=bond_hover.loc[issuer_bonds.index].to_numpy(),
                     ))
 
                     # Line 1: Issuer Curve (if more than 2 bonds)
                     if len(issuer_bonds) >= 3:
                         try:
-                            from scipy.interpolate import interp1d
                             x_issuer = issuer_bonds["Duration"].values
                             y_issuer = issuer_bonds["Yield"].values
 
@@ -1399,12 +1843,11 @@ def main():
                             x_issuer = x_issuer[sort_idx]
                             y_issuer = y_issuer[sort_idx]
 
-                            # Linear interpolation
-                            f_issuer = interp1d(x_issuer, y_issuer, kind='linear', fill_value='extrapolate')
-                            x_curve_issuer = np.linspace(x_issuer.min(), x_issuer.max(), 50)
-                            y_curve_issuer = f_issuer(x_curve_issuer)
+                            # Linear interpolation (grid stays inside the data range, so no extrapolation)
+                            x_curve_issuer = np.linspace(x_issuer[0], x_issuer[-1], 50)
+                            y_curve_issuer = np.interp(x_curve_issuer, x_issuer, y_issuer)
 
-                            fig_issuer_curve.add_trace(go.Scatter(
+                            issuer_curve_traces.append(go.Scatter(
                                 x=x_curve_issuer,
                                 y=y_curve_issuer * 100,
                                 mode="lines",
@@ -1421,7 +1864,7 @@ def main():
                             x_sector, y_sector = filtered_analyzer.get_curve_points(issuer_sector, n_points=50)
                             sector_color = get_sector_color(issuer_sector, st.session_state.sector_color_map)
 
-                            fig_issuer_curve.add_trace(go.Scatter(
+                            issuer_curve_traces.append(go.Scatter(
                                 x=x_sector,
                                 y=y_sector * 100,
                                 mode="lines",
@@ -1432,6 +1875,7 @@ def main():
                         except Exception as e:
                             logger.warning(f"Could not get sector curve: {e}")
 
+                    fig_issuer_curve = go.Figure(data=issuer_curve_traces)
                     apply_dark_theme(
                         fig_issuer_curve,
                         xaxis_title="Duration / 久期 (Years)",
@@ -1478,9 +1922,11 @@ def main():
 
                     st.markdown("---")
                     st.markdown("**Portfolio Holdings / 组合持仓**")
+                    issuer_nominal = issuer_bonds['Nominal_USD'].to_numpy(dtype=np.float64)
+                    issuer_aum = issuer_nominal.sum()
                     st.metric("Total Bonds / 债券总数", len(issuer_bonds))
-                    st.metric("Weighted Duration / 加权久期", f"{(issuer_bonds['Duration'] * issuer_bonds['Nominal_USD']).sum() / issuer_bonds['Nominal_USD'].sum():.2f}y")
-                    st.metric("Weighted YTM / 加权收益率", f"{(issuer_bonds['Yield'] * issuer_bonds['Nominal_USD']).sum() / issuer_bonds['Nominal_USD'].sum() * 100:.2f}%")
+                    st.metric("Weighted Duration / 加权久期", f"{issuer_bonds['Duration'].to_numpy(dtype=np.float64) @ issuer_nominal / issuer_aum:.2f}y")
+                    st.metric("Weighted YTM / 加权收益率", f"{issuer_bonds['Yield'].to_numpy(dtype=np.float64) @ issuer_nominal / issuer_aum * 100:.2f}%")
 
             st.markdown("---")
 
@@ -1493,13 +1939,20 @@ def main():
 
             # Get fundamentals for this issuer
             if st.session_state.financial_loader is not None:
-                fundamentals = st.session_state.financial_loader.get_issuer_fundamentals(selected_bond_ticker)
+                fundamentals = get_cached_fundamentals(selected_bond_ticker)
 
                 if fundamentals is not None:
                     # Get last 8 quarters
                     quarters = fundamentals.last_8_quarters
 
                     if len(quarters) > 0:
+                        # One pass over the quarters; each chart slices its columns
+                        trend_frame = fundamentals.get_trend_frame()
+
+                        def trend_series(metric_name: str) -> Tuple[list, list]:
+                            series = trend_frame[metric_name].dropna()
+                            return series.index.tolist(), series.tolist()
+
                         # Create 2x2 grid
                         fin_row1_col1, fin_row1_col2 = st.columns(2)
                         fin_row2_col1, fin_row2_col2 = st.columns(2)
@@ -1508,176 +1961,60 @@ def main():
                         with fin_row1_col1:
                             st.markdown("**📉 Deleveraging / 去杠杆**")
 
-                            dates, liabilities_vals = fundamentals.get_trend_series('total_liabilities')
-                            _, leverage_vals = fundamentals.get_trend_series('net_leverage')
+                            dates, liabilities_vals = trend_series('total_liabilities')
+                            dates_lev, leverage_vals = trend_series('net_leverage')
 
-                            fig_delever = go.Figure()
-
-                            # Bar chart for Total Liabilities
-                            fig_delever.add_trace(go.Bar(
-                                x=dates,
-                                y=[v/1e9 for v in liabilities_vals],  # Convert to billions
-                                name='Total Liabilities',
-                                marker_color='#58a6ff',
-                                yaxis='y',
-                                hovertemplate='<b>%{x}</b><br>Total Liabilities: $%{y:.2f}B<extra></extra>'
-                            ))
-
-                            # Line chart for Net Leverage (right axis)
-                            if len(leverage_vals) > 0:
-                                fig_delever.add_trace(go.Scatter(
-                                    x=dates[-len(leverage_vals):],
-                                    y=leverage_vals,
-                                    name='Net Leverage',
-                                    mode='lines+markers',
-                                    line=dict(color='#f85149', width=3),
-                                    marker=dict(size=8, color='#f85149'),
-                                    yaxis='y2',
-                                    hovertemplate='<b>%{x}</b><br>Net Leverage: %{y:.2f}x<extra></extra>'
-                                ))
-
-                            fig_delever.update_layout(
-                                yaxis=dict(title='Total Liabilities ($B)', side='left', color='#58a6ff'),
-                                yaxis2=dict(title='Net Leverage (x)', side='right', overlaying='y', color='#f85149'),
-                                hovermode='x unified',
-                                height=280,
-                                margin=dict(l=50, r=50, t=20, b=40),
-                                showlegend=True,
-                                legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+                            fig_delever = build_delever_figure(
+                                selected_bond_ticker,
+                                tuple(dates), tuple(liabilities_vals),
+                                tuple(dates_lev), tuple(leverage_vals),
                             )
-
-                            apply_dark_theme(fig_delever)
                             st.plotly_chart(fig_delever, use_container_width=True)
 
                         # CHART 2: Liquidity (Stacked Area: Cash vs. Net Interest Expense)
                         with fin_row1_col2:
                             st.markdown("**💰 Liquidity / 流动性**")
 
-                            _, cash_vals = fundamentals.get_trend_series('cash')
-                            _, int_exp_vals = fundamentals.get_trend_series('net_int_exp')
-
-                            fig_liquidity = go.Figure()
-
-                            # Stacked area for Cash
-                            fig_liquidity.add_trace(go.Scatter(
-                                x=dates[-len(cash_vals):] if len(cash_vals) > 0 else [],
-                                y=[v/1e9 for v in cash_vals] if len(cash_vals) > 0 else [],
-                                name='Cash',
-                                mode='lines',
-                                fill='tozeroy',
-                                line=dict(color='#3fb950', width=2),
-                                hovertemplate='<b>%{x}</b><br>Cash: $%{y:.2f}B<extra></extra>'
-                            ))
-
-                            # Stacked area for Net Interest Expense
-                            fig_liquidity.add_trace(go.Scatter(
-                                x=dates[-len(int_exp_vals):] if len(int_exp_vals) > 0 else [],
-                                y=[abs(v)/1e9 for v in int_exp_vals] if len(int_exp_vals) > 0 else [],
-                                name='Net Int Exp',
-                                mode='lines',
-                                fill='tonexty',
-                                line=dict(color='#f85149', width=2),
-                                hovertemplate='<b>%{x}</b><br>Net Int Exp: $%{y:.2f}B<extra></extra>'
-                            ))
+                            dates_cash, cash_vals = trend_series('cash')
+                            dates_int, int_exp_vals = trend_series('net_int_exp')
 
-                            fig_liquidity.update_layout(
-                                yaxis_title='Amount ($B)',
-                                hovermode='x unified',
-                                height=280,
-                                margin=dict(l=50, r=20, t=20, b=40),
-                                showlegend=True,
-                                legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+                            fig_liquidity = build_liquidity_figure(
+                                selected_bond_ticker,
+                                tuple(dates_cash), tuple(cash_vals),
+                                tuple(dates_int), tuple(int_exp_vals),
                             )
-
-                            apply_dark_theme(fig_liquidity)
                             st.plotly_chart(fig_liquidity, use_container_width=True)
 
                         # CHART 3: Profitability (DUAL Y-AXIS FIX: Revenue + EBITDA Margin)
                         with fin_row2_col1:
                             st.markdown("**📊 Profitability / 盈利能力**")
 
-                            dates_rev, revenue_vals = fundamentals.get_trend_series('revenue')
-
-                            # Calculate EBITDA margin for each quarter
-                            ebitda_margins = []
-                            dates_margin = []
-                            for q in quarters:
-                                if q.revenue > 0 and q.ebitda > 0:
-                                    margin = (q.ebitda / q.revenue) * 100
-                                    ebitda_margins.append(margin)
-                                    dates_margin.append(f"{q.year}Q{q.quarter}")
-
-                            fig_profit = go.Figure()
-
-                            # Bar chart for Revenue (left Y-axis)
-                            fig_profit.add_trace(go.Bar(
-                                x=dates_rev,
-                                y=[v/1e9 for v in revenue_vals],  # Convert to billions
-                                name='Revenue',
-                                marker_color='#a371f7',
-                                yaxis='y',
-                                hovertemplate='<b>%{x}</b><br>Revenue: $%{y:.2f}B<extra></extra>'
-                            ))
+                            dates_rev, revenue_vals = trend_series('revenue')
 
-                            # Line chart for EBITDA Margin (right Y-axis)
-                            if len(ebitda_margins) > 0:
-                                fig_profit.add_trace(go.Scatter(
-                                    x=dates_margin,
-                                    y=ebitda_margins,
-                                    name='EBITDA Margin',
-                                    mode='lines+markers',
-                                    line=dict(color='#FF9800', width=3),
-                                    marker=dict(size=8, color='#FF9800'),
-                                    yaxis='y2',
-                                    hovertemplate='<b>%{x}</b><br>EBITDA Margin: %{y:.1f}%<extra></extra>'
-                                ))
+                            # Calculate EBITDA margin for all quarters in one vectorized pass
+                            rev_arr = trend_frame['revenue'].to_numpy()
+                            ebitda_arr = trend_frame['ebitda'].to_numpy()
+                            margin_valid = (rev_arr > 0) & (ebitda_arr > 0)
+                            ebitda_margins = ebitda_arr[margin_valid] / rev_arr[margin_valid] * 100
+                            dates_margin = trend_frame.index[margin_valid].tolist()
 
-                            fig_profit.update_layout(
-                                yaxis=dict(title='Revenue ($B)', side='left', color='#a371f7'),
-                                yaxis2=dict(title='EBITDA Margin (%)', side='right', overlaying='y', color='#FF9800'),
-                                hovermode='x unified',
-                                height=280,
-                                margin=dict(l=50, r=50, t=20, b=40),
-                                showlegend=True,
-                                legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5)
+                            fig_profit = build_profit_figure(
+                                selected_bond_ticker,
+                                tuple(dates_rev), tuple(revenue_vals),
+                                tuple(dates_margin), tuple(ebitda_margins.tolist()),
                             )
-
-                            apply_dark_theme(fig_profit)
                             st.plotly_chart(fig_profit, use_container_width=True)
 
                         # CHART 4: Interest Coverage
                         with fin_row2_col2:
                             st.markdown("**🛡️ Interest Coverage / 利息覆盖**")
 
-                            dates_cov, coverage_vals = fundamentals.get_trend_series('interest_coverage')
-
-                            fig_coverage = go.Figure()
-
-                            # Color bars based on coverage level
-                            colors = ['#3fb950' if c >= 3 else '#d29922' if c >= 1.5 else '#f85149' for c in coverage_vals]
-
-                            fig_coverage.add_trace(go.Bar(
-                                x=dates_cov,
-                                y=coverage_vals,
-                                name='Interest Coverage',
-                                marker_color=colors,
-                                hovertemplate='<b>%{x}</b><br>Coverage: %{y:.1f}x<extra></extra>'
-                            ))
+                            dates_cov, coverage_vals = trend_series('interest_coverage')
 
-                            # Add threshold lines
-                            if len(dates_cov) > 0:
-                                fig_coverage.add_hline(y=3.0, line_dash="dash", line_color="#3fb950", line_width=1, annotation_text="Safe (3x)")
-                                fig_coverage.add_hline(y=1.5, line_dash="dash", line_color="#d29922", line_width=1, annotation_text="Warning (1.5x)")
-
-                            fig_coverage.update_layout(
-                                yaxis_title='Coverage Ratio (x)',
-                                hovermode='x unified',
-                                height=280,
-                                margin=dict(l=50, r=20, t=20, b=40),
-                                showlegend=False
+                            fig_coverage = build_coverage_figure(
+                                selected_bond_ticker,
+                                tuple(dates_cov), tuple(coverage_vals),
                             )
-
-                            apply_dark_theme(fig_coverage)
                             st.plotly_chart(fig_coverage, use_container_width=True)
 
                     else:
@@ -1792,22 +2129,7 @@ def main():
                     # Calculate health score and quadrant
                     if fundamentals and fundamentals.latest_quarter:
                         latest = fundamentals.latest_quarter
-                        health_components = []
-
-                        if latest.net_leverage and latest.net_leverage > 0:
-                            lev_score = max(0, 100 - (latest.net_leverage * 10))
-                            health_components.append(lev_score)
-
-                        if latest.interest_coverage:
-                            cov_score = min(100, latest.interest_coverage * 20)
-                            health_components.append(cov_score)
-
-                        if latest.revenue > 0 and latest.ebitda > 0:
-                            margin = (latest.ebitda / latest.revenue) * 100
-                            margin_score = min(100, margin * 2)
-                            health_components.append(margin_score)
-
-                        health_score = np.mean(health_components) if health_components else None
+                        health_score, _ = calculate_health_score(latest)
 
                         if health_score is not None and not pd.isna(avg_z):
                             memo_lines.append(f"- **Fundamental Health Score:** {health_score:.0f}/100")
@@ -1815,18 +2137,9 @@ def main():
                             memo_lines.append("")
 
                             # Determine recommendation
-                            if health_score >= 50 and avg_z >= 0.5:
-                                memo_lines.append("### Recommendation: **BUY** 🟢")
-                                memo_lines.append("**Rationale:** Deep Value opportunity - Strong fundamentals trading at cheap valuations (黄金坑)")
-                            elif health_score < 50 and avg_z < -0.5:
-                                memo_lines.append("### Recommendation: **SELL** 🔴")
-                                memo_lines.append("**Rationale:** Value Trap - Weak fundamentals trading at rich valuations (价值陷阱)")
-                            elif health_score >= 50 and avg_z < -0.5:
-                                memo_lines.append("### Recommendation: **HOLD/TRIM** 🟡")
-                                memo_lines.append("**Rationale:** Quality company but expensive - Consider taking profits")
-                            else:
-                                memo_lines.append("### Recommendation: **OPPORTUNISTIC BUY** 🟠")
-                                memo_lines.append("**Rationale:** Distressed but cheap - Monitor for turnaround")
+                            _, _, _, recommendation, rationale = classify_mispricing_quadrant(health_score, avg_z)
+                            memo_lines.append(f"### Recommendation: {recommendation}")
+                            memo_lines.append(f"**Rationale:** {rationale}")
                         else:
                             memo_lines.append("- **Insufficient data for quantamental verdict**")
                     else:
@@ -1871,9 +2184,44 @@ def main():
         # Get selected ticker from session state
         highlighted_ticker = st.session_state.get("selected_ticker", None)
 
+        # Partition once by sector (observed=True skips empty categories) and pull
+        # columnar arrays once; each sector trace is a positional take, not a mask copy
+        matrix_positions = df_filtered.groupby("Sector_L1", observed=True, sort=False).indices
+        matrix_tickers = df_filtered["Ticker"].to_numpy()
+        matrix_duration = df_filtered["Duration"].to_numpy(dtype=np.float64)
+        matrix_yield_pct = df_filtered["Yield"].to_numpy(dtype=np.float64) * 100
+        matrix_sizes = np.clip(df_filtered["Nominal_USD"].to_numpy(dtype=np.float64) / 1e6, 5, 25)
+        matrix_names = (
+            df_filtered["Name"].fillna("N/A").to_numpy() if "Name" in df_filtered.columns
+            else np.full(len(df_filtered), "N/A")
+        )
+
+        # Hover fields ride along as customdata; numbers are formatted client-side
+        matrix_customdata = np.column_stack([
+            matrix_tickers,
+            matrix_names,
+            df_filtered["OAS"].to_numpy(dtype=np.float64),
+            df_filtered["Net_Carry"].to_numpy(dtype=np.float64) * 100,
+            df_filtered["Z_Score"].to_numpy(dtype=np.float64),
+            format_currency_vec(df_filtered["Nominal_USD"]),
+        ]).astype(object)
+        matrix_hovertemplate = (
+            "<b>%{customdata[0]}</b><br>"
+            "名称: %{customdata[1]}<br>"
+            "━━━━━━━━━━━━<br>"
+            "YTM / 收益率: %{y:.2f}%<br>"
+            "Duration / 久期: %{x:.2f}y<br>"
+            "OAS / 利差: %{customdata[2]:.0f}bp<br>"
+            "Net Carry / 净息差: %{customdata[3]:.2f}%<br>"
+            "Z-Score / Z分数: %{customdata[4]:.2f}<br>"
+            "━━━━━━━━━━━━<br>"
+            "Notional / 本金: %{customdata[5]}"
+            "<extra></extra>"
+        )
+
         for sector in (selected_sectors or []):
-            sector_data = df_filtered[df_filtered["Sector_L1"] == sector]
-            if len(sector_data) == 0:
+            sector_idx = matrix_positions.get(sector)
+            if sector_idx is None:
                 continue
 
             color = get_sector_color(sector, st.session_state.sector_color_map)
@@ -1881,44 +2229,22 @@ def main():
 
             # Split data into selected and non-selected
             if highlighted_ticker:
-                non_selected = sector_data[sector_data["Ticker"] != highlighted_ticker]
-            else:
-                non_selected = sector_data
-
-            # Create bilingual hover text for non-selected
-            hover_text = non_selected.apply(
-                lambda row: (
-                    f"<b>{row['Ticker']}</b><br>"
-                    f"名称: {row.get('Name', 'N/A')}<br>"
-                    f"━━━━━━━━━━━━<br>"
-                    f"YTM / 收益率: {row['Yield']*100:.2f}%<br>"
-                    f"Duration / 久期: {row['Duration']:.2f}y<br>"
-                    f"OAS / 利差: {row['OAS']:.0f}bp<br>"
-                    f"Net Carry / 净息差: {row['Net_Carry']*100:.2f}%<br>"
-                    f"Z-Score / Z分数: {row['Z_Score']:.2f}<br>"
-                    f"━━━━━━━━━━━━<br>"
-                    f"Notional / 本金: {format_currency(row['Nominal_USD'])}"
-                ),
-                axis=1,
-            )
-
-            # Size based on nominal (normalized)
-            sizes = np.clip(non_selected["Nominal_USD"] / 1e6, 5, 25)
+                sector_idx = sector_idx[matrix_tickers[sector_idx] != highlighted_ticker]
 
-            # Add non-selected bonds
-            fig.add_trace(go.Scatter(
-                x=non_selected["Duration"],
-                y=non_selected["Yield"] * 100,
+            # Add non-selected bonds (WebGL renderer keeps large portfolios interactive)
+            fig.add_trace(go.Scattergl(
+                x=matrix_duration[sector_idx],
+                y=matrix_yield_pct[sector_idx],
                 mode="markers",
                 name=f"{sector} / {sector_cn}",
                 marker=dict(
-                    size=sizes,
+                    size=matrix_sizes[sector_idx],
                     color=color,
                     opacity=0.8,
                     line=dict(width=1, color="rgba(255,255,255,0.3)"),
                 ),
-                hovertemplate="%{hovertext}<extra></extra>",
-                hovertext=hover_text,
+                customdata=matrix_customdata[sector_idx],
+                hovertemplate=matrix_hovertemplate,
             ))
 
             # Add fitted curve
@@ -1996,35 +2322,12 @@ def main():
         with st.expander("📊 Model Stats & Parameters / 模型统计与参数"):
             regression_results = filtered_analyzer.get_regression_results()
             if regression_results:
-                stats_data = []
-                for sector, r in regression_results.items():
-                    sector_display = f"{sector} / {SECTOR_NAMES_CN.get(sector, sector)}"
-                    base_stats = {
-                        f"{LABELS['sector']}": sector_display,
-                        "R²": f"{r.r_squared:.4f}",
-                        "N": r.sample_count,
-                        "Dur Range": f"{r.duration_range[0]:.1f}-{r.duration_range[1]:.1f}",
-                        "Residual σ": f"{r.residual_std*100:.2f}%",
-                    }
-
-                    # Add model-specific parameters
-                    if st.session_state.model_type == "nelson_siegel":
-                        base_stats.update({
-                            "β₀ (Long)": f"{r.beta_0*100:.2f}%",
-                            "β₁ (Short)": f"{r.beta_1*100:.2f}%",
-                            "β₂ (Curve)": f"{r.beta_2*100:.2f}%",
-                            "λ (Decay)": f"{r.lambda_:.2f}",
-                        })
-                    else:
-                        base_stats.update({
-                            "Coeff a": f"{r.a:.6f}",
-                            "Coeff b": f"{r.b:.4f}",
-                            "Coeff c": f"{r.c:.4f}",
-                        })
-
-                    stats_data.append(base_stats)
-
-                st.dataframe(pd.DataFrame(stats_data), use_container_width=True, hide_index=True)
+                stats_df, _ = build_regression_stats(
+                    st.session_state.model_type,
+                    regression_stats_key(regression_results),
+                    regression_results,
+                )
+                st.dataframe(stats_df, use_container_width=True, hide_index=True)
 
                 # Add explanation for Nelson-Siegel parameters
                 if st.session_state.model_type == "nelson_siegel":
@@ -2299,35 +2602,26 @@ def main():
                 # Create issuer-specific curve chart
                 fig_issuer = go.Figure()
 
-                # Plot all sibling bonds
-                for idx, row in sibling_bonds.iterrows():
-                    is_selected = row["Ticker"] == selected_ticker
-                    marker_size = 20 if is_selected else 12
-                    marker_color = "#FFD700" if is_selected else get_sector_color(row["Sector_L1"], st.session_state.sector_color_map)
-                    marker_symbol = "star" if is_selected else "circle"
-
-                    hover_text = (
-                        f"<b>{row['Ticker']}</b><br>"
-                        f"YTM: {row['Yield']*100:.2f}%<br>"
-                        f"Duration: {row['Duration']:.2f}y<br>"
-                        f"OAS: {row['OAS']:.0f}bp<br>"
-                        f"Z-Score: {row['Z_Score']:.2f}"
-                    )
-
-                    fig_issuer.add_trace(go.Scatter(
-                        x=[row["Duration"]],
-                        y=[row["Yield"] * 100],
-                        mode="markers",
-                        name=row["Ticker"],
-                        marker=dict(
-                            size=marker_size,
-                            color=marker_color,
-                            symbol=marker_symbol,
-                            line=dict(width=2, color="white" if is_selected else "rgba(255,255,255,0.3)"),
+                # Plot all sibling bonds as one trace with per-point styling
+                sibling_selected = sibling_bonds["Ticker"].to_numpy() == selected_ticker
+                fig_issuer.add_trace(go.Scatter(
+                    x=sibling_bonds["Duration"],
+                    y=sibling_bonds["Yield"] * 100,
+                    mode="markers",
+                    name=f"{issuer} Bonds",
+                    marker=dict(
+                        size=np.where(sibling_selected, 20, 12),
+                        color=np.where(sibling_selected, "#FFD700", sector_row_colors[sibling_mask].to_numpy(dtype=object)),
+                        symbol=np.where(sibling_selected, "star", "circle"),
+                        line=dict(
+                            width=2,
+                            color=np.where(sibling_selected, "white", "rgba(255,255,255,0.3)"),
                         ),
-                        hovertemplate=hover_text + "<extra></extra>",
-                        showlegend=False,
-                    ))
+                    ),
+                    hovertext=bond_hover[sibling_mask].to_numpy(),
+                    hovertemplate="%{hovertext}<extra></extra>",
+                    showlegend=False,
+                ))
 
                 # Add sector curve if available
                 sector = bond_data["Sector_L1"]
@@ -2405,7 +2699,7 @@ def main():
 
                 # Get fundamental data
                 if st.session_state.financial_loader is not None:
-                    fundamentals = st.session_state.financial_loader.get_issuer_fundamentals(selected_ticker)
+                    fundamentals = get_cached_fundamentals(selected_ticker)
 
                     if fundamentals is not None:
                         latest = fundamentals.latest_quarter
@@ -2549,17 +2843,18 @@ def main():
                                         LABELS["duration"], LABELS["ytm"],
                                         LABELS["net_carry"], LABELS["z_score"], LABELS["notional"]]
 
-                    # Format values
-                    styled_df[LABELS["ytm"]] = sell_candidates["Yield"].apply(format_percentage)
-                    styled_df[LABELS["net_carry"]] = sell_candidates["Net_Carry"].apply(format_percentage)
-                    styled_df[LABELS["notional"]] = sell_candidates["Nominal_USD"].apply(format_currency)
-                    styled_df[LABELS["z_score"]] = sell_candidates["Z_Score"].round(2)
-                    styled_df[LABELS["duration"]] = sell_candidates["Duration"].round(2)
+                    # Format whole columns at once
+                    styled_df[LABELS["ytm"]] = format_percentage_vec(styled_df[LABELS["ytm"]])
+                    styled_df[LABELS["net_carry"]] = format_percentage_vec(styled_df[LABELS["net_carry"]])
+                    styled_df[LABELS["notional"]] = format_currency_vec(styled_df[LABELS["notional"]])
+                    # Z-score and duration stay numeric so header sorting is numeric
+                    styled_df[LABELS["z_score"]] = styled_df[LABELS["z_score"]].round(2)
+                    styled_df[LABELS["duration"]] = styled_df[LABELS["duration"]].round(2)
 
                     st.dataframe(styled_df, use_container_width=True, hide_index=True)
 
                 # Summary metric
-                total_exposure = sell_candidates["Nominal_USD"].sum()
+                total_exposure = sell_candidates["Nominal_USD"].to_numpy().sum()
                 st.markdown(render_metric_card(
                     "Sell Exposure / 卖出敞口",
                     format_currency(total_exposure),
@@ -2597,16 +2892,17 @@ def main():
                                         LABELS["duration"], LABELS["ytm"],
                                         LABELS["ftp"], LABELS["net_carry"], LABELS["notional"]]
 
-                    styled_df[LABELS["ytm"]] = bleeding_assets["Yield"].apply(format_percentage)
-                    styled_df[LABELS["ftp"]] = bleeding_assets["FTP"].apply(format_percentage)
-                    styled_df[LABELS["net_carry"]] = bleeding_assets["Net_Carry"].apply(format_percentage)
-                    styled_df[LABELS["notional"]] = bleeding_assets["Nominal_USD"].apply(format_currency)
-                    styled_df[LABELS["duration"]] = bleeding_assets["Duration"].round(2)
+                    styled_df[LABELS["ytm"]] = format_percentage_vec(styled_df[LABELS["ytm"]])
+                    styled_df[LABELS["ftp"]] = format_percentage_vec(styled_df[LABELS["ftp"]])
+                    styled_df[LABELS["net_carry"]] = format_percentage_vec(styled_df[LABELS["net_carry"]])
+                    styled_df[LABELS["notional"]] = format_currency_vec(styled_df[LABELS["notional"]])
+                    styled_df[LABELS["duration"]] = styled_df[LABELS["duration"]].round(2)
 
                     st.dataframe(styled_df, use_container_width=True, hide_index=True)
 
-                total_bleed = bleeding_assets["Nominal_USD"].sum()
-                annual_drag = abs((bleeding_assets["Net_Carry"] * bleeding_assets["Nominal_USD"]).sum())
+                bleed_nominal = bleeding_assets["Nominal_USD"].to_numpy()
+                total_bleed = bleed_nominal.sum()
+                annual_drag = abs(bleeding_assets["Net_Carry"].to_numpy() @ bleed_nominal)
                 st.markdown(render_metric_card(
                     "Bleeding Exposure / 失血敞口",
                     format_currency(total_bleed),
@@ -2620,22 +2916,43 @@ def main():
         # Carry Distribution Chart
         st.markdown(f'<div class="section-header">📊 {LABELS["carry_distribution"]}</div>', unsafe_allow_html=True)
 
-        fig_carry = go.Figure()
-
-        for sector in (selected_sectors or []):
-            sector_data = df_filtered[df_filtered["Sector_L1"] == sector]
-            if len(sector_data) == 0:
-                continue
-
-            color = get_sector_color(sector, st.session_state.sector_color_map)
+        carry_traces = []
+
+        # Partition once by sector instead of a boolean scan per sector
+        carry_groups = df_filtered.groupby("Sector_L1", observed=True, sort=False)
+
+        # Pre-bin server-side on shared edges so only bin counts are shipped
+        carry_values = df_filtered["Carry_Efficiency"].to_numpy(dtype=float) * 100  # Convert to bps-like
+        carry_values = carry_values[np.isfinite(carry_values)]
+        if len(carry_values) > 0:
+            carry_lo, carry_hi = carry_values.min(), carry_values.max()
+            if carry_lo == carry_hi:
+                carry_lo, carry_hi = carry_lo - 0.5, carry_hi + 0.5
+            carry_edges = np.linspace(carry_lo, carry_hi, 41)
+            carry_centers = (carry_edges[:-1] + carry_edges[1:]) / 2
+            carry_widths = np.diff(carry_edges)
+
+            for sector in (selected_sectors or []):
+                if sector not in carry_groups.groups:
+                    continue
+                sector_data = carry_groups.get_group(sector)
+
+                color = get_sector_color(sector, st.session_state.sector_color_map)
+                counts, _ = np.histogram(
+                    sector_data["Carry_Efficiency"].to_numpy(dtype=float) * 100,
+                    bins=carry_edges,
+                )
 
-            fig_carry.add_trace(go.Histogram(
-                x=sector_data["Carry_Efficiency"] * 100,  # Convert to bps-like
-                name=f"{sector} / {SECTOR_NAMES_CN.get(sector, sector)}",
-                marker_color=color,
-                opacity=0.7,
-            ))
+                carry_traces.append(go.Bar(
+                    x=carry_centers,
+                    y=counts,
+                    width=carry_widths,
+                    name=f"{sector} / {SECTOR_NAMES_CN.get(sector, sector)}",
+                    marker_color=color,
+                    opacity=0.7,
+                ))
 
+        fig_carry = go.Figure(data=carry_traces)
         fig_carry.add_vline(
             x=0,
             line_dash="dash",
@@ -2678,25 +2995,34 @@ def main():
         with brief_col1:
             st.markdown(f'<div class="section-header">📄 Executive Summary / 管理摘要</div>', unsafe_allow_html=True)
 
+            # The summary persists across reruns until the fitted analyzer changes,
+            # so repeat clicks and the download button reuse it
             if st.button(f"🔄 {LABELS['generate_summary']}", type="primary"):
-                with st.spinner(LABELS["loading"]):
-                    summary = filtered_analyzer.generate_executive_summary()
-                    st.markdown(summary)
+                if st.session_state.executive_summary is None:
+                    with st.spinner(LABELS["loading"]):
+                        st.session_state.executive_summary = filtered_analyzer.generate_executive_summary()
 
-                    st.download_button(
-                        label=f"📥 {LABELS['download_summary']}",
-                        data=summary,
-                        file_name="portfolio_summary.md",
-                        mime="text/markdown",
-                    )
+            summary = st.session_state.executive_summary
+            if summary is not None:
+                st.markdown(summary)
+
+                st.download_button(
+                    label=f"📥 {LABELS['download_summary']}",
+                    data=summary,
+                    file_name="portfolio_summary.md",
+                    mime="text/markdown",
+                )
 
         with brief_col2:
             st.markdown(f'<div class="section-header">{LABELS["sector_allocation"]}</div>', unsafe_allow_html=True)
 
             # Donut chart for sector allocation
-            sector_values = list(metrics.sector_exposures.values())
-            sector_names = [f"{k} / {SECTOR_NAMES_CN.get(k, k)}" for k in metrics.sector_exposures.keys()]
-            sector_colors = [get_sector_color(k, st.session_state.sector_color_map) for k in metrics.sector_exposures.keys()]
+            sector_keys, sector_values = metrics.sector_exposure_arrays
+            sector_names, sector_colors, sector_color_map = sector_labels_colors(
+                sector_keys,
+                tuple(st.session_state.sector_color_map.items()),
+            )
+            st.session_state.sector_color_map.update(sector_color_map)
 
             fig_sector = go.Figure(data=[go.Pie(
                 labels=sector_names,
@@ -2723,22 +3049,18 @@ def main():
         export_col1, export_col2, export_col3 = st.columns(3)
 
         with export_col1:
-            csv_buffer = io.StringIO()
-            df_filtered.to_csv(csv_buffer, index=False)
             st.download_button(
                 label=f"📊 Full Portfolio / 完整组合 (CSV)",
-                data=csv_buffer.getvalue(),
+                data=make_csv_exporter(df_filtered),
                 file_name="portfolio_full.csv",
                 mime="text/csv",
             )
 
         with export_col2:
             if len(sell_candidates) > 0:
-                sell_csv = io.StringIO()
-                sell_candidates.to_csv(sell_csv, index=False)
                 st.download_button(
                     label=f"🔴 Sell List / 卖出清单 (CSV)",
-                    data=sell_csv.getvalue(),
+                    data=make_csv_exporter(sell_candidates),
                     file_name="sell_candidates.csv",
                     mime="text/csv",
                 )
@@ -2746,13 +3068,14 @@ def main():
         with export_col3:
             regression_results = filtered_analyzer.get_regression_results()
             if regression_results:
-                reg_data = [r.to_dict() for r in regression_results.values()]
-                reg_df = pd.DataFrame(reg_data)
-                reg_csv = io.StringIO()
-                reg_df.to_csv(reg_csv, index=False)
+                _, reg_df = build_regression_stats(
+                    st.session_state.model_type,
+                    regression_stats_key(regression_results),
+                    regression_results,
+                )
                 st.download_button(
                     label=f"📈 Regression / 回归统计 (CSV)",
-                    data=reg_csv.getvalue(),
+                    data=make_csv_exporter(reg_df),
                     file_name="regression_stats.csv",
                     mime="text/csv",
                 )
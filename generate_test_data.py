@@ -5,6 +5,8 @@ Creates multiple bonds per issuer with varying durations for Nelson-Siegel testi
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from pathlib import Path
 
 np.random.seed(42)  # For reproducibility
@@ -110,91 +112,79 @@ MATURITY_YEARS = {
 
 ACCOUNTING_TYPES = ["AFS", "HTM", "Fair Value"]
 
-def generate_bonds():
-    """Generate synthetic bond data."""
-    bonds = []
-
-    for ticker, info in ISSUERS.items():
-        sector = info["sector"]
-        subsector = info["subsector"]
-        name = info["name"]
-        base_oas = info["base_oas"]
-        base_ftp = info["base_ftp"]
-
-        # Generate 6-8 bonds per issuer with different maturities
-        num_bonds = np.random.randint(6, 9)
-        maturities = np.random.choice(list(DURATIONS.keys()), size=num_bonds, replace=True)
-
-        for i, maturity in enumerate(maturities):
-            # Duration
-            dur_min, dur_max = DURATIONS[maturity]
-            duration = np.random.uniform(dur_min, dur_max)
-
-            # OAS varies around base with some noise
-            oas = base_oas + np.random.normal(0, 10)
-            oas = max(oas, -50)  # Floor at -50bp
-
-            # FTP
-            ftp = base_ftp / 100
-
-            # Calculate yield using a simple term structure
-            # Base rate increases with duration
-            base_rate = 0.035 + 0.0015 * duration  # 3.5% + 15bp per year of duration
-
-            # Add OAS spread
-            spread = oas / 10000  # Convert bps to decimal
-
-            # Add some random noise
-            noise = np.random.normal(0, 0.001)
-
-            yield_rate = base_rate + spread + noise
-
-            # Notional - larger for shorter duration, high quality
-            if duration < 3:
-                notional = np.random.uniform(15, 50) * 1e6
-            elif duration < 7:
-                notional = np.random.uniform(10, 35) * 1e6
-            else:
-                notional = np.random.uniform(5, 25) * 1e6
-
-            # Accounting type - mostly AFS, some HTM, few Fair Value
-            accounting_weights = [0.65, 0.25, 0.10]
-            accounting = np.random.choice(ACCOUNTING_TYPES, p=accounting_weights)
-
-            # Create bond entry
-            year = MATURITY_YEARS[maturity]
-            coupon = yield_rate * 100 * np.random.uniform(0.85, 1.05)  # Coupon near but not exactly at yield
-
-            bond = {
-                "分类1": sector,
-                "分类2": subsector,
-                "TICKER": f"{ticker} {coupon:.2f} {str(year)[-2:]}",
-                "债券名称": f"{name} {coupon:.2f}% {year}",
-                "AccSection": accounting,
-                "Nominal（USD）": f"{notional:,.0f}",
-                "Duration": f"{duration:.2f}",
-                "EffectiveYield": f"{yield_rate*100:.2f}%",
-                "OAS": f"{oas:.0f}",
-                "FTP Rate": f"{ftp*100:.2f}%",
-            }
-
-            bonds.append(bond)
-
-    return bonds
+def generate_bonds() -> pd.DataFrame:
+    """Generate synthetic bond data (all random draws are taken as whole arrays)."""
+    issuers = list(ISSUERS.values())
+    tickers = np.array(list(ISSUERS.keys()))
+    maturity_keys = np.array(list(DURATIONS.keys()))
+
+    # Generate 6-8 bonds per issuer with different maturities
+    counts = np.random.randint(6, 9, size=len(issuers))
+    total = counts.sum()
+
+    issuer_idx = np.repeat(np.arange(len(issuers)), counts)
+    sector = np.array([info["sector"] for info in issuers])[issuer_idx]
+    subsector = np.array([info["subsector"] for info in issuers])[issuer_idx]
+    name = np.array([info["name"] for info in issuers])[issuer_idx]
+    base_oas = np.array([info["base_oas"] for info in issuers], dtype=float)[issuer_idx]
+    base_ftp = np.array([info["base_ftp"] for info in issuers], dtype=float)[issuer_idx]
+
+    maturity_idx = np.random.randint(0, len(maturity_keys), size=total)
+    maturity = maturity_keys[maturity_idx]
+
+    # Duration
+    dur_bounds = np.array(list(DURATIONS.values()))
+    duration = np.random.uniform(dur_bounds[maturity_idx, 0], dur_bounds[maturity_idx, 1])
+
+    # OAS varies around base with some noise, floored at -50bp
+    oas = np.maximum(base_oas + np.random.normal(0, 10, total), -50)
+
+    # FTP
+    ftp = base_ftp / 100
+
+    # Yield: simple term structure (3.5% + 15bp per year of duration) + OAS spread + noise
+    yield_rate = 0.035 + 0.0015 * duration + oas / 10000 + np.random.normal(0, 0.001, total)
+
+    # Notional - larger for shorter duration, high quality
+    notional_low = np.select([duration < 3, duration < 7], [15, 10], default=5)
+    notional_high = np.select([duration < 3, duration < 7], [50, 35], default=25)
+    notional = np.random.uniform(notional_low, notional_high) * 1e6
+
+    # Accounting type - mostly AFS, some HTM, few Fair Value
+    accounting = np.random.choice(ACCOUNTING_TYPES, size=total, p=[0.65, 0.25, 0.10])
+
+    # Coupon near but not exactly at yield
+    year = np.array([MATURITY_YEARS[m] for m in maturity_keys])[maturity_idx]
+    coupon = yield_rate * 100 * np.random.uniform(0.85, 1.05, total)
+    coupon_str = np.char.mod("%.2f", coupon)
+
+    return pd.DataFrame({
+        "分类1": sector,
+        "分类2": subsector,
+        "TICKER": [f"{t} {c} {str(y)[-2:]}" for t, c, y in zip(tickers[issuer_idx], coupon_str, year)],
+        "债券名称": [f"{n} {c}% {y}" for n, c, y in zip(name, coupon_str, year)],
+        "AccSection": accounting,
+        "Nominal（USD）": [f"{n:,.0f}" for n in notional],
+        "Duration": np.char.mod("%.2f", duration),
+        "EffectiveYield": np.char.add(np.char.mod("%.2f", yield_rate * 100), "%"),
+        "OAS": np.char.mod("%.0f", oas),
+        "FTP Rate": np.char.add(np.char.mod("%.2f", ftp * 100), "%"),
+    })
 
 def main():
     """Generate and save test data."""
     print("Generating enhanced test data...")
 
-    bonds = generate_bonds()
-    df = pd.DataFrame(bonds)
+    df = generate_bonds()
 
     # Sort by sector and ticker
     df = df.sort_values(["分类1", "TICKER"])
 
-    # Save to CSV
+    # Save to CSV with pyarrow's writer; the BOM keeps utf-8-sig semantics for Excel
     output_path = Path(__file__).parent / "data" / "portfolio.csv"
-    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    with open(output_path, "wb") as f:
+        f.write(b"\xef\xbb\xbf")
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), f)
 
     print(f"✅ Generated {len(df)} bonds")
     print(f"✅ Saved to: {output_path}")
@@ -7,96 +7,117 @@ Reorganize tabs in app.py:
 - Tab 4: Executive Brief
 """
 
-# Read the file
-with open('app.py', 'r', encoding='utf-8') as f:
-    lines = f.readlines()
-
-# Find key line numbers
-tab_def_start = None
-tab1_start = None
-issuer360_start_in_tab1 = None
-tab2_start = None
-tab3_start = None
-tab4_start = None
-
-for i, line in enumerate(lines):
-    if 'tab_issuer360, tab_matrix, tab_optimization, tab_brief = st.tabs' in line:
-        tab_def_start = i
-    elif line.strip() == 'with tab_issuer360:':
-        tab1_start = i
-    elif '# ISSUER 360 DEEP DIVE (Moved from Tab 3)' in line:
-        issuer360_start_in_tab1 = i
-    elif line.strip() == 'with tab2:':
-        tab2_start = i
-    elif line.strip() == 'with tab3:':
-        tab3_start = i
-    elif line.strip() == 'with tab4:':
-        tab4_start = i
-
-print(f"Tab definition: line {tab_def_start}")
-print(f"Tab 1 (tab_issuer360) starts: line {tab1_start}")
-print(f"Issuer 360 content in tab1 starts: line {issuer360_start_in_tab1}")
-print(f"Tab 2 starts: line {tab2_start}")
-print(f"Tab 3 starts: line {tab3_start}")
-print(f"Tab 4 starts: line {tab4_start}")
-
-# Extract sections
-matrix_content = lines[tab1_start+1:issuer360_start_in_tab1]  # Matrix content (without Issuer 360)
-issuer360_content = lines[issuer360_start_in_tab1:tab2_start]  # Issuer 360 content
-alpha_lab_content = lines[tab2_start:tab3_start]  # Alpha Lab
-brief_content = lines[tab4_start:]  # Executive Brief
-
-# Build new file
-new_lines = []
-
-# Keep everything before tabs
-new_lines.extend(lines[:tab1_start+1])
-
-# Tab 1: Issuer 360 (remove the "Moved from Tab 3" part and just keep the content)
-issuer360_clean = []
-skip_intro = True
-for line in issuer360_content:
-    if skip_intro:
-        if '# ISSUER SELECTION (Changed to Equity Ticker - Name format)' in line:
-            skip_intro = False
-            # Add proper header
-            issuer360_clean.append('        st.markdown(f\'<div class="section-header">🏢 Issuer 360 / 发行人全景深度分析</div>\', unsafe_allow_html=True)\n')
-            issuer360_clean.append('        st.markdown("*Quantamental Fusion: Market Pricing + Financial Fundamentals*")\n')
-            issuer360_clean.append('        st.markdown("*量化与基本面融合：市场定价 + 财务基本面*")\n')
-            issuer360_clean.append('\n')
-            issuer360_clean.append(line)
-    else:
-        issuer360_clean.append(line)
-
-new_lines.extend(issuer360_clean)
-
-# Tab 2: Relative Value Matrix
-new_lines.append('\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    # TAB 2: RELATIVE VALUE MATRIX\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    with tab_matrix:\n')
-new_lines.extend(matrix_content)
-
-# Tab 3: Alpha Lab
-new_lines.append('\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    # TAB 3: ALPHA OPTIMIZATION LAB\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    with tab_optimization:\n')
-new_lines.extend(alpha_lab_content[1:])  # Skip the "with tab2:" line
-
-# Tab 4: Executive Brief
-new_lines.append('\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    # TAB 4: EXECUTIVE BRIEF\n')
-new_lines.append('    # ============================================\n')
-new_lines.append('    with tab_brief:\n')
-new_lines.extend(brief_content[1:])  # Skip the "with tab4:" line
-
-# Write the new file
-with open('app.py', 'w', encoding='utf-8') as f:
-    f.writelines(new_lines)
+import io
+import re
+from pathlib import Path
 
+# All markers in one precompiled pattern; each match spans one whole line and
+# the named group that matched is the marker's key
+MARKER_PATTERN = re.compile(
+    rb'(?m)^(?:'
+    rb'(?P<tab_def_start>.*tab_issuer360, tab_matrix, tab_optimization, tab_brief = st\.tabs.*)'
+    rb'|(?P<issuer360_start_in_tab1>.*\# ISSUER 360 DEEP DIVE \(Moved from Tab 3\).*)'
+    rb'|[ \t]*with (?:(?P<tab1_start>tab_issuer360)|(?P<tab2_start>tab2)'
+    rb'|(?P<tab3_start>tab3)|(?P<tab4_start>tab4)):[ \t]*\r?'
+    rb')$'
+)
+
+# Userspace buffer for the output file (default is 8 KiB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+ISSUER_SELECTION_MARKER = b'# ISSUER SELECTION (Changed to Equity Ticker - Name format)'
+
+ISSUER360_HEADER = (
+    '        st.markdown(f\'<div class="section-header">🏢 Issuer 360 / 发行人全景深度分析</div>\', unsafe_allow_html=True)\n'
+    '        st.markdown("*Quantamental Fusion: Market Pricing + Financial Fundamentals*")\n'
+    '        st.markdown("*量化与基本面融合：市场定价 + 财务基本面*")\n'
+    '\n'
+).encode('utf-8')  # Non-ASCII text, encoded once at import
+
+# Section banners that open each reorganized tab, as pre-encoded bytes
+TAB2_HEADER = (
+    b'\n'
+    b'    # ============================================\n'
+    b'    # TAB 2: RELATIVE VALUE MATRIX\n'
+    b'    # ============================================\n'
+    b'    with tab_matrix:\n'
+)
+TAB3_HEADER = (
+    b'\n'
+    b'    # ============================================\n'
+    b'    # TAB 3: ALPHA OPTIMIZATION LAB\n'
+    b'    # ============================================\n'
+    b'    with tab_optimization:\n'
+)
+TAB4_HEADER = (
+    b'\n'
+    b'    # ============================================\n'
+    b'    # TAB 4: EXECUTIVE BRIEF\n'
+    b'    # ============================================\n'
+    b'    with tab_brief:\n'
+)
+
+# Read the file as one blob; sections are sliced out of it without per-line objects
+data = Path('app.py').read_bytes()
+view = memoryview(data)
+
+# Find the start and end offsets of every marker line in a single sweep
+starts = dict.fromkeys(
+    ['tab_def_start', 'tab1_start', 'issuer360_start_in_tab1', 'tab2_start', 'tab3_start', 'tab4_start']
+)
+ends = dict(starts)
+
+for match in MARKER_PATTERN.finditer(data):
+    starts[match.lastgroup] = match.start()
+    ends[match.lastgroup] = match.end() + 1  # Past the newline
+
+# 0-based line numbers for reporting, counted in one forward pass over the found offsets
+line_numbers = dict.fromkeys(starts)
+line, previous = 0, 0
+for key, offset in sorted((item for item in starts.items() if item[1] is not None), key=lambda item: item[1]):
+    line += data.count(b'\n', previous, offset)
+    line_numbers[key] = line
+    previous = offset
+
+print(f"Tab definition: line {line_numbers['tab_def_start']}")
+print(f"Tab 1 (tab_issuer360) starts: line {line_numbers['tab1_start']}")
+print(f"Issuer 360 content in tab1 starts: line {line_numbers['issuer360_start_in_tab1']}")
+print(f"Tab 2 starts: line {line_numbers['tab2_start']}")
+print(f"Tab 3 starts: line {line_numbers['tab3_start']}")
+print(f"Tab 4 starts: line {line_numbers['tab4_start']}")
+
+# Tab 1: Issuer 360 (drop the "Moved from Tab 3" intro, keep from the issuer selection on)
+issuer360_start = starts['issuer360_start_in_tab1']
+selection_pos = data.find(ISSUER_SELECTION_MARKER, issuer360_start, starts['tab2_start'])
+if selection_pos == -1:
+    issuer360_clean = []
+else:
+    selection_line = data.rfind(b'\n', 0, selection_pos) + 1
+    issuer360_clean = [ISSUER360_HEADER, (selection_line, starts['tab2_start'])]
+
+# Build the new file: literal headers plus (start, stop) spans of the original buffer
+segments = [
+    # Keep everything before tabs
+    (0, ends['tab1_start']),
+    *issuer360_clean,
+    # Tab 2: Relative Value Matrix (matrix content without Issuer 360)
+    TAB2_HEADER,
+    (ends['tab1_start'], issuer360_start),
+    # Tab 3: Alpha Lab (skip the "with tab2:" line)
+    TAB3_HEADER,
+    (ends['tab2_start'], starts['tab3_start']),
+    # Tab 4: Executive Brief (skip the "with tab4:" line)
+    TAB4_HEADER,
+    (ends['tab4_start'], None),
+]
+
+# Spans become zero-copy memoryview slices, joined once into the output payload
+payload = b''.join(seg if isinstance(seg, bytes) else view[seg[0]:seg[1]] for seg in segments)
+
+# Write the new file in one call through an explicitly sized buffer
+with io.BufferedWriter(io.FileIO('app.py', 'w'), buffer_size=WRITE_BUFFER_SIZE) as f:
+    f.write(payload)
+
+total_lines = payload.count(b'\n')
 print("\nFile reorganized successfully!")
-print(f"Total lines: {len(new_lines)}")
+print(f"Total lines: {total_lines}")
@@ -16,7 +16,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 
 class CreditRating(Enum):
@@ -130,6 +130,9 @@ class BaseAnalyzer(ABC):
     and health checks.
     """
 
+    # Stateless interfaces; empty slots let slotted implementations skip __dict__
+    __slots__ = ()
+
     @abstractmethod
     def initialize(self, config: Dict[str, Any]) -> None:
         """
@@ -152,12 +155,12 @@ class BaseAnalyzer(ABC):
 
     @property
     @abstractmethod
-    def model_info(self) -> Dict[str, str]:
+    def model_info(self) -> Mapping[str, str]:
         """
         Get information about the underlying model.
 
         Returns:
-            Dictionary with model name, version, provider, etc.
+            Mapping with model name, version, provider, etc.
         """
         pass
 
@@ -170,6 +173,8 @@ class BaseCreditProfiler(BaseAnalyzer):
     generate comprehensive issuer credit profiles.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def generate_profile(
         self,
@@ -236,6 +241,8 @@ class BaseDocumentProcessor(BaseAnalyzer):
     - Covenant documents
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def process_document(
         self,
@@ -294,6 +301,8 @@ class BaseNewsAnalyzer(BaseAnalyzer):
     - Generate alerts for significant news
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def fetch_news(
         self,
@@ -346,6 +355,33 @@ class BaseNewsAnalyzer(BaseAnalyzer):
         """
         pass
 
+    def fetch_and_score(
+        self,
+        issuer_id: str,
+        days_back: int = 30,
+    ) -> Tuple[List[NewsItem], SentimentScore, List[Dict[str, Any]]]:
+        """
+        Fetch news and score it in one call.
+
+        The default chains fetch_news, analyze_sentiment and
+        detect_material_events. Implementations backed by an external
+        API or LLM should override this to produce all three results
+        from a single request.
+
+        Args:
+            issuer_id: Issuer to fetch news for
+            days_back: Number of days to look back
+
+        Returns:
+            Tuple of (news items, overall sentiment, material events)
+        """
+        news_items = self.fetch_news(issuer_id, days_back)
+        return (
+            news_items,
+            self.analyze_sentiment(news_items),
+            self.detect_material_events(news_items),
+        )
+
     @abstractmethod
     def generate_news_digest(
         self,
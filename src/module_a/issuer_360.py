@@ -11,8 +11,13 @@ When fully implemented, this module will:
 """
 
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from .base import (
     BaseAnalyzer,
@@ -28,6 +33,71 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Static model info reported by every placeholder component (read-only, as it is shared)
+PLACEHOLDER_MODEL_INFO = MappingProxyType({
+    "provider": "Placeholder",
+    "model": "None",
+    "version": "0.0.0",
+    "status": "Not Configured",
+})
+
+# Profile cache defaults (overridable via configure())
+DEFAULT_CACHE_TTL = 3600  # seconds
+DEFAULT_CACHE_MAX = 10_000  # profiles
+
+
+def _intern_issuer_id(issuer_id: str) -> str:
+    """Intern a ticker; str subclasses such as numpy.str_ are converted to str first."""
+    return sys.intern(str(issuer_id)) if isinstance(issuer_id, str) else issuer_id
+
+
+class _ProfileCache:
+    """
+    Bounded, thread-safe LRU cache of credit profiles with per-entry expiry.
+
+    Entries older than ``ttl`` seconds are dropped on access so stale
+    profiles are regenerated; the least recently used entry is evicted
+    once ``maxsize`` is exceeded.
+    """
+
+    __slots__ = ("maxsize", "ttl", "_entries", "_lock")
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_MAX, ttl: float = DEFAULT_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, CreditProfile]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, issuer_id: str) -> Optional[CreditProfile]:
+        """Return the cached profile, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(issuer_id)
+            if entry is None:
+                return None
+
+            expires_at, profile = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[issuer_id]
+                return None
+
+            self._entries.move_to_end(issuer_id)
+            return profile
+
+    def set(self, issuer_id: str, profile: CreditProfile) -> None:
+        """Store a profile, evicting the least recently used beyond maxsize."""
+        with self._lock:
+            self._entries[issuer_id] = (time.monotonic() + self.ttl, profile)
+            self._entries.move_to_end(issuer_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class PlaceholderCreditProfiler(BaseCreditProfiler):
     """
@@ -36,6 +106,8 @@ class PlaceholderCreditProfiler(BaseCreditProfiler):
     TODO: Replace with actual LLM integration (e.g., OpenAI, Anthropic, etc.)
     """
 
+    __slots__ = ("_initialized", "_config")
+
     def __init__(self):
         self._initialized = False
         self._config: Dict[str, Any] = {}
@@ -51,14 +123,9 @@ class PlaceholderCreditProfiler(BaseCreditProfiler):
         return self._initialized
 
     @property
-    def model_info(self) -> Dict[str, str]:
+    def model_info(self) -> Mapping[str, str]:
         """Get model information."""
-        return {
-            "provider": "Placeholder",
-            "model": "None",
-            "version": "0.0.0",
-            "status": "Not Configured",
-        }
+        return PLACEHOLDER_MODEL_INFO
 
     def generate_profile(
         self,
@@ -113,6 +180,8 @@ class PlaceholderDocumentProcessor(BaseDocumentProcessor):
     TODO: Replace with actual document parsing and LLM analysis.
     """
 
+    __slots__ = ("_initialized", "_config")
+
     def __init__(self):
         self._initialized = False
         self._config: Dict[str, Any] = {}
@@ -126,13 +195,8 @@ class PlaceholderDocumentProcessor(BaseDocumentProcessor):
         return self._initialized
 
     @property
-    def model_info(self) -> Dict[str, str]:
-        return {
-            "provider": "Placeholder",
-            "model": "None",
-            "version": "0.0.0",
-            "status": "Not Configured",
-        }
+    def model_info(self) -> Mapping[str, str]:
+        return PLACEHOLDER_MODEL_INFO
 
     def process_document(
         self,
@@ -178,6 +242,8 @@ class PlaceholderNewsAnalyzer(BaseNewsAnalyzer):
     TODO: Replace with actual news API + LLM sentiment analysis.
     """
 
+    __slots__ = ("_initialized", "_config")
+
     def __init__(self):
         self._initialized = False
         self._config: Dict[str, Any] = {}
@@ -191,13 +257,8 @@ class PlaceholderNewsAnalyzer(BaseNewsAnalyzer):
         return self._initialized
 
     @property
-    def model_info(self) -> Dict[str, str]:
-        return {
-            "provider": "Placeholder",
-            "model": "None",
-            "version": "0.0.0",
-            "status": "Not Configured",
-        }
+    def model_info(self) -> Mapping[str, str]:
+        return PLACEHOLDER_MODEL_INFO
 
     def fetch_news(
         self,
@@ -223,6 +284,15 @@ class PlaceholderNewsAnalyzer(BaseNewsAnalyzer):
         """Detect material events (placeholder)."""
         return []
 
+    def fetch_and_score(
+        self,
+        issuer_id: str,
+        days_back: int = 30,
+    ) -> Tuple[List[NewsItem], SentimentScore, List[Dict[str, Any]]]:
+        """Fetch and score news in one pass (placeholder)."""
+        logger.warning(f"News fetching not implemented for {issuer_id}")
+        return [], SentimentScore.NEUTRAL, []
+
     def generate_news_digest(
         self,
         issuer_id: str,
@@ -252,12 +322,20 @@ class Issuer360Engine:
         - Internal data lake for historical data
     """
 
+    __slots__ = (
+        "_profiler",
+        "_document_processor",
+        "_news_analyzer",
+        "_profile_cache",
+        "_is_configured",
+    )
+
     def __init__(self):
         """Initialize with placeholder components."""
         self._profiler: BaseCreditProfiler = PlaceholderCreditProfiler()
         self._document_processor: BaseDocumentProcessor = PlaceholderDocumentProcessor()
         self._news_analyzer: BaseNewsAnalyzer = PlaceholderNewsAnalyzer()
-        self._profile_cache: Dict[str, CreditProfile] = {}
+        self._profile_cache = _ProfileCache()
         self._is_configured = False
 
     def configure(self, config: Dict[str, Any]) -> None:
@@ -270,7 +348,13 @@ class Issuer360Engine:
                 - anthropic_api_key: Anthropic API key (optional)
                 - news_api_key: News API key (optional)
                 - cache_ttl: Cache TTL in seconds (default 3600)
+                - cache_max: Maximum cached profiles (default 10,000)
         """
+        self._profile_cache = _ProfileCache(
+            maxsize=config.get("cache_max", DEFAULT_CACHE_MAX),
+            ttl=config.get("cache_ttl", DEFAULT_CACHE_TTL),
+        )
+
         # In production, this would initialize actual LLM clients
         self._profiler.initialize(config)
         self._document_processor.initialize(config)
@@ -316,12 +400,17 @@ class Issuer360Engine:
         Returns:
             CreditProfile for the issuer
         """
-        if not force_refresh and issuer_id in self._profile_cache:
-            logger.debug(f"Returning cached profile for {issuer_id}")
-            return self._profile_cache[issuer_id]
+        # Tickers are a small, finite set; interned keys compare by identity on cache hits
+        issuer_id = _intern_issuer_id(issuer_id)
+
+        if not force_refresh:
+            cached = self._profile_cache.get(issuer_id)
+            if cached is not None:
+                logger.debug(f"Returning cached profile for {issuer_id}")
+                return cached
 
         profile = self._profiler.generate_profile(issuer_id)
-        self._profile_cache[issuer_id] = profile
+        self._profile_cache.set(issuer_id, profile)
 
         return profile
 
@@ -343,7 +432,7 @@ class Issuer360Engine:
             Analysis results
         """
         return self._document_processor.process_document(
-            document_path, document_type, issuer_id
+            document_path, document_type, _intern_issuer_id(issuer_id)
         )
 
     def get_news_summary(
@@ -361,9 +450,8 @@ class Issuer360Engine:
         Returns:
             News summary with items and sentiment
         """
-        news_items = self._news_analyzer.fetch_news(issuer_id, days_back)
-        sentiment = self._news_analyzer.analyze_sentiment(news_items)
-        events = self._news_analyzer.detect_material_events(news_items)
+        issuer_id = _intern_issuer_id(issuer_id)
+        news_items, sentiment, events = self._news_analyzer.fetch_and_score(issuer_id, days_back)
 
         return {
             "issuer_id": issuer_id,
@@ -7,12 +7,22 @@ and various portfolio analytics for fixed income optimization.
 
 import logging
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy import stats
-from scipy.optimize import curve_fit
+from scipy.optimize import least_squares
+
+try:
+    from numba import njit
+except ImportError:  # Optional accelerator; fall back to NumPy
+    njit = None
+
+try:
+    from joblib import Parallel, delayed
+except ImportError:  # Optional; Nelson-Siegel sectors are then fitted serially
+    Parallel = None
 
 from ..utils.constants import (
     SECTOR_COLORS,
@@ -23,6 +33,114 @@ from ..utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Nelson-Siegel parameter bounds (all yields in decimal, e.g., 0.05 = 5%)
+NS_PARAM_BOUNDS = (
+    np.array([-0.5, -0.5, -0.5, 0.1]),   # lower bounds
+    np.array([0.5, 0.5, 0.5, 50.0]),     # upper bounds
+)
+
+# Executive summary labels for average sector Z-scores, bucketed by np.digitize
+RICHNESS_BREAKS = np.array([-1.0, -0.5])
+RICHNESS_LABELS = np.array(["Very Rich", "Moderately Rich", "Slightly Rich"])
+
+# Candidate decay parameters for the cold-start λ sweep (betas solved by OLS per λ)
+NS_LAMBDA_GRID = np.linspace(0.5, 10.0, 20)
+
+# Fewer sectors than this are fitted serially (process pool startup outweighs the fits)
+NS_PARALLEL_MIN_SECTORS = 3
+
+# Per-row bit flags for the default candidate screens (see PortfolioAnalyzer._row_flags)
+FLAG_TRADEABLE = 1 << 0   # Is_Tradeable
+FLAG_BLEEDING = 1 << 1    # Net_Carry < 0
+FLAG_RICH = 1 << 2        # Z_Score < Z_SCORE_THRESHOLDS["rich"]
+FLAG_CHEAP = 1 << 3       # Z_Score > Z_SCORE_THRESHOLDS["cheap"]
+
+
+def _nelson_siegel_numpy(tau, beta_0, beta_1, beta_2, lambda_):
+    """Broadcasting Nelson-Siegel evaluation (also accepts per-row parameter arrays)."""
+    # Avoid division by zero
+    tau = np.maximum(tau, 1e-6)
+    tau_lambda = tau / lambda_
+
+    # Calculate factors
+    factor_1 = (1 - np.exp(-tau_lambda)) / tau_lambda
+    factor_2 = factor_1 - np.exp(-tau_lambda)
+
+    return beta_0 + beta_1 * factor_1 + beta_2 * factor_2
+
+
+if njit is not None:
+
+    # No fastmath: NaN durations/parameters must propagate exactly as in the NumPy path
+    @njit(cache=True)
+    def _nelson_siegel_kernel(tau, beta_0, beta_1, beta_2, lambda_, out):
+        """Fused single-pass Nelson-Siegel evaluation of a 1-D float64 array into ``out``."""
+        for i in range(tau.shape[0]):
+            # Same floor as np.maximum(tau, 1e-6): negative/zero tau clamp, NaN passes through
+            t = 1e-6 if tau[i] < 1e-6 else tau[i]
+            tau_lambda = t / lambda_
+            decay = np.exp(-tau_lambda)
+            factor_1 = (1.0 - decay) / tau_lambda
+            out[i] = beta_0 + beta_1 * factor_1 + beta_2 * (factor_1 - decay)
+
+    # No fastmath: curve points must not depend on whether numba is installed
+    @njit(cache=True)
+    def _quadratic_kernel(x, a, b, c):
+        """Horner-form quadratic evaluation over a 1-D float64 array."""
+        out = np.empty_like(x)
+        for i in range(x.shape[0]):
+            out[i] = (a * x[i] + b) * x[i] + c
+        return out
+
+    # No fastmath: sequential per-group sums must match np.bincount bit for bit
+    @njit(cache=True)
+    def _quadratic_fit_stats(x, xc, y, y_mean, a, b_c, c_c, starts, counts):
+        """
+        Fused per-sector goodness-of-fit pass over rows grouped contiguously by sector.
+
+        Returns (ss_res, ss_tot, residual_sum, x_min, x_max) per sector.
+        """
+        n_groups = starts.shape[0]
+        ss_res = np.zeros(n_groups)
+        ss_tot = np.zeros(n_groups)
+        residual_sum = np.zeros(n_groups)
+        x_min = np.empty(n_groups)
+        x_max = np.empty(n_groups)
+        for g in range(n_groups):
+            lo = x[starts[g]]
+            hi = lo
+            for i in range(starts[g], starts[g] + counts[g]):
+                residual = y[i] - ((a[g] * xc[i] + b_c[g]) * xc[i] + c_c[g])
+                deviation = y[i] - y_mean[g]
+                ss_res[g] += residual * residual
+                ss_tot[g] += deviation * deviation
+                residual_sum[g] += residual
+                lo = min(lo, x[i])
+                hi = max(hi, x[i])
+            x_min[g] = lo
+            x_max[g] = hi
+        return ss_res, ss_tot, residual_sum, x_min, x_max
+
+else:
+    _nelson_siegel_kernel = None
+
+    def _quadratic_kernel(x, a, b, c):
+        """Horner-form quadratic evaluation (NumPy fallback)."""
+        return (a * x + b) * x + c
+
+    def _quadratic_fit_stats(x, xc, y, y_mean, a, b_c, c_c, starts, counts):
+        """Per-sector (ss_res, ss_tot, residual_sum, x_min, x_max) (NumPy fallback)."""
+        codes = np.repeat(np.arange(len(counts)), counts)
+        residuals = y - ((a[codes] * xc + b_c[codes]) * xc + c_c[codes])
+        deviations = y - y_mean[codes]
+        return (
+            np.bincount(codes, weights=residuals * residuals, minlength=len(counts)),
+            np.bincount(codes, weights=deviations * deviations, minlength=len(counts)),
+            np.bincount(codes, weights=residuals, minlength=len(counts)),
+            np.minimum.reduceat(x, starts),
+            np.maximum.reduceat(x, starts),
+        )
+
 
 def nelson_siegel(tau: np.ndarray, beta_0: float, beta_1: float, beta_2: float, lambda_: float) -> np.ndarray:
     """
@@ -30,6 +148,9 @@ def nelson_siegel(tau: np.ndarray, beta_0: float, beta_1: float, beta_2: float,
 
     Formula: y(τ) = β₀ + β₁ * [(1-exp(-τ/λ)) / (τ/λ)] + β₂ * [(1-exp(-τ/λ)) / (τ/λ) - exp(-τ/λ)]
 
+    Scalar parameters over a 1-D ``tau`` run through the fused Numba kernel when
+    available; per-row parameter arrays fall back to NumPy broadcasting.
+
     Args:
         tau: Maturity/duration values
         beta_0: Long-term level (asymptotic yield as τ → ∞)
@@ -40,15 +161,49 @@ def nelson_siegel(tau: np.ndarray, beta_0: float, beta_1: float, beta_2: float,
     Returns:
         Predicted yield values
     """
-    # Avoid division by zero
-    tau = np.maximum(tau, 1e-6)
-    tau_lambda = tau / lambda_
+    if (
+        _nelson_siegel_kernel is None
+        or np.ndim(tau) != 1
+        or np.ndim(beta_0) or np.ndim(beta_1) or np.ndim(beta_2) or np.ndim(lambda_)
+    ):
+        return _nelson_siegel_numpy(tau, beta_0, beta_1, beta_2, lambda_)
 
-    # Calculate factors
-    factor_1 = (1 - np.exp(-tau_lambda)) / tau_lambda
-    factor_2 = factor_1 - np.exp(-tau_lambda)
+    tau = np.ascontiguousarray(tau, dtype=np.float64)
+    out = np.empty_like(tau)
+    _nelson_siegel_kernel(tau, float(beta_0), float(beta_1), float(beta_2), float(lambda_), out)
+    return out
 
-    return beta_0 + beta_1 * factor_1 + beta_2 * factor_2
+
+def _nelson_siegel_factors(tau, lambda_):
+    """Shared Nelson-Siegel terms (u = τ/λ, e = exp(-u), f₁ = (1-e)/u) for one λ."""
+    tau_lambda = np.maximum(np.asarray(tau, dtype=np.float64), 1e-6) / lambda_
+    decay = np.exp(-tau_lambda)
+    return tau_lambda, decay, (1.0 - decay) / tau_lambda
+
+
+def _nelson_siegel_jacobian(tau, beta_0, beta_1, beta_2, lambda_, factors=None):
+    """
+    Closed-form Jacobian of the Nelson-Siegel model w.r.t. (β₀, β₁, β₂, λ).
+
+    With u = τ/λ, e = exp(-u) and f₁ = (1-e)/u:
+        ∂y/∂β₀ = 1, ∂y/∂β₁ = f₁, ∂y/∂β₂ = f₁ - e
+        ∂y/∂λ = β₁·∂f₁/∂λ + β₂·(∂f₁/∂λ - e·u/λ), where ∂f₁/∂λ = (1 - e·(1+u)) / (λ·u)
+
+    Args:
+        factors: Precomputed _nelson_siegel_factors(tau, lambda_), if available
+
+    Returns:
+        (N, 4) array, one row per duration
+    """
+    tau_lambda, decay, factor_1 = factors if factors is not None else _nelson_siegel_factors(tau, lambda_)
+    d_factor_1 = (1.0 - decay * (1.0 + tau_lambda)) / (lambda_ * tau_lambda)
+
+    jac = np.empty((tau_lambda.shape[0], 4))
+    jac[:, 0] = 1.0
+    jac[:, 1] = factor_1
+    jac[:, 2] = factor_1 - decay
+    jac[:, 3] = beta_1 * d_factor_1 + beta_2 * (d_factor_1 - decay * tau_lambda / lambda_)
+    return jac
 
 
 @dataclass
@@ -85,8 +240,9 @@ class RegressionResult:
         return self.coefficients[2]
 
     def predict(self, duration: np.ndarray) -> np.ndarray:
-        """Predict yield for given duration values."""
-        return self.a * duration**2 + self.b * duration + self.c
+        """Predict yield for given duration values (Horner form, any input shape)."""
+        d = np.asarray(duration, dtype=np.float64)
+        return _quadratic_kernel(d.ravel(), self.a, self.b, self.c).reshape(d.shape)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for display."""
@@ -124,7 +280,10 @@ class NelsonSiegelResult:
 
     def predict(self, duration: np.ndarray) -> np.ndarray:
         """Predict yield for given duration values using Nelson-Siegel."""
-        return nelson_siegel(duration, self.beta_0, self.beta_1, self.beta_2, self.lambda_)
+        return nelson_siegel(
+            np.asarray(duration, dtype=np.float64),
+            self.beta_0, self.beta_1, self.beta_2, self.lambda_,
+        )
 
     def to_dict(self) -> dict:
         """Convert to dictionary for display."""
@@ -158,6 +317,14 @@ class PortfolioMetrics:
     sector_exposures: Dict[str, float] = field(default_factory=dict)
     accounting_breakdown: Dict[str, float] = field(default_factory=dict)
 
+    @cached_property
+    def sector_exposure_arrays(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """Sector names and exposures as parallel arrays, built once per instance."""
+        return (
+            tuple(self.sector_exposures),
+            np.fromiter(self.sector_exposures.values(), dtype=np.float64, count=len(self.sector_exposures)),
+        )
+
 
 @dataclass
 class TotalReturnAnalysis:
@@ -199,6 +366,121 @@ class TotalReturnAnalysis:
         }
 
 
+def _nelson_siegel_grid_start(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    Cold-start Nelson-Siegel parameters from a λ sweep.
+
+    For a fixed λ the model is linear in (β₀, β₁, β₂), so the betas for every
+    candidate in NS_LAMBDA_GRID come from one batched 3x3 normal-equation
+    solve; the candidate with the smallest SSR seeds the nonlinear fit.
+    """
+    tau_lambda, decay, factor_1 = _nelson_siegel_factors(x[None, :], NS_LAMBDA_GRID[:, None])
+
+    # (L, N, 3) factor loadings [1, f₁, f₂] for each λ candidate
+    loadings = np.stack([np.ones_like(factor_1), factor_1, factor_1 - decay], axis=-1)
+    ftf = loadings.transpose(0, 2, 1) @ loadings
+    fty = loadings.transpose(0, 2, 1) @ y
+    try:
+        betas = np.linalg.solve(ftf, fty[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        betas = (np.linalg.pinv(ftf) @ fty[..., None])[..., 0]
+
+    residuals = (loadings @ betas[..., None])[..., 0] - y
+    best = np.argmin(np.einsum("ln,ln->l", residuals, residuals))
+    return np.append(betas[best], NS_LAMBDA_GRID[best])
+
+
+def _fit_nelson_siegel_arrays(
+    sector: str,
+    x: np.ndarray,
+    y: np.ndarray,
+    p0: Optional[np.ndarray] = None,
+) -> Optional[NelsonSiegelResult]:
+    """
+    Fit a Nelson-Siegel curve to one sector's clean duration/yield arrays.
+
+    Uses scipy.optimize.least_squares (trust-region reflective, analytic
+    Jacobian) to calibrate the four parameters: β₀, β₁, β₂, λ. The fit starts
+    from the best point of a λ sweep. ``p0`` is an optional warm start (the
+    sector's curve from a previous fit); its result is kept only if its SSR is
+    no worse than the sweep's best point, otherwise the fit is rerun from the
+    sweep. Module-level so it can run in a worker process.
+    """
+    try:
+        # Single reductions over the sample
+        y_mean = y.mean()
+        x_min, x_max = x.min(), x.max()
+
+        grid_p0 = np.clip(_nelson_siegel_grid_start(x, y), *NS_PARAM_BOUNDS)
+
+        # The solver evaluates residuals and Jacobian at the same point in turn,
+        # so the exp pass for the current λ is memoized and shared by both
+        @lru_cache(maxsize=1)
+        def factors(lambda_):
+            return _nelson_siegel_factors(x, lambda_)
+
+        def residuals_at(p):
+            _, decay, factor_1 = factors(p[3])
+            return p[0] + p[1] * factor_1 + p[2] * (factor_1 - decay) - y
+
+        def jacobian_at(p):
+            return _nelson_siegel_jacobian(x, *p, factors=factors(p[3]))
+
+        def polish(start):
+            # Trust-region reflective polish with the analytic Jacobian
+            return least_squares(
+                residuals_at,
+                start,
+                jac=jacobian_at,
+                bounds=NS_PARAM_BOUNDS,
+                method="trf",
+                x_scale="jac",
+                loss="linear",
+                max_nfev=5000,
+            )
+
+        fit = None
+        if p0 is not None:
+            fit = polish(np.clip(p0, *NS_PARAM_BOUNDS))
+            grid_residuals = residuals_at(grid_p0)
+            # least_squares reports cost = SSR / 2
+            if not fit.success or 2 * fit.cost > grid_residuals @ grid_residuals:
+                fit = None
+        if fit is None:
+            fit = polish(grid_p0)
+        if not fit.success:
+            raise RuntimeError(f"Optimal parameters not found: {fit.message}")
+
+        beta_0, beta_1, beta_2, lambda_ = fit.x
+
+        # Calculate R-squared (sums of squares as dot products)
+        residuals = y - nelson_siegel(x, beta_0, beta_1, beta_2, lambda_)
+        deviations = y - y_mean
+        ss_res = float(residuals @ residuals)
+        ss_tot = float(deviations @ deviations)
+        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+
+        # Residual standard deviation from SS_res: var = SS_res/N - mean²
+        residual_mean = residuals.mean()
+        residual_std = np.sqrt(max(ss_res / len(residuals) - residual_mean * residual_mean, 0.0))
+
+        return NelsonSiegelResult(
+            sector=sector,
+            beta_0=beta_0,
+            beta_1=beta_1,
+            beta_2=beta_2,
+            lambda_=lambda_,
+            r_squared=r_squared,
+            sample_count=len(x),
+            duration_range=(x_min, x_max),
+            residual_std=residual_std,
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to fit Nelson-Siegel curve for sector '{sector}': {e}")
+        return None
+
+
 class PortfolioAnalyzer:
     """
     Quantitative analyzer for fixed income portfolios.
@@ -223,16 +505,39 @@ class PortfolioAnalyzer:
             df: Cleaned DataFrame from DataLoader
             model_type: Type of curve model ("quadratic" or "nelson_siegel")
         """
-        self.df = df.copy()
+        # Shallow copy: column data is shared with the caller's frame; only the
+        # derived Model_Yield/Residual/Z_Score columns are added to this one
+        self.df = df.copy(deep=False)
         self.model_type = model_type
+
+        # Compact dtypes for the columns every filter touches (no-ops for DataLoader output)
+        for col in ("Sector_L1", "Accounting"):
+            if col in self.df.columns and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                self.df[col] = self.df[col].astype("category")
+        if "Is_Tradeable" in self.df.columns and self.df["Is_Tradeable"].dtype != bool:
+            self.df["Is_Tradeable"] = self.df["Is_Tradeable"].astype(bool)
+
+        # Sector labels encoded once; row filters compare integer codes, not strings
+        self._sector_codes = pd.Categorical(self.df["Sector_L1"])
+        self._sectors_cache: Optional[List[str]] = None
         self._regression_results: Dict[str, RegressionResult] = {}
         self._nelson_siegel_results: Dict[str, NelsonSiegelResult] = {}
+        self._sector_signatures: Dict[str, int] = {}
         self._is_fitted = False
 
+        # Derived results memoized against the version of self.df they were built from
+        self._df_version = 0
+        self._metrics_cache: Optional[Tuple[int, PortfolioMetrics]] = None
+        self._sector_summary_cache: Optional[Tuple[int, pd.DataFrame]] = None
+        self._flags_cache: Optional[Tuple[int, np.ndarray]] = None
+        self._summary_cache: Optional[Tuple[int, str]] = None
+        self._curve_points_cache: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+
     def fit_sector_curves(
         self,
         min_samples: int = MIN_SAMPLES_FOR_REGRESSION,
         sectors: Optional[List[str]] = None,
+        previous: Optional["PortfolioAnalyzer"] = None,
     ):
         """
         Fit yield-duration curves for each sector using the specified model.
@@ -243,18 +548,42 @@ class PortfolioAnalyzer:
         Args:
             min_samples: Minimum bonds required to fit a curve
             sectors: Specific sectors to fit (None = all)
+            previous: Fitted analyzer whose curves are reused for sectors
+                with identical Duration/Yield data (only changed sectors are refit)
 
         Returns:
             Dictionary mapping sector names to result objects
         """
         if sectors is None:
-            sectors = self.df["Sector_L1"].unique()
+            sectors = self.sectors
 
         self._regression_results = {}
         self._nelson_siegel_results = {}
+        self._sector_signatures = {}
+        self._curve_points_cache = {}
+
+        results = self._nelson_siegel_results if self.model_type == "nelson_siegel" else self._regression_results
+        previous_results = {}
+        if previous is not None and previous._is_fitted and previous.model_type == self.model_type:
+            previous_results = previous.get_regression_results()
+
+        # Partition once by sector; each sector frame is a positional take
+        sector_positions = self.df.groupby("Sector_L1", observed=True, sort=False).indices
+        no_rows = np.array([], dtype=np.intp)
+
+        # Sectors needing a fit are collected and solved together after the loop
+        pending_quadratic: Dict[str, np.ndarray] = {}
+        pending_nelson_siegel: Dict[str, pd.DataFrame] = {}
 
         for sector in sectors:
-            sector_df = self.df[self.df["Sector_L1"] == sector]
+            sector_df = self.df.take(sector_positions.get(sector, no_rows))
+
+            # Signature of the fit inputs; an unchanged sector reuses its previous curve
+            signature = hash((min_samples, sector_df[["Duration", "Yield"]].to_numpy().tobytes()))
+            self._sector_signatures[sector] = signature
+            if sector in previous_results and previous._sector_signatures.get(sector) == signature:
+                results[sector] = previous_results[sector]
+                continue
 
             if len(sector_df) < min_samples:
                 logger.warning(
@@ -264,13 +593,23 @@ class PortfolioAnalyzer:
                 continue
 
             if self.model_type == "nelson_siegel":
-                result = self._fit_nelson_siegel_curve(sector, sector_df)
-                if result is not None:
-                    self._nelson_siegel_results[sector] = result
+                pending_nelson_siegel[sector] = sector_df
             else:  # quadratic
-                result = self._fit_single_curve(sector, sector_df)
-                if result is not None:
-                    self._regression_results[sector] = result
+                pending_quadratic[sector] = sector_positions.get(sector, no_rows)
+
+        if pending_quadratic or pending_nelson_siegel:
+            if pending_quadratic:
+                results.update(self._fit_quadratic_curves(pending_quadratic))
+            else:
+                # Changed sectors warm-start from the previous analyzer's curve, if any
+                warm_starts = {
+                    sector: previous_results[sector] for sector in pending_nelson_siegel if sector in previous_results
+                }
+                results.update(self._fit_nelson_siegel_curves(pending_nelson_siegel, warm_starts))
+            # Keep results in sector order, with reused curves in their usual place
+            ordered = {sector: results[sector] for sector in sectors if sector in results}
+            results.clear()
+            results.update(ordered)
 
         # Calculate Z-scores after fitting
         self._calculate_z_scores()
@@ -281,158 +620,166 @@ class PortfolioAnalyzer:
 
         return self._nelson_siegel_results if self.model_type == "nelson_siegel" else self._regression_results
 
-    def _fit_single_curve(
+    def _fit_quadratic_curves(
         self,
-        sector: str,
-        sector_df: pd.DataFrame,
-    ) -> Optional[RegressionResult]:
-        """Fit a single sector curve."""
-        # Extract clean data
-        mask = sector_df["Duration"].notna() & sector_df["Yield"].notna()
-        clean_df = sector_df[mask]
-
-        if len(clean_df) < MIN_SAMPLES_FOR_REGRESSION:
-            return None
+        sector_positions: Dict[str, np.ndarray],
+    ) -> Dict[str, RegressionResult]:
+        """
+        Fit quadratic curves for several sectors in one batched solve.
 
-        x = clean_df["Duration"].values
-        y = clean_df["Yield"].values
+        Per-sector normal equations are accumulated with np.bincount over
+        durations centred on each sector's mean (for conditioning), and the
+        stacked 3x3 systems are solved in a single call.
+        """
+        duration = self.df["Duration"].to_numpy(dtype=np.float64)
+        yields = self.df["Yield"].to_numpy(dtype=np.float64)
+
+        # Drop rows with missing inputs; sectors left with too few bonds are skipped
+        sectors, chunks = [], []
+        for sector, positions in sector_positions.items():
+            positions = positions[~(np.isnan(duration[positions]) | np.isnan(yields[positions]))]
+            if len(positions) >= MIN_SAMPLES_FOR_REGRESSION:
+                sectors.append(sector)
+                chunks.append(positions)
+
+        if not sectors:
+            return {}
+
+        counts = np.array([len(chunk) for chunk in chunks])
+        rows = np.concatenate(chunks)
+        codes = np.repeat(np.arange(len(sectors)), counts)
+        x = duration[rows]
+        y = yields[rows]
+
+        def group_sum(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(codes, weights=weights, minlength=len(sectors))
+
+        x_mean = group_sum(x) / counts
+        y_mean = group_sum(y) / counts
+        xc = x - x_mean[codes]
+        xc2 = xc * xc
+
+        # Normal equations for y = a'·xc² + b'·xc + c', one 3x3 system per sector
+        s1, s2, s3, s4 = group_sum(xc), group_sum(xc2), group_sum(xc2 * xc), group_sum(xc2 * xc2)
+        xtx = np.array([
+            [s4, s3, s2],
+            [s3, s2, s1],
+            [s2, s1, counts.astype(np.float64)],
+        ]).transpose(2, 0, 1)
+        xty = np.array([group_sum(xc2 * y), group_sum(xc * y), group_sum(y)]).T[..., None]
 
         try:
-            # Fit quadratic: y = ax² + bx + c
-            coeffs = np.polyfit(x, y, deg=2)
-            a, b, c = coeffs
-
-            # Calculate R-squared
-            y_pred = np.polyval(coeffs, x)
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+            coeffs = np.linalg.solve(xtx, xty)[..., 0]
+        except np.linalg.LinAlgError:
+            # Degenerate sector (e.g. a single distinct duration): least-norm solution
+            coeffs = (np.linalg.pinv(xtx) @ xty)[..., 0]
+        a, b_c, c_c = coeffs.T
+
+        # Goodness of fit and duration range per sector, in one pass over the grouped rows
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ss_res, ss_tot, residual_sum, x_min, x_max = _quadratic_fit_stats(
+            x, xc, y, y_mean, a, b_c, c_c, starts, counts
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_squared = np.where(ss_tot > 0, 1 - ss_res / ss_tot, 0.0)
+        # Residual standard deviation from SS_res: var = SS_res/N - mean²
+        residual_mean = residual_sum / counts
+        residual_std = np.sqrt(np.maximum(ss_res / counts - residual_mean ** 2, 0.0))
 
-            # Calculate residual standard deviation
-            residuals = y - y_pred
-            residual_std = np.std(residuals)
+        # Undo the centring: a·x² + b·x + c with x = xc + mean
+        b = b_c - 2 * a * x_mean
+        c = c_c - b_c * x_mean + a * x_mean ** 2
 
-            return RegressionResult(
+        return {
+            sector: RegressionResult(
                 sector=sector,
-                coefficients=(a, b, c),
-                r_squared=r_squared,
-                sample_count=len(clean_df),
-                duration_range=(x.min(), x.max()),
-                residual_std=residual_std,
+                coefficients=(float(a[i]), float(b[i]), float(c[i])),
+                r_squared=float(r_squared[i]),
+                sample_count=int(counts[i]),
+                duration_range=(float(x_min[i]), float(x_max[i])),
+                residual_std=float(residual_std[i]),
             )
+            for i, sector in enumerate(sectors)
+        }
 
-        except Exception as e:
-            logger.error(f"Failed to fit curve for sector '{sector}': {e}")
-            return None
-
-    def _fit_nelson_siegel_curve(
+    def _fit_nelson_siegel_curves(
         self,
-        sector: str,
-        sector_df: pd.DataFrame,
-    ) -> Optional[NelsonSiegelResult]:
+        sector_frames: Dict[str, pd.DataFrame],
+        warm_starts: Optional[Dict[str, NelsonSiegelResult]] = None,
+    ) -> Dict[str, NelsonSiegelResult]:
         """
-        Fit a Nelson-Siegel curve for a single sector.
+        Fit Nelson-Siegel curves for several sectors.
 
-        Uses scipy.optimize.curve_fit to calibrate the four parameters:
-        β₀, β₁, β₂, λ
+        Each sector's clean Duration/Yield arrays are handed to
+        _fit_nelson_siegel_arrays, in a joblib process pool when joblib is
+        installed and there are enough sectors, otherwise one after another.
+        ``warm_starts`` maps sectors to curves from an explicitly passed
+        previous fit; nothing is carried over between analyzers otherwise.
         """
-        # Extract clean data
-        mask = sector_df["Duration"].notna() & sector_df["Yield"].notna()
-        clean_df = sector_df[mask]
-
-        if len(clean_df) < MIN_SAMPLES_FOR_REGRESSION:
-            return None
-
-        x = clean_df["Duration"].values
-        y = clean_df["Yield"].values
-
-        try:
-            # Initial parameter guesses
-            # β₀: use mean yield as proxy for long-term level
-            # β₁: use difference between short and long yields
-            # β₂: curvature, start with small value
-            # λ: decay parameter, typically around mean duration
-            y_mean = np.mean(y)
-            y_first = y[np.argmin(x)] if len(x) > 0 else y_mean
-            y_last = y[np.argmax(x)] if len(x) > 0 else y_mean
-
-            p0 = [
-                y_mean,              # β₀
-                y_first - y_mean,    # β₁
-                0.01,                # β₂
-                max(np.mean(x), 1.0) # λ (ensure positive)
-            ]
-
-            # Parameter bounds (all yields in decimal, e.g., 0.05 = 5%)
-            bounds = (
-                [-0.5, -0.5, -0.5, 0.1],      # lower bounds
-                [0.5, 0.5, 0.5, 50.0]         # upper bounds
-            )
-
-            # Fit using curve_fit
-            params, _ = curve_fit(
-                nelson_siegel,
-                x,
-                y,
-                p0=p0,
-                bounds=bounds,
-                maxfev=5000,
-            )
-
-            beta_0, beta_1, beta_2, lambda_ = params
-
-            # Calculate R-squared
-            y_pred = nelson_siegel(x, beta_0, beta_1, beta_2, lambda_)
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2)
-            r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
-
-            # Calculate residual standard deviation
-            residuals = y - y_pred
-            residual_std = np.std(residuals)
-
-            return NelsonSiegelResult(
-                sector=sector,
-                beta_0=beta_0,
-                beta_1=beta_1,
-                beta_2=beta_2,
-                lambda_=lambda_,
-                r_squared=r_squared,
-                sample_count=len(clean_df),
-                duration_range=(x.min(), x.max()),
-                residual_std=residual_std,
+        warm_starts = warm_starts or {}
+        tasks = []
+        for sector, sector_df in sector_frames.items():
+            # Extract clean data (drop rows missing either value, on the raw arrays)
+            x = sector_df["Duration"].to_numpy(dtype=np.float64)
+            y = sector_df["Yield"].to_numpy(dtype=np.float64)
+            valid = ~(np.isnan(x) | np.isnan(y))
+            if valid.sum() >= MIN_SAMPLES_FOR_REGRESSION:
+                warm = warm_starts.get(sector)
+                p0 = None if warm is None else np.array([warm.beta_0, warm.beta_1, warm.beta_2, warm.lambda_])
+                tasks.append((sector, x[valid], y[valid], p0))
+
+        if Parallel is not None and len(tasks) >= NS_PARALLEL_MIN_SECTORS:
+            fitted = Parallel(n_jobs=-1, prefer="processes", batch_size="auto")(
+                delayed(_fit_nelson_siegel_arrays)(*task) for task in tasks
             )
+        else:
+            fitted = [_fit_nelson_siegel_arrays(*task) for task in tasks]
 
-        except Exception as e:
-            logger.error(f"Failed to fit Nelson-Siegel curve for sector '{sector}': {e}")
-            return None
+        return {result.sector: result for result in fitted if result is not None}
 
     def _calculate_z_scores(self) -> None:
         """Calculate Z-scores for all bonds based on fitted curves."""
-        self.df["Model_Yield"] = np.nan
-        self.df["Residual"] = np.nan
-        self.df["Z_Score"] = np.nan
+        duration = self.df["Duration"].to_numpy(dtype=np.float64)
+        actual_yield = self.df["Yield"].to_numpy(dtype=np.float64)
 
         # Choose the appropriate results dict based on model type
         results = self._nelson_siegel_results if self.model_type == "nelson_siegel" else self._regression_results
 
-        for sector, result in results.items():
-            mask = self.df["Sector_L1"] == sector
-
-            # Calculate model yield
-            duration = self.df.loc[mask, "Duration"].values
-            model_yield = result.predict(duration)
-            self.df.loc[mask, "Model_Yield"] = model_yield
+        # Per-sector parameter table indexed by the precomputed sector codes: one row
+        # per category plus a trailing slot for NaN sectors (code -1). Sectors without
+        # a fitted curve keep NaN parameters, so every row is evaluated unmasked.
+        if self.model_type == "nelson_siegel":
+            params = np.array(
+                [(r.beta_0, r.beta_1, r.beta_2, r.lambda_, r.residual_std) for r in results.values()],
+                dtype=np.float64,
+            ).reshape(-1, 5)
+        else:
+            params = np.array(
+                [(*r.coefficients, r.residual_std) for r in results.values()],
+                dtype=np.float64,
+            ).reshape(-1, 4)
+        table = np.full((len(self._sector_codes.categories) + 1, params.shape[1]), np.nan)
+        category_index = self._sector_codes.categories.get_indexer(list(results))
+        present = category_index >= 0
+        table[category_index[present]] = params[present]
+
+        # Gather each row's curve parameters and evaluate every row in one pass
+        row_params = table[self._sector_codes.codes].T
+        if self.model_type == "nelson_siegel":
+            model_yield = nelson_siegel(duration, *row_params[:4])
+        else:
+            a, b, c = row_params[:3]
+            model_yield = (a * duration + b) * duration + c
+        residual_std = row_params[-1]
 
-            # Calculate residuals
-            actual_yield = self.df.loc[mask, "Yield"].values
-            residuals = actual_yield - model_yield
-            self.df.loc[mask, "Residual"] = residuals
+        # Calculate residuals and Z-scores (standardized residuals; NaN where σ is 0)
+        residuals = actual_yield - model_yield
+        z_scores = residuals / np.where(residual_std > 0, residual_std, np.nan)
 
-            # Calculate Z-scores (standardized residuals)
-            if result.residual_std > 0:
-                z_scores = residuals / result.residual_std
-                self.df.loc[mask, "Z_Score"] = z_scores
+        self.df["Model_Yield"] = model_yield
+        self.df["Residual"] = residuals
+        self.df["Z_Score"] = z_scores
+        self._df_version += 1
 
     def get_regression_results(self):
         """Get fitted regression results by sector."""
@@ -461,11 +808,17 @@ class PortfolioAnalyzer:
         if sector not in results:
             raise ValueError(f"No curve fitted for sector '{sector}'")
 
-        result = results[sector]
-        x = np.linspace(result.duration_range[0], result.duration_range[1], n_points)
-        y = result.predict(x)
+        key = (sector, n_points)
+        if key not in self._curve_points_cache:
+            result = results[sector]
+            x = np.linspace(result.duration_range[0], result.duration_range[1], n_points)
+            y = result.predict(x)
+            # Shared between callers, so keep the cached arrays read-only
+            x.flags.writeable = False
+            y.flags.writeable = False
+            self._curve_points_cache[key] = (x, y)
 
-        return x, y
+        return self._curve_points_cache[key]
 
     def calculate_total_return_analysis(
         self,
@@ -492,12 +845,12 @@ class PortfolioAnalyzer:
             raise ValueError("Must call fit_sector_curves() first")
 
         # Get bond data
-        bond_mask = self.df["Ticker"] == ticker
-        if not bond_mask.any():
+        positions = np.flatnonzero((self.df["Ticker"] == ticker).to_numpy(dtype=bool, na_value=False))
+        if len(positions) == 0:
             logger.warning(f"Ticker '{ticker}' not found in portfolio")
             return None
 
-        bond = self.df[bond_mask].iloc[0]
+        bond = self.df.iloc[positions[0]]
         sector = bond["Sector_L1"]
 
         # Choose the appropriate results dict
@@ -518,9 +871,10 @@ class PortfolioAnalyzer:
         # Calculate rolled duration (duration after holding period)
         rolled_duration = max(current_duration - holding_period, 0.1)
 
-        # Get model yields at current and rolled durations
-        current_model_yield = float(curve_result.predict(np.array([current_duration]))[0])
-        rolled_model_yield = float(curve_result.predict(np.array([rolled_duration]))[0])
+        # Get model yields at current and rolled durations in one evaluation
+        current_model_yield, rolled_model_yield = curve_result.predict(
+            np.array([current_duration, rolled_duration], dtype=np.float64)
+        ).tolist()
 
         # Calculate rolldown effect
         # Rolldown yield change: negative if curve is upward sloping (yield decreases)
@@ -559,6 +913,40 @@ class PortfolioAnalyzer:
             breakeven_spread_bps=breakeven_spread_bps,
         )
 
+    def _row_flags(self) -> np.ndarray:
+        """
+        Per-row uint8 bit flags for the default candidate screens.
+
+        One byte per bond packs tradeability, negative carry and the default
+        rich/cheap Z-score tests, so the screens combine as a single bitwise
+        test. Cached until the data changes (e.g. a refit).
+        """
+        if self._flags_cache is not None and self._flags_cache[0] == self._df_version:
+            return self._flags_cache[1]
+
+        flags = np.zeros(len(self.df), dtype=np.uint8)
+        bits = [
+            (FLAG_TRADEABLE, self.df["Is_Tradeable"].to_numpy(dtype=bool)),
+            (FLAG_BLEEDING, self.df["Net_Carry"].to_numpy() < 0),
+        ]
+        if "Z_Score" in self.df.columns:
+            z = self.df["Z_Score"].to_numpy()
+            bits += [
+                (FLAG_RICH, z < Z_SCORE_THRESHOLDS["rich"]),
+                (FLAG_CHEAP, z > Z_SCORE_THRESHOLDS["cheap"]),
+            ]
+        for flag, condition in bits:
+            np.bitwise_or(flags, flag, out=flags, where=condition)
+
+        self._flags_cache = (self._df_version, flags)
+        return flags
+
+    def _flag_mask(self, required: int) -> np.ndarray:
+        """Boolean row mask of bonds with every flag bit in ``required`` set."""
+        if not required:
+            return np.ones(len(self.df), dtype=bool)
+        return (self._row_flags() & required) == required
+
     def get_sell_candidates(
         self,
         z_threshold: float = -1.5,
@@ -579,17 +967,27 @@ class PortfolioAnalyzer:
         if not self._is_fitted:
             raise ValueError("Must call fit_sector_curves() first")
 
-        mask = self.df["Z_Score"] < z_threshold
+        z = self.df["Z_Score"].to_numpy()
 
-        if max_net_carry is not None:
-            mask &= self.df["Net_Carry"] < max_net_carry
+        # Default thresholds are answered from the precomputed row flags
+        required = FLAG_TRADEABLE if exclude_htm else 0
+        if z_threshold == Z_SCORE_THRESHOLDS["rich"]:
+            required |= FLAG_RICH
+        if max_net_carry == 0:
+            required |= FLAG_BLEEDING
+        mask = self._flag_mask(required)
 
-        if exclude_htm:
-            mask &= self.df["Is_Tradeable"]
+        if z_threshold != Z_SCORE_THRESHOLDS["rich"]:
+            mask &= z < z_threshold
+
+        if max_net_carry is not None and max_net_carry != 0:
+            mask &= self.df["Net_Carry"].to_numpy() < max_net_carry
 
-        candidates = self.df[mask].copy()
+        # Order the selected positions by Z-score, then take the rows once
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(z[rows], kind="stable")]
 
-        return candidates.sort_values("Z_Score").reset_index(drop=True)
+        return self.df.take(rows).reset_index(drop=True)
 
     def get_bleeding_assets(self, exclude_htm: bool = True) -> pd.DataFrame:
         """
@@ -604,12 +1002,13 @@ class PortfolioAnalyzer:
         Returns:
             DataFrame of negative carry bonds
         """
-        mask = self.df["Net_Carry"] < 0
+        net_carry = self.df["Net_Carry"].to_numpy()
+        mask = self._flag_mask((FLAG_BLEEDING | FLAG_TRADEABLE) if exclude_htm else FLAG_BLEEDING)
 
-        if exclude_htm:
-            mask &= self.df["Is_Tradeable"]
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(net_carry[rows], kind="stable")]
 
-        return self.df[mask].sort_values("Net_Carry").reset_index(drop=True)
+        return self.df.take(rows).reset_index(drop=True)
 
     def get_buy_candidates(
         self,
@@ -631,116 +1030,122 @@ class PortfolioAnalyzer:
         if not self._is_fitted:
             raise ValueError("Must call fit_sector_curves() first")
 
-        mask = self.df["Z_Score"] > z_threshold
-        mask &= self.df["Liquidity_Proxy"] >= min_liquidity
+        z = self.df["Z_Score"].to_numpy()
+        if z_threshold == Z_SCORE_THRESHOLDS["cheap"]:
+            mask = self._flag_mask(FLAG_CHEAP)
+        else:
+            mask = z > z_threshold
+        mask &= self.df["Liquidity_Proxy"].to_numpy() >= min_liquidity
 
         if min_net_carry is not None:
-            mask &= self.df["Net_Carry"] > min_net_carry
+            mask &= self.df["Net_Carry"].to_numpy() > min_net_carry
 
-        candidates = self.df[mask].copy()
+        # Cheapest first
+        rows = np.flatnonzero(mask)
+        rows = rows[np.argsort(-z[rows], kind="stable")]
 
-        return candidates.sort_values("Z_Score", ascending=False).reset_index(drop=True)
+        return self.df.take(rows).reset_index(drop=True)
 
     def calculate_portfolio_metrics(self) -> PortfolioMetrics:
-        """Calculate aggregate portfolio metrics."""
-        df = self.df
-        total_aum = df["Nominal_USD"].sum()
+        """Calculate aggregate portfolio metrics (cached until the data changes)."""
+        if self._metrics_cache is not None and self._metrics_cache[0] == self._df_version:
+            return self._metrics_cache[1]
 
-        # Weighted calculations
-        def weighted_avg(col):
-            return (df[col] * df["Nominal_USD"]).sum() / total_aum if total_aum > 0 else 0
+        df = self.df
+        nominal = df["Nominal_USD"].to_numpy(dtype=np.float64)
+        total_aum = nominal.sum()
 
-        # Sector exposures
-        sector_exposures = (
-            df.groupby("Sector_L1")["Nominal_USD"]
-            .sum()
-            .sort_values(ascending=False)
-            .to_dict()
-        )
+        # Weighted duration, yield and carry in one matrix-vector product
+        weighted_sums = nominal @ df[["Duration", "Yield", "Net_Carry"]].to_numpy(dtype=np.float64)
+        if total_aum > 0:
+            weighted_duration, weighted_yield, weighted_net_carry = (weighted_sums / total_aum).tolist()
+        else:
+            weighted_duration = weighted_yield = weighted_net_carry = 0
 
-        # Accounting breakdown
-        accounting_breakdown = (
-            df.groupby("Accounting")["Nominal_USD"]
+        # Sector x accounting exposure grid from one grouped pass, then marginalized
+        exposure_grid = (
+            df.groupby(["Sector_L1", "Accounting"], observed=True)["Nominal_USD"]
             .sum()
-            .sort_values(ascending=False)
-            .to_dict()
+            .unstack(fill_value=0)
         )
+        sector_exposures = exposure_grid.sum(axis=1).sort_values(ascending=False).to_dict()
+        accounting_totals = exposure_grid.sum(axis=0)
+        accounting_breakdown = accounting_totals.sort_values(ascending=False).to_dict()
 
         # Negative carry exposure
-        negative_carry_mask = df["Net_Carry"] < 0
-        negative_carry_exposure = df.loc[negative_carry_mask, "Nominal_USD"].sum()
+        negative_carry_mask = df["Net_Carry"].to_numpy(dtype=np.float64) < 0
+        negative_carry_exposure = np.where(negative_carry_mask, nominal, 0.0).sum()
 
         # HTM exposure
-        htm_mask = df["Accounting"] == "HTM"
-        htim_exposure = df.loc[htm_mask, "Nominal_USD"].sum()
+        htm_mask = (df["Accounting"] == "HTM").to_numpy()
+        htim_exposure = accounting_totals.get("HTM", 0.0)
 
         # Tradeable exposure
-        tradeable_exposure = df.loc[df["Is_Tradeable"], "Nominal_USD"].sum()
+        tradeable_mask = df["Is_Tradeable"].to_numpy(dtype=bool)
+        tradeable_exposure = np.where(tradeable_mask, nominal, 0.0).sum()
 
-        return PortfolioMetrics(
+        metrics = PortfolioMetrics(
             total_aum=total_aum,
-            weighted_duration=weighted_avg("Duration"),
-            weighted_yield=weighted_avg("Yield"),
-            weighted_net_carry=weighted_avg("Net_Carry"),
+            weighted_duration=weighted_duration,
+            weighted_yield=weighted_yield,
+            weighted_net_carry=weighted_net_carry,
             negative_carry_count=negative_carry_mask.sum(),
             negative_carry_exposure=negative_carry_exposure,
             htim_count=htm_mask.sum(),
             htm_exposure=htim_exposure,
-            tradeable_count=df["Is_Tradeable"].sum(),
+            tradeable_count=tradeable_mask.sum(),
             tradeable_exposure=tradeable_exposure,
             sector_exposures=sector_exposures,
             accounting_breakdown=accounting_breakdown,
         )
+        self._metrics_cache = (self._df_version, metrics)
+
+        return metrics
+
+    def _sector_stats(self) -> pd.DataFrame:
+        """Unrounded per-sector aggregates (cached until the data changes)."""
+        if self._sector_summary_cache is not None and self._sector_summary_cache[0] == self._df_version:
+            return self._sector_summary_cache[1]
+
+        # Named aggregations: one grouped pass, flat column names, no MultiIndex to rename
+        stats = self.df.groupby("Sector_L1", observed=True).agg(
+            Total_Exposure=("Nominal_USD", "sum"),
+            Count=("Nominal_USD", "count"),
+            Avg_Duration=("Duration", "mean"),
+            Avg_Yield=("Yield", "mean"),
+            Avg_Net_Carry=("Net_Carry", "mean"),
+            Avg_Z_Score=("Z_Score", "mean"),
+            Z_Score_Std=("Z_Score", "std"),
+        )
+
+        self._sector_summary_cache = (self._df_version, stats)
+        return stats
 
     def get_sector_summary(self) -> pd.DataFrame:
         """Get summary statistics by sector."""
         if not self._is_fitted:
             self.fit_sector_curves()
 
-        summary = (
-            self.df.groupby("Sector_L1")
-            .agg(
-                {
-                    "Nominal_USD": ["sum", "count"],
-                    "Duration": "mean",
-                    "Yield": "mean",
-                    "Net_Carry": "mean",
-                    "Z_Score": ["mean", "std"],
-                }
-            )
-            .round(4)
-        )
-
-        # Flatten column names
-        summary.columns = [
-            "Total_Exposure",
-            "Count",
-            "Avg_Duration",
-            "Avg_Yield",
-            "Avg_Net_Carry",
-            "Avg_Z_Score",
-            "Z_Score_Std",
-        ]
+        summary = self._sector_stats().round(4)
 
         return summary.sort_values("Total_Exposure", ascending=False)
 
     def generate_executive_summary(self) -> str:
         """
-        Generate a markdown executive summary for management.
+        Generate a markdown executive summary for management (cached until the data changes).
 
         Returns:
             Markdown formatted summary
         """
+        if self._summary_cache is not None and self._summary_cache[0] == self._df_version:
+            return self._summary_cache[1]
+
         metrics = self.calculate_portfolio_metrics()
-        sector_summary = self.get_sector_summary()
-
-        # Find richest sectors (negative avg Z-score)
-        richest_sectors = (
-            self.df.groupby("Sector_L1")["Z_Score"]
-            .mean()
-            .sort_values()
-            .head(3)
-        )
+        if not self._is_fitted:
+            self.fit_sector_curves()
+
+        # Find richest sectors (negative avg Z-score), reusing the cached sector aggregates
+        richest_sectors = self._sector_stats()["Avg_Z_Score"].nsmallest(3)
 
         # Format AUM
         def format_usd(value):
@@ -751,7 +1156,8 @@ class PortfolioAnalyzer:
             else:
                 return f"${value:,.0f}"
 
-        summary = f"""
+        # Assemble the report from a list of parts, joined once at the end
+        parts = [f"""
 ## Portfolio Executive Summary
 
 ### Overview
@@ -774,16 +1180,21 @@ Sectors with negative average Z-scores are trading expensive relative to their c
 
 | Sector | Avg Z-Score | Interpretation |
 |--------|-------------|----------------|
-"""
-        for sector, z in richest_sectors.items():
-            interpretation = "Very Rich" if z < -1 else "Moderately Rich" if z < -0.5 else "Slightly Rich"
-            summary += f"| {sector} | {z:.2f} | {interpretation} |\n"
+"""]
+
+        # Interpretation buckets: z < -1, -1 <= z < -0.5, otherwise
+        interpretations = RICHNESS_LABELS[np.digitize(richest_sectors.to_numpy(), RICHNESS_BREAKS)]
+        parts.extend(
+            f"| {sector} | {z:.2f} | {interpretation} |\n"
+            for sector, z, interpretation in zip(richest_sectors.index, richest_sectors.to_numpy(), interpretations)
+        )
 
-        # Liquidity profile
-        high_liq = (self.df["Liquidity_Proxy"] >= 5).sum()
-        low_liq = (self.df["Liquidity_Proxy"] < 5).sum()
+        # Liquidity profile (one comparison pass; the rest are lower liquidity)
+        liquidity = self.df["Liquidity_Proxy"].to_numpy()
+        high_liq = int((liquidity >= 5).sum())
+        low_liq = len(liquidity) - high_liq
 
-        summary += f"""
+        parts.append(f"""
 ### Liquidity Profile
 - **High Liquidity (Score ≥ 5):** {high_liq} bonds ({high_liq/len(self.df)*100:.1f}%)
 - **Lower Liquidity (Score < 5):** {low_liq} bonds ({low_liq/len(self.df)*100:.1f}%)
@@ -791,15 +1202,18 @@ Sectors with negative average Z-scores are trading expensive relative to their c
 ### Sector Allocation
 | Sector | Exposure | % of Portfolio |
 |--------|----------|----------------|
-"""
-        for sector, exposure in list(metrics.sector_exposures.items())[:5]:
-            pct = exposure / metrics.total_aum * 100
-            summary += f"| {sector} | {format_usd(exposure)} | {pct:.1f}% |\n"
+""")
+        parts.extend(
+            f"| {sector} | {format_usd(exposure)} | {exposure / metrics.total_aum * 100:.1f}% |\n"
+            for sector, exposure in list(metrics.sector_exposures.items())[:5]
+        )
 
-        summary += """
+        parts.append("""
 ---
 *Report generated by Alpha-One Credit Cockpit*
-"""
+""")
+        summary = "".join(parts)
+        self._summary_cache = (self._df_version, summary)
         return summary
 
     def get_filtered_data(
@@ -819,22 +1233,30 @@ Sectors with negative average Z-scores are trading expensive relative to their c
         Returns:
             Filtered DataFrame
         """
-        mask = pd.Series([True] * len(self.df), index=self.df.index)
+        # Combine the criteria as plain boolean arrays, then take the rows in one pass
+        mask = self.df["Liquidity_Proxy"].to_numpy() >= min_liquidity
 
         if exclude_htm:
-            mask &= self.df["Is_Tradeable"]
+            mask &= self._flag_mask(FLAG_TRADEABLE)
 
         if sectors:
-            mask &= self.df["Sector_L1"].isin(sectors)
+            wanted = self._sector_codes.categories.get_indexer(sectors)
+            mask &= np.isin(self._sector_codes.codes, wanted[wanted >= 0])
 
-        mask &= self.df["Liquidity_Proxy"] >= min_liquidity
+        # Nothing filtered out: a block copy is cheaper than gathering every row
+        if mask.all():
+            return self.df.copy()
 
-        return self.df[mask].copy()
+        return self.df.take(np.flatnonzero(mask))
 
     @property
     def sectors(self) -> List[str]:
-        """Get list of unique sectors."""
-        return self.df["Sector_L1"].unique().tolist()
+        """Get list of unique sectors (in order of appearance)."""
+        if self._sectors_cache is None:
+            # Unique integer codes rather than hashed labels; unobserved categories are skipped
+            codes = self._sector_codes.codes
+            self._sectors_cache = self._sector_codes.categories.take(pd.unique(codes[codes >= 0])).tolist()
+        return list(self._sectors_cache)
 
     def get_color_for_sector(self, sector: str) -> str:
         """Get consistent color for a sector."""
@@ -5,26 +5,58 @@ Handles ingestion and cleaning of messy, bilingual portfolio data.
 Transforms raw CSV exports into clean, analysis-ready DataFrames.
 """
 
+import hashlib
+import io
 import logging
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+try:
+    from numba import njit
+except ImportError:  # Optional accelerator; fall back to NumPy
+    njit = None
+
+try:
+    import polars as pl
+except ImportError:  # Optional; string columns are then parsed with pandas
+    pl = None
 
 from ..utils.constants import (
     COLUMN_MAPPING,
     REQUIRED_COLUMNS,
+    REQUIRED_COLUMNS_ORDERED,
     DEFAULT_FTP,
     LIQUIDITY_THRESHOLD,
     LIQUIDITY_HIGH,
     LIQUIDITY_LOW,
     NON_TRADEABLE_ACCOUNTING,
+    CATEGORICAL_COLUMNS,
+    ARROW_STRING_COLUMNS,
+    MONEY_COLUMNS,
+    FLOAT32_EXACT_LIMIT,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pinned Arrow types for raw CSV columns. Rate columns are left to inference so
+# numeric and "%"-suffixed exports keep their distinct parsing rules, and OAS so
+# whole-bp spreads stay integer.
+RAW_COLUMN_TYPES = {
+    "分类1": pa.string(),
+    "分类2": pa.string(),
+    "TICKER": pa.string(),
+    "债券名称": pa.string(),
+    "AccSection": pa.string(),
+    "Nominal（USD）": pa.string(),
+    "Duration": pa.float64(),
+}
+
 
 class DataValidationError(Exception):
     """Raised when data validation fails."""
@@ -68,6 +100,168 @@ class DataQualityReport:
         )
 
 
+# Python's Unicode ``\s`` spelled out for the native regex engines (Arrow's RE2 and
+# Polars' Rust regex), whose ``\s`` misses full-width and other non-ASCII spaces.
+# Not a raw string: every code point reaches the engine as a literal character, so
+# the class means the same to Python ``re`` (pandas' python string storage) too.
+WHITESPACE_CLASS = "\t-\r\x1c-\x1f\x85 \xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+
+# Thousands separators, currency symbol and whitespace in nominal amounts
+NOMINAL_STRIP_PATTERN = f"[,${WHITESPACE_CLASS}]"
+
+# Percent signs and whitespace in yield/FTP rates
+RATE_STRIP_PATTERN = f"[%{WHITESPACE_CLASS}]"
+
+# Below this many rows the pandas -> Polars round trip costs more than the string parse
+POLARS_MIN_ROWS = 20_000
+
+
+def _to_float(values: pd.Series) -> pd.Series:
+    """Convert cleaned strings to float64; unparseable entries become NaN."""
+    return pd.to_numeric(values, errors="coerce").astype(np.float64)
+
+
+def _strings_to_float(values: pd.Series, pattern: str, negate_parens: bool = False) -> pd.Series:
+    """
+    Parse a text column to float64 after removing ``pattern`` in one regex pass.
+
+    The string pattern keeps pandas' ``str.replace`` inside Arrow's native regex
+    engine; a compiled ``re.Pattern`` would be applied cell by cell in Python.
+
+    With ``negate_parens``, accounting-style "(123)" becomes -123. Large
+    columns run through Polars when it is installed.
+    """
+    if pl is not None and len(values) >= POLARS_MIN_ROWS:
+        return _strings_to_float_polars(values, pattern, negate_parens)
+
+    s = values.astype("string").str.replace(pattern, "", regex=True)
+    if negate_parens:
+        paren = (s.str.startswith("(") & s.str.endswith(")")).fillna(False)
+        s = s.mask(paren, "-" + s.str.slice(1, -1))
+    return _to_float(s)
+
+
+def _strings_to_float_polars(values: pd.Series, pattern: str, negate_parens: bool) -> pd.Series:
+    """Polars (multi-threaded, Arrow-native) equivalent of ``_strings_to_float``."""
+    text = pl.col("text").str.replace_all(pattern, "")
+    if negate_parens:
+        paren = text.str.starts_with("(") & text.str.ends_with(")")
+        text = pl.when(paren).then(pl.lit("-") + text.str.slice(1, text.str.len_chars() - 2)).otherwise(text)
+
+    parsed = (
+        pl.DataFrame({"text": pl.from_arrow(pa.array(values.astype("string")))})
+        .lazy()
+        .select(text.cast(pl.Float64, strict=False))
+        .collect()
+        .to_series()
+    )
+    # Nulls come back as NaN, matching pd.to_numeric(errors="coerce")
+    return pd.Series(parsed.to_numpy(), index=values.index, dtype=np.float64)
+
+
+def _parse_rate(values: pd.Series) -> pd.Series:
+    """
+    Parse a rate column to decimal in one vectorized pass.
+
+    Numeric columns are taken as decimals when < 1 and percentages otherwise;
+    string columns have ``%`` and whitespace removed in one regex pass and are
+    treated as percentages when > 1 (e.g. "4.5%" and "0.045" both become 0.045).
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        rate = values.astype(np.float64)
+        return rate.where(rate < 1, rate / 100)
+
+    rate = _strings_to_float(values, RATE_STRIP_PATTERN)
+    return rate.where(~(rate > 1), rate / 100)
+
+
+if njit is not None:
+
+    # No fastmath: NaN yields, FTPs and durations must propagate exactly as in NumPy.
+    # Serial loop: the parallel threading layer hangs interpreter exit when first
+    # launched from Streamlit's script thread.
+    @njit(cache=True)
+    def _enrich_kernel(nominal, yld, ftp, duration, threshold, high, low):
+        """Fused Liquidity_Proxy, Net_Carry and Carry_Efficiency over float64 arrays."""
+        n = nominal.shape[0]
+        liquidity = np.empty(n, dtype=np.int8)
+        net_carry = np.empty(n, dtype=np.float64)
+        carry_efficiency = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            liquidity[i] = high if nominal[i] > threshold else low
+            carry = yld[i] - ftp[i]
+            net_carry[i] = carry
+            carry_efficiency[i] = carry / duration[i] if duration[i] != 0 else np.nan
+        return liquidity, net_carry, carry_efficiency
+
+else:
+
+    def _enrich_kernel(nominal, yld, ftp, duration, threshold, high, low):
+        """Liquidity_Proxy, Net_Carry and Carry_Efficiency (NumPy fallback)."""
+        net_carry = yld - ftp
+        carry_efficiency = np.divide(net_carry, duration, out=np.full_like(net_carry, np.nan), where=duration != 0)
+        liquidity = np.where(nominal > threshold, np.int8(high), np.int8(low))  # int8 without an int64 temporary
+        return liquidity, net_carry, carry_efficiency
+
+
+def _read_csv(source, encoding: str) -> pd.DataFrame:
+    """
+    Read a CSV with pyarrow's multithreaded parser and the pinned raw schema.
+
+    Raises:
+        UnicodeDecodeError: If the bytes are not valid in ``encoding``
+        pyarrow.ArrowInvalid: If values do not fit the pinned column types
+    """
+    table = pa_csv.read_csv(
+        source,
+        read_options=pa_csv.ReadOptions(encoding=encoding),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=RAW_COLUMN_TYPES,
+            strings_can_be_null=True,
+        ),
+    )
+    # Arrow falls back to binary for undecodable text instead of failing
+    if any(pa.types.is_binary(t) for t in table.schema.types):
+        raise UnicodeDecodeError(encoding, b"", 0, 1, "undecodable bytes in CSV")
+    return table.to_pandas()
+
+
+def _read_csv_with_fallback(data: bytes, encodings: list[str]) -> pd.DataFrame:
+    """
+    Read in-memory CSV bytes trying each encoding in turn.
+
+    The bytes are read once by the caller and every attempt parses them in
+    place through a zero-copy Arrow buffer. pyarrow is tried first; pandas
+    takes over when a file does not fit the pinned schema (e.g. free-text
+    markers in Duration) so such files still load.
+    """
+    buffer = pa.py_buffer(data)
+    for enc in encodings:
+        try:
+            return _read_csv(pa.BufferReader(buffer), enc)
+        except UnicodeDecodeError:
+            continue
+        except pa.ArrowInvalid:
+            pass
+
+        try:
+            return pd.read_csv(io.BytesIO(data), encoding=enc)
+        except UnicodeDecodeError:
+            continue
+
+    raise DataValidationError(
+        f"Could not decode file with encodings: {encodings}"
+    )
+
+
+def _file_version(source: Union[str, Path, pd.DataFrame]) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a file source, or None for an in-memory DataFrame."""
+    if isinstance(source, pd.DataFrame):
+        return None
+    stat = Path(source).stat()
+    return stat.st_size, stat.st_mtime_ns
+
+
 class DataLoader:
     """
     Robust data loader for fixed income portfolio data.
@@ -84,23 +278,42 @@ class DataLoader:
         >>> report = loader.get_quality_report()
     """
 
-    def __init__(self, strict_mode: bool = False):
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        keep_raw: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize the data loader.
 
         Args:
             strict_mode: If True, raise errors on data quality issues.
                         If False, attempt to clean and continue.
+            keep_raw: If True, keep a copy of the raw data from each load.
+                     If False, get_raw_data re-reads it from the source on demand
+                     and returns it only if the file is unchanged since the load.
+            cache_dir: Directory for Parquet copies of parsed CSV files, keyed on
+                      the file's path, size, mtime and the requested encoding.
+                      None (default) disables the cache.
         """
         self.strict_mode = strict_mode
+        self.keep_raw = keep_raw
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self._quality_report: Optional[DataQualityReport] = None
         self._raw_df: Optional[pd.DataFrame] = None
+        self._raw_source: Optional[Union[str, Path, pd.DataFrame]] = None
+        self._raw_encoding = "utf-8"
+        self._raw_version: Optional[Tuple[int, int]] = None
         self._clean_df: Optional[pd.DataFrame] = None
+        # Positions (in the raw rows) of bonds whose FTP was missing and defaulted
+        self._ftp_missing_rows = np.empty(0, dtype=np.intp)
 
     def load(
         self,
         source: Union[str, Path, pd.DataFrame],
         encoding: str = "utf-8",
+        copy: bool = True,
     ) -> pd.DataFrame:
         """
         Load and clean portfolio data from various sources.
@@ -108,6 +321,8 @@ class DataLoader:
         Args:
             source: File path, Path object, or existing DataFrame
             encoding: File encoding (default utf-8, try 'gbk' for Chinese files)
+            copy: If False, a DataFrame source is not deep-copied; cleaning only
+                  replaces whole columns, so the source's values are never written
 
         Returns:
             Cleaned and enriched DataFrame ready for analysis
@@ -118,8 +333,10 @@ class DataLoader:
         self._quality_report = DataQualityReport()
 
         # Step 1: Load raw data
-        df = self._load_raw(source, encoding)
-        self._raw_df = df.copy()
+        df = self._load_raw(source, encoding, copy)
+        self._raw_source, self._raw_encoding = source, encoding
+        self._raw_df = df.copy() if self.keep_raw else None
+        self._raw_version = None if self.keep_raw else _file_version(source)
         self._quality_report.total_rows = len(df)
 
         logger.info(f"Loaded {len(df)} rows from source")
@@ -147,6 +364,9 @@ class DataLoader:
         # Step 7: Final validation and cleanup
         df = self._final_cleanup(df)
 
+        # Step 8: Compact dtypes
+        df = self._optimize_dtypes(df)
+
         self._quality_report.rows_after_cleaning = len(df)
         self._clean_df = df
 
@@ -168,64 +388,102 @@ class DataLoader:
             Cleaned DataFrame
         """
         # Try UTF-8 first, then GBK for Chinese files
-        try:
-            df = pd.read_csv(uploaded_file, encoding="utf-8")
-        except UnicodeDecodeError:
-            uploaded_file.seek(0)  # Reset file pointer
-            df = pd.read_csv(uploaded_file, encoding="gbk")
+        df = _read_csv_with_fallback(uploaded_file.getvalue(), ["utf-8", "gbk"])
 
-        return self.load(df)
+        # Freshly parsed and held by no one else, so skip the defensive copy
+        return self.load(df, copy=False)
 
     def get_quality_report(self) -> Optional[DataQualityReport]:
         """Get the data quality report from the last load operation."""
         return self._quality_report
 
     def get_raw_data(self) -> Optional[pd.DataFrame]:
-        """Get the raw data before cleaning."""
-        return self._raw_df
+        """
+        Get the raw data before cleaning.
+
+        Without ``keep_raw`` the source is re-read: a DataFrame source is copied
+        again, and a file is re-read only if its (size, mtime_ns) is unchanged
+        since the load, otherwise None is returned.
+        """
+        if self._raw_df is not None or self._raw_source is None:
+            return self._raw_df
+
+        try:
+            if _file_version(self._raw_source) != self._raw_version:
+                logger.warning("Raw data source changed since it was loaded; use keep_raw=True to retain it")
+                return None
+            return self._load_raw(self._raw_source, self._raw_encoding)
+        except (OSError, DataValidationError) as e:
+            logger.warning(f"Raw data is no longer available from its source: {e}")
+            return None
 
     def _load_raw(
         self,
         source: Union[str, Path, pd.DataFrame],
         encoding: str,
+        copy: bool = True,
     ) -> pd.DataFrame:
         """Load raw data from source."""
         if isinstance(source, pd.DataFrame):
-            return source.copy()
+            return source.copy(deep=copy)
 
         path = Path(source)
         if not path.exists():
             raise DataValidationError(f"File not found: {path}")
 
+        # Reuse a parsed raw frame cached for this exact file version and encoding
+        cache_path = self._raw_cache_path(path, encoding)
+        if cache_path is not None and cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable raw data cache {cache_path}: {e}")
+
         # Try specified encoding, fall back to alternatives
-        encodings_to_try = [encoding, "gbk", "gb2312", "utf-8-sig"]
+        df = _read_csv_with_fallback(path.read_bytes(), [encoding, "gbk", "gb2312", "utf-8-sig"])
 
-        for enc in encodings_to_try:
+        if cache_path is not None:
             try:
-                return pd.read_csv(path, encoding=enc)
-            except UnicodeDecodeError:
-                continue
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                df.to_parquet(cache_path, compression="snappy")
+                # Drop entries for older versions of the same source file
+                source_prefix = cache_path.name.rsplit("-", 1)[0]
+                for stale in cache_path.parent.glob(f"{source_prefix}-*.parquet"):
+                    if stale != cache_path:
+                        stale.unlink(missing_ok=True)
+            except (ImportError, OSError, ValueError, TypeError) as e:
+                logger.warning(f"Could not write raw data cache {cache_path}: {e}")
 
-        raise DataValidationError(
-            f"Could not decode file with encodings: {encodings_to_try}"
-        )
+        return df
+
+    def _raw_cache_path(self, path: Path, encoding: str) -> Optional[Path]:
+        """
+        Parquet cache file for one version of a CSV source, or None if caching is off.
+
+        Named ``<stem>-<source id>-<version id>.parquet``: the source id hashes the
+        resolved path, the version id hashes (size, mtime_ns, encoding), so a
+        replaced file (even one with an older timestamp) or a different decode
+        never hits a stale entry.
+        """
+        if self.cache_dir is None:
+            return None
+
+        stat = path.stat()
+        source_id = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:12]
+        version_id = hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}:{encoding}".encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{path.stem}-{source_id}-{version_id}.parquet"
 
     def _rename_columns(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply bilingual column mapping."""
-        # Create case-insensitive mapping
-        df_cols = {col.strip(): col for col in df.columns}
-
+        # One pass over the frame's columns; mapping keys have no surrounding whitespace,
+        # so exact and whitespace-padded headers resolve through the same lookup.
+        # Headers already named as their target (e.g. "Duration", "OAS") are left out,
+        # so English exports skip the rename entirely.
         rename_map = {}
-        for source_col, target_col in COLUMN_MAPPING.items():
-            # Try exact match first
-            if source_col in df.columns:
-                rename_map[source_col] = target_col
-            # Try stripped match
-            elif source_col.strip() in df_cols:
-                rename_map[df_cols[source_col.strip()]] = target_col
-            # Check if target already exists (English source)
-            elif target_col in df.columns:
-                pass  # Already named correctly
+        for col in df.columns:
+            target = COLUMN_MAPPING.get(col.strip())
+            if target is not None and target != col:
+                rename_map[col] = target
 
         if rename_map:
             df = df.rename(columns=rename_map)
@@ -235,8 +493,10 @@ class DataLoader:
 
     def _validate_required_columns(self, df: pd.DataFrame) -> None:
         """Validate that required columns exist."""
-        missing = set(REQUIRED_COLUMNS) - set(df.columns)
+        if REQUIRED_COLUMNS.issubset(df.columns):
+            return
 
+        missing = [col for col in REQUIRED_COLUMNS_ORDERED if col not in df.columns]
         if missing:
             available = list(df.columns)
             raise DataValidationError(
@@ -249,27 +509,15 @@ class DataLoader:
         if "Nominal_USD" not in df.columns:
             return df
 
-        def parse_nominal(val):
-            if pd.isna(val):
-                return np.nan
-            if isinstance(val, (int, float)):
-                return float(val)
-
-            # String cleaning
-            s = str(val).strip()
-            s = s.replace(",", "").replace("$", "").replace(" ", "")
-
-            # Handle parentheses as negative (accounting notation)
-            if s.startswith("(") and s.endswith(")"):
-                s = "-" + s[1:-1]
+        original_valid = df["Nominal_USD"].notna().sum()
 
-            try:
-                return float(s)
-            except ValueError:
-                return np.nan
+        if pd.api.types.is_numeric_dtype(df["Nominal_USD"]):
+            df["Nominal_USD"] = df["Nominal_USD"].astype(np.float64)
+        else:
+            # Strip separators/currency/whitespace in one regex pass, then flip
+            # accounting-style "(123)" to "-123"
+            df["Nominal_USD"] = _strings_to_float(df["Nominal_USD"], NOMINAL_STRIP_PATTERN, negate_parens=True)
 
-        original_valid = df["Nominal_USD"].notna().sum()
-        df["Nominal_USD"] = df["Nominal_USD"].apply(parse_nominal)
         new_valid = df["Nominal_USD"].notna().sum()
 
         self._quality_report.nominal_parse_errors = original_valid - new_valid
@@ -281,26 +529,8 @@ class DataLoader:
         if "Yield" not in df.columns:
             return df
 
-        def parse_yield(val):
-            if pd.isna(val):
-                return np.nan
-            if isinstance(val, (int, float)):
-                # Assume already in decimal if < 1, else in percentage
-                return float(val) if val < 1 else float(val) / 100
-
-            s = str(val).strip()
-            s = s.replace("%", "").replace(" ", "")
-
-            try:
-                val_float = float(s)
-                # Convert from percentage to decimal if > 1
-                # (yields above 100% are extremely rare)
-                return val_float / 100 if val_float > 1 else val_float
-            except ValueError:
-                return np.nan
-
         original_valid = df["Yield"].notna().sum()
-        df["Yield"] = df["Yield"].apply(parse_yield)
+        df["Yield"] = _parse_rate(df["Yield"])
         new_valid = df["Yield"].notna().sum()
 
         self._quality_report.yield_parse_errors = original_valid - new_valid
@@ -312,7 +542,9 @@ class DataLoader:
         if "Duration" not in df.columns:
             return df
 
-        df["Duration"] = pd.to_numeric(df["Duration"], errors="coerce")
+        # Already-numeric columns (the usual CSV case) skip coercion entirely
+        if not pd.api.types.is_numeric_dtype(df["Duration"]):
+            df["Duration"] = pd.to_numeric(df["Duration"], errors="coerce")
 
         # Track zero durations (problematic for carry efficiency)
         self._quality_report.duration_zero_count = (df["Duration"] == 0).sum()
@@ -326,41 +558,28 @@ class DataLoader:
             return df
 
         # OAS is typically in basis points
-        df["OAS"] = pd.to_numeric(df["OAS"], errors="coerce")
+        if not pd.api.types.is_numeric_dtype(df["OAS"]):
+            df["OAS"] = pd.to_numeric(df["OAS"], errors="coerce")
 
         return df
 
     def _clean_ftp(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean FTP Rate column: fill NaN with default, flag rows."""
+        """Clean FTP Rate column: fill NaN with default, record the defaulted rows."""
         if "FTP" not in df.columns:
             df["FTP"] = DEFAULT_FTP
-            df["FTP_Missing"] = True
+            self._ftp_missing_rows = np.arange(len(df))
             self._quality_report.ftp_missing_count = len(df)
             return df
 
         # Parse FTP similar to yield
-        def parse_ftp(val):
-            if pd.isna(val):
-                return np.nan
-            if isinstance(val, (int, float)):
-                return float(val) if val < 1 else float(val) / 100
+        df["FTP"] = _parse_rate(df["FTP"])
 
-            s = str(val).strip().replace("%", "")
-            try:
-                val_float = float(s)
-                return val_float / 100 if val_float > 1 else val_float
-            except ValueError:
-                return np.nan
-
-        df["FTP"] = df["FTP"].apply(parse_ftp)
-
-        # Flag and fill missing FTP
-        ftp_missing_mask = df["FTP"].isna()
-        df["FTP_Missing"] = ftp_missing_mask
+        # Keep the positions of missing FTPs (not a full boolean column), then fill
+        self._ftp_missing_rows = np.flatnonzero(df["FTP"].isna().to_numpy())
 
-        self._quality_report.ftp_missing_count = ftp_missing_mask.sum()
+        self._quality_report.ftp_missing_count = len(self._ftp_missing_rows)
         self._quality_report.ftp_missing_tickers = (
-            df.loc[ftp_missing_mask, "Ticker"].tolist()
+            df["Ticker"].to_numpy()[self._ftp_missing_rows].tolist()
             if "Ticker" in df.columns
             else []
         )
@@ -372,7 +591,7 @@ class DataLoader:
     def _clean_accounting(self, df: pd.DataFrame) -> pd.DataFrame:
         """Clean and validate Accounting classification."""
         if "Accounting" not in df.columns:
-            df["Accounting"] = "Unknown"
+            df["Accounting"] = pd.Categorical(["Unknown"] * len(df))
             return df
 
         # Standardize values
@@ -391,10 +610,12 @@ class DataLoader:
             "FVOCI": "AFS",  # Fair Value through OCI -> treat as AFS
         }
 
-        df["Accounting"] = df["Accounting"].fillna("Unknown").astype(str).str.strip().str.upper()
-        df["Accounting"] = df["Accounting"].map(
-            lambda x: accounting_map.get(x, x.title())
-        )
+        upper = df["Accounting"].fillna("Unknown").astype(str).str.strip().str.upper()
+        # Dict lookup for known spellings; title-case only the unmapped rest
+        mapped = upper.map(accounting_map)
+        unmapped = mapped.isna()
+        # Categorical from here on: later masks compare integer codes, not strings
+        df["Accounting"] = mapped.where(~unmapped, upper[unmapped].str.title()).astype("category")
 
         # Track unknown accounting types
         known_types = {"HTM", "AFS", "Fair Value", "Unknown"}
@@ -435,9 +656,13 @@ class DataLoader:
         }
 
         if "Sector_L1" in df.columns:
-            df["Sector_L1"] = df["Sector_L1"].str.upper().map(
-                lambda x: sector_map.get(x, x.title())
-            )
+            # Dict lookup for known spellings; title-case the rest
+            upper = df["Sector_L1"].str.upper()
+            df["Sector_L1"] = upper.map(sector_map).fillna(upper.str.title())
+
+        for col in ["Sector_L1", "Sector_L2"]:
+            if col in df.columns:
+                df[col] = df[col].astype("category")
 
         return df
 
@@ -450,29 +675,33 @@ class DataLoader:
         - Net_Carry: Yield - FTP
         - Carry_Efficiency: Net_Carry / Duration
         - Is_Tradeable: Boolean based on accounting
+        - Ticker_Root: Issuer key (first token of the bond ticker)
         """
-        # Liquidity Proxy
-        df["Liquidity_Proxy"] = np.where(
-            df["Nominal_USD"] > LIQUIDITY_THRESHOLD,
+        liquidity, net_carry, carry_efficiency = _enrich_kernel(
+            df["Nominal_USD"].to_numpy(dtype=np.float64),
+            df["Yield"].to_numpy(dtype=np.float64),
+            df["FTP"].to_numpy(dtype=np.float64),
+            df["Duration"].to_numpy(dtype=np.float64),
+            LIQUIDITY_THRESHOLD,
             LIQUIDITY_HIGH,
             LIQUIDITY_LOW,
         )
 
-        # Net Carry (in basis points equivalent)
-        df["Net_Carry"] = df["Yield"] - df["FTP"]
-
-        # Carry Efficiency (handle division by zero)
-        df["Carry_Efficiency"] = np.where(
-            df["Duration"] != 0,
-            df["Net_Carry"] / df["Duration"],
-            np.nan,
+        # Is Tradeable flag, looked up per category code; the appended False
+        # is what a missing label's code (-1) indexes
+        accounting = df["Accounting"].cat
+        non_tradeable = np.append(accounting.categories.isin(NON_TRADEABLE_ACCOUNTING), False)
+
+        # All derived columns attached in one assign
+        return df.assign(
+            Liquidity_Proxy=liquidity,
+            Net_Carry=net_carry,  # In basis points equivalent
+            Carry_Efficiency=carry_efficiency,  # NaN where duration is zero
+            Is_Tradeable=~non_tradeable[accounting.codes.to_numpy()],
+            # Ticker root, e.g. "AAPL 3.85 05/04/43" -> "AAPL" (joins to fundamentals)
+            Ticker_Root=df["Ticker"].str.split(n=1).str[0],
         )
 
-        # Is Tradeable flag
-        df["Is_Tradeable"] = ~df["Accounting"].isin(NON_TRADEABLE_ACCOUNTING)
-
-        return df
-
     def _final_cleanup(self, df: pd.DataFrame) -> pd.DataFrame:
         """Final cleanup: drop rows with critical missing data."""
         critical_cols = ["Nominal_USD", "Duration", "Yield"]
@@ -492,24 +721,62 @@ class DataLoader:
 
         return df
 
+    def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert columns to compact dtypes.
+
+        Sector and accounting labels become categoricals, so equality masks
+        and groupbys compare integer codes; identifiers become Arrow-backed
+        strings. Currency amounts stay float64, since float32's ~7 significant
+        digits drop cents well below a million; other floats (durations, rates)
+        are downcast to float32 unless their magnitude exceeds FLOAT32_EXACT_LIMIT,
+        and integers to the smallest integer type that holds them.
+        """
+        memory_before = df.memory_usage(deep=True).sum()
+
+        for col in df.select_dtypes(include="float64").columns.difference(MONEY_COLUMNS):
+            if df[col].abs().max() <= FLOAT32_EXACT_LIMIT:
+                df[col] = df[col].astype(np.float32)
+
+        for col in df.select_dtypes(include="int64").columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+
+        # Labels are categorical since cleaning; drop those only dropped rows used
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("category").cat.remove_unused_categories()
+
+        for col in ARROW_STRING_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype("string[pyarrow]")
+
+        logger.info(
+            f"Compacted dtypes: {memory_before / 1024:.0f} KB -> "
+            f"{df.memory_usage(deep=True).sum() / 1024:.0f} KB"
+        )
+
+        return df
+
     def to_summary(self) -> dict:
         """Generate portfolio summary statistics."""
         if self._clean_df is None:
             return {}
 
         df = self._clean_df
+        nominal = df["Nominal_USD"].to_numpy(dtype=np.float64)
+        total_aum = nominal.sum()
+
+        # Both nominal-weighted sums in one matrix-vector product (one pass over nominal)
+        weighted_duration, weighted_yield = nominal @ df[["Duration", "Yield"]].to_numpy(dtype=np.float64)
+        accounting_counts = df["Accounting"].value_counts()
 
         return {
             "Total Holdings": len(df),
-            "Total AUM (USD)": df["Nominal_USD"].sum(),
-            "Weighted Avg Duration": (
-                (df["Duration"] * df["Nominal_USD"]).sum() / df["Nominal_USD"].sum()
-            ),
-            "Weighted Avg Yield": (
-                (df["Yield"] * df["Nominal_USD"]).sum() / df["Nominal_USD"].sum()
-            ),
-            "HTM Holdings": (df["Accounting"] == "HTM").sum(),
-            "AFS Holdings": (df["Accounting"] == "AFS").sum(),
+            "Total AUM (USD)": total_aum,
+            "Weighted Avg Duration": weighted_duration / total_aum,
+            "Weighted Avg Yield": weighted_yield / total_aum,
+            "HTM Holdings": accounting_counts.get("HTM", 0),
+            "AFS Holdings": accounting_counts.get("AFS", 0),
             "Sectors": df["Sector_L1"].nunique(),
             "Negative Carry Count": (df["Net_Carry"] < 0).sum(),
         }
@@ -7,6 +7,7 @@ and mapping between bond tickers and equity tickers.
 Supports Bloomberg Terminal-style fundamental analysis for credit analysis.
 """
 
+import hashlib
 import logging
 from dataclasses import dataclass
 from pathlib import Path
@@ -15,8 +16,16 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # Optional; derived quarterly metrics then use the NumPy path
+    pl = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many quarterly rows the pandas -> Polars conversion costs more than it saves
+POLARS_MIN_ROWS = 20_000
+
 
 @dataclass
 class QuarterlyMetrics:
@@ -40,29 +49,71 @@ class QuarterlyMetrics:
     revenue_qoq_growth: Optional[float]  # Quarter-over-Quarter growth rate
 
 
-@dataclass
+# QuarterlyMetrics fields that are undefined (None) rather than zero when missing
+OPTIONAL_METRIC_FIELDS = ('net_leverage', 'interest_coverage', 'revenue_qoq_growth')
+
+
+@dataclass(eq=False)  # Array fields have no scalar equality
 class IssuerFundamentals:
     """
     Complete fundamental data for an issuer.
 
-    Contains historical quarterly metrics and latest quarter summary.
+    Quarterly history is stored column-wise: one array per QuarterlyMetrics
+    field, oldest quarter first. Undefined ratios are NaN.
     """
     equity_ticker: str
     issuer_name: str
     bond_ticker: str
-    quarterly_data: List[QuarterlyMetrics]
+    date: np.ndarray
+    year: np.ndarray
+    quarter: np.ndarray
+    revenue: np.ndarray
+    ebitda: np.ndarray
+    total_liabilities: np.ndarray
+    cash: np.ndarray
+    net_int_exp: np.ndarray
+    net_debt_proxy: np.ndarray
+    net_leverage: np.ndarray
+    interest_coverage: np.ndarray
+    revenue_qoq_growth: np.ndarray
+
+    @property
+    def n_quarters(self) -> int:
+        """Number of quarters on record."""
+        return len(self.date)
+
+    def _quarter_at(self, position: int) -> QuarterlyMetrics:
+        """Materialize one quarter as a QuarterlyMetrics record."""
+        values = {
+            field: getattr(self, field)[position].item()
+            for field in QuarterlyMetrics.__dataclass_fields__
+        }
+        values['date'] = pd.Timestamp(self.date[position])
+        for field in OPTIONAL_METRIC_FIELDS:
+            if values[field] != values[field]:  # NaN
+                values[field] = None
+        return QuarterlyMetrics(**values)
+
+    @property
+    def quarterly_data(self) -> List[QuarterlyMetrics]:
+        """All quarters as QuarterlyMetrics records, oldest first."""
+        return [self._quarter_at(i) for i in range(self.n_quarters)]
 
     @property
     def latest_quarter(self) -> Optional[QuarterlyMetrics]:
         """Get most recent quarter data."""
-        if not self.quarterly_data:
+        if not self.n_quarters:
             return None
-        return self.quarterly_data[-1]
+        return self._quarter_at(-1)
 
     @property
     def last_8_quarters(self) -> List[QuarterlyMetrics]:
         """Get last 8 quarters for trend analysis."""
-        return self.quarterly_data[-8:] if len(self.quarterly_data) >= 8 else self.quarterly_data
+        return [self._quarter_at(i) for i in range(max(self.n_quarters - 8, 0), self.n_quarters)]
+
+    def _trend_labels(self) -> List[str]:
+        """Date labels (e.g., '2024Q3') for the last 8 quarters."""
+        return [f"{y}Q{q}" for y, q in zip(self.year[-8:].tolist(), self.quarter[-8:].tolist())]
 
     def get_trend_series(self, metric_name: str) -> Tuple[List[str], List[float]]:
         """
@@ -74,17 +125,83 @@ class IssuerFundamentals:
         Returns:
             Tuple of (date_labels, values)
         """
-        quarters = self.last_8_quarters
-        dates = [f"{q.year}Q{q.quarter}" for q in quarters]
-        values = [getattr(q, metric_name) for q in quarters]
+        values = getattr(self, metric_name)[-8:]
+
+        # Filter out missing values
+        keep = np.flatnonzero(~pd.isna(values))
+        labels = self._trend_labels()
+        return [labels[i] for i in keep], values[keep].tolist()
+
+    def get_trend_frame(self) -> pd.DataFrame:
+        """
+        Extract all metric time series in a single pass.
 
-        # Filter out None values
-        filtered = [(d, v) for d, v in zip(dates, values) if v is not None and not pd.isna(v)]
-        if not filtered:
-            return [], []
+        Returns:
+            DataFrame indexed by date label (e.g., '2024Q3') with one float
+            column per QuarterlyMetrics field; missing values are NaN
+        """
+        return pd.DataFrame(
+            {field: getattr(self, field)[-8:] for field in QuarterlyMetrics.__dataclass_fields__},
+            index=self._trend_labels(),
+        )
 
-        dates_filtered, values_filtered = zip(*filtered)
-        return list(dates_filtered), list(values_filtered)
+
+def _derive_quarterly_metrics(
+    qf: pd.DataFrame,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute derived quarterly metrics for every row of the quarterly frame.
+
+    Args:
+        qf: Quarterly financials sorted by Equity_Ticker, Date
+
+    Returns:
+        Net debt proxy, net leverage, interest coverage and revenue QoQ growth
+        arrays aligned with ``qf``; metrics that are undefined are NaN
+    """
+    revenue = qf['Revenue'].to_numpy(dtype=np.float64)
+    ebitda = qf['EBITDA'].to_numpy(dtype=np.float64)
+    net_int_exp = qf['Net_Int_Exp'].to_numpy(dtype=np.float64)
+
+    net_debt_proxy = qf['Total_Liabilities'].to_numpy(dtype=np.float64) - qf['Cash'].to_numpy(dtype=np.float64)
+    prev_revenue = qf.groupby('Equity_Ticker', sort=False)['Revenue'].shift(1).to_numpy(dtype=np.float64)
+    # Ratios are only divided where defined; NaN inputs propagate, everything else stays NaN.
+    # Net Leverage only for positive EBITDA; coverage uses |interest expense|
+    net_leverage = np.divide(net_debt_proxy, ebitda, out=np.full_like(ebitda, np.nan), where=ebitda > 0)
+    interest_coverage = np.divide(
+        ebitda, np.abs(net_int_exp), out=np.full_like(ebitda, np.nan), where=net_int_exp != 0
+    )
+    revenue_qoq = np.divide(
+        revenue - prev_revenue, prev_revenue, out=np.full_like(revenue, np.nan), where=prev_revenue > 0
+    )
+
+    return net_debt_proxy, net_leverage, interest_coverage, revenue_qoq
+
+
+def _derive_quarterly_metrics_polars(
+    qf: pd.DataFrame,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Polars (lazy, multi-threaded) equivalent of ``_derive_quarterly_metrics``."""
+    revenue = pl.col('Revenue')
+    ebitda = pl.col('EBITDA')
+    net_int_exp = pl.col('Net_Int_Exp')
+    net_debt_proxy = pl.col('Total_Liabilities') - pl.col('Cash')
+    prev_revenue = revenue.shift(1).over('Equity_Ticker')
+
+    derived = (
+        pl.from_pandas(qf[['Equity_Ticker', 'Revenue', 'EBITDA', 'Total_Liabilities', 'Cash', 'Net_Int_Exp']])
+        .lazy()
+        .select(
+            net_debt_proxy.alias('net_debt_proxy'),
+            pl.when(ebitda > 0).then(net_debt_proxy / ebitda).alias('net_leverage'),
+            pl.when(net_int_exp != 0).then(ebitda / net_int_exp.abs()).alias('interest_coverage'),
+            pl.when(prev_revenue > 0).then((revenue - prev_revenue) / prev_revenue).alias('revenue_qoq'),
+        )
+        .collect()
+    )
+
+    # Nulls come back as NaN, matching the NumPy path
+    return tuple(derived.get_column(name).to_numpy().astype(np.float64) for name in derived.columns)
 
 
 class FinancialDataLoader:
@@ -103,17 +220,22 @@ class FinancialDataLoader:
         >>> fundamentals = loader.get_issuer_fundamentals("AAPL")
     """
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(self, data_dir: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize financial data loader.
 
         Args:
             data_dir: Path to data directory. If None, uses default 'data' folder.
+            cache_dir: Directory for the Parquet copy of the latest-quarter metrics,
+                      keyed on the size and mtime of the loaded source CSVs.
+                      None (default) disables the cache.
         """
         self.data_dir = data_dir or Path(__file__).parent.parent.parent / "data"
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.bond_equity_map: Optional[pd.DataFrame] = None
         self.quarterly_financials: Optional[pd.DataFrame] = None
         self._issuer_cache: Dict[str, IssuerFundamentals] = {}
+        self._source_version: Optional[str] = None
 
     def load_data(self) -> bool:
         """
@@ -129,6 +251,7 @@ class FinancialDataLoader:
                 logger.warning(f"Bond equity map not found: {map_path}")
                 return False
 
+            map_stat = map_path.stat()
             self.bond_equity_map = pd.read_csv(map_path, encoding='utf-8-sig')
             logger.info(f"Loaded {len(self.bond_equity_map)} bond-equity mappings")
 
@@ -138,6 +261,7 @@ class FinancialDataLoader:
                 logger.warning(f"Quarterly financials not found: {financials_path}")
                 return False
 
+            financials_stat = financials_path.stat()
             self.quarterly_financials = pd.read_csv(financials_path, encoding='utf-8-sig')
             self.quarterly_financials['Date'] = pd.to_datetime(self.quarterly_financials['Date'])
 
@@ -157,6 +281,11 @@ class FinancialDataLoader:
             # Build issuer cache
             self._build_issuer_cache()
 
+            # Versions of the sources the fundamentals were built from
+            self._source_version = ":".join(
+                f"{stat.st_size}:{stat.st_mtime_ns}" for stat in (map_stat, financials_stat)
+            )
+
             return True
 
         except Exception as e:
@@ -170,80 +299,64 @@ class FinancialDataLoader:
 
         self._issuer_cache = {}
 
-        for _, row in self.bond_equity_map.iterrows():
-            bond_ticker = row['Bond_Ticker']
-            equity_ticker = row['Equity_Ticker']
-            issuer_name = row['Issuer_Name']
-
-            # Skip if equity ticker is missing or invalid
-            if pd.isna(equity_ticker) or equity_ticker.strip() == '' or equity_ticker == 'N/A':
-                continue
-
-            # Get quarterly data for this equity ticker
-            equity_data = self.quarterly_financials[
-                self.quarterly_financials['Equity_Ticker'] == equity_ticker
-            ].copy()
-
-            if len(equity_data) == 0:
-                continue
-
-            # Calculate metrics for each quarter
-            quarterly_metrics = []
-            prev_revenue = None
-
-            for idx, q_row in equity_data.iterrows():
-                # Calculate Net Debt Proxy
-                liabilities = q_row['Total_Liabilities']
-                cash = q_row['Cash']
-                net_debt_proxy = liabilities - cash if pd.notna(liabilities) and pd.notna(cash) else np.nan
-
-                # Calculate Net Leverage (handle zero/negative EBITDA gracefully)
-                ebitda = q_row['EBITDA']
-                net_leverage = None
-                if pd.notna(net_debt_proxy) and pd.notna(ebitda) and ebitda > 0:
-                    net_leverage = net_debt_proxy / ebitda
-
-                # Calculate Interest Coverage (handle zero interest expense)
-                net_int_exp = q_row['Net_Int_Exp']
-                interest_coverage = None
-                if pd.notna(ebitda) and pd.notna(net_int_exp) and net_int_exp != 0:
-                    # Use absolute value of interest expense for coverage ratio
-                    interest_coverage = ebitda / abs(net_int_exp)
-
-                # Calculate Revenue QoQ Growth
-                revenue = q_row['Revenue']
-                revenue_qoq = None
-                if prev_revenue is not None and pd.notna(revenue) and pd.notna(prev_revenue) and prev_revenue > 0:
-                    revenue_qoq = (revenue - prev_revenue) / prev_revenue
-                prev_revenue = revenue
-
-                metrics = QuarterlyMetrics(
-                    date=q_row['Date'],
-                    year=int(q_row['Year']),
-                    quarter=int(q_row['Quarter']),
-                    revenue=revenue if pd.notna(revenue) else 0.0,
-                    ebitda=ebitda if pd.notna(ebitda) else 0.0,
-                    total_liabilities=liabilities if pd.notna(liabilities) else 0.0,
-                    cash=cash if pd.notna(cash) else 0.0,
-                    net_int_exp=net_int_exp if pd.notna(net_int_exp) else 0.0,
-                    net_debt_proxy=net_debt_proxy if pd.notna(net_debt_proxy) else 0.0,
-                    net_leverage=net_leverage,
-                    interest_coverage=interest_coverage,
-                    revenue_qoq_growth=revenue_qoq
-                )
-                quarterly_metrics.append(metrics)
+        qf = self.quarterly_financials
+
+        # Derived metrics for every quarter at once (data is sorted by ticker, date)
+        if pl is not None and len(qf) >= POLARS_MIN_ROWS:
+            net_debt_proxy, net_leverage, interest_coverage, revenue_qoq = _derive_quarterly_metrics_polars(qf)
+        else:
+            net_debt_proxy, net_leverage, interest_coverage, revenue_qoq = _derive_quarterly_metrics(qf)
+
+        def zero_filled(values: np.ndarray) -> np.ndarray:
+            return np.where(np.isnan(values), 0.0, values)
+
+        # One array per QuarterlyMetrics field; issuers hold slices of these
+        columns = {
+            'date': qf['Date'].to_numpy(),
+            'year': qf['Year'].to_numpy(),
+            'quarter': qf['Quarter'].to_numpy(),
+            'revenue': zero_filled(qf['Revenue'].to_numpy(dtype=np.float64)),
+            'ebitda': zero_filled(qf['EBITDA'].to_numpy(dtype=np.float64)),
+            'total_liabilities': zero_filled(qf['Total_Liabilities'].to_numpy(dtype=np.float64)),
+            'cash': zero_filled(qf['Cash'].to_numpy(dtype=np.float64)),
+            'net_int_exp': zero_filled(qf['Net_Int_Exp'].to_numpy(dtype=np.float64)),
+            'net_debt_proxy': zero_filled(net_debt_proxy),
+            'net_leverage': net_leverage,
+            'interest_coverage': interest_coverage,
+            'revenue_qoq_growth': revenue_qoq,
+        }
+        equity_positions = qf.groupby('Equity_Ticker', sort=False).indices
+
+        # Keep mappings whose equity ticker is valid and has quarterly data, in one mask
+        equity_tickers = self.bond_equity_map['Equity_Ticker'].astype('string')
+        has_data = (
+            equity_tickers.str.strip().ne('')
+            & equity_tickers.ne('N/A')
+            & equity_tickers.isin(list(equity_positions))
+        ).fillna(False).to_numpy(dtype=bool)
+
+        # Plain tuples: no per-row Series or namedtuple class construction
+        bond_rows = self.bond_equity_map.loc[has_data, ['Bond_Ticker', 'Equity_Ticker', 'Issuer_Name']].itertuples(
+            index=False, name=None
+        )
+        for bond_ticker, equity_ticker, issuer_name in bond_rows:
+            # Quarterly data for this equity ticker
+            positions = equity_positions[equity_ticker]
+
+            # Rows of one ticker are contiguous after the sort, so slices are views
+            if positions[-1] - positions[0] + 1 == len(positions):
+                rows = slice(positions[0], positions[-1] + 1)
+            else:
+                rows = positions
 
-            # Create IssuerFundamentals object
-            fundamentals = IssuerFundamentals(
+            # Cache by bond ticker
+            self._issuer_cache[bond_ticker] = IssuerFundamentals(
                 equity_ticker=equity_ticker,
                 issuer_name=issuer_name,
                 bond_ticker=bond_ticker,
-                quarterly_data=quarterly_metrics
+                **{field: values[rows] for field, values in columns.items()},
             )
 
-            # Cache by bond ticker
-            self._issuer_cache[bond_ticker] = fundamentals
-
         logger.info(f"Built cache for {len(self._issuer_cache)} issuers with fundamental data")
 
     def get_issuer_fundamentals(self, bond_ticker: str) -> Optional[IssuerFundamentals]:
@@ -261,6 +374,139 @@ class FinancialDataLoader:
 
         return self._issuer_cache.get(base_ticker)
 
+    def get_latest_metrics_batch(self, bond_tickers: List[str]) -> pd.DataFrame:
+        """
+        Get latest-quarter metrics for many bond tickers in one vectorized pass.
+
+        Mirrors the per-issuer values exposed via ``latest_quarter`` without
+        building IssuerFundamentals objects one ticker at a time.
+
+        Args:
+            bond_tickers: Bond ticker symbols (complex tickers use their first token)
+
+        Returns:
+            DataFrame indexed by Bond_Ticker with raw and derived latest-quarter
+            metrics; tickers without fundamentals are omitted
+        """
+        columns = [
+            'Equity_Ticker', 'Issuer_Name', 'Date', 'Revenue', 'EBITDA',
+            'Total_Liabilities', 'Cash', 'Net_Int_Exp', 'Net_Leverage',
+            'Interest_Coverage', 'EBITDA_Margin', 'Revenue_QoQ_Growth',
+        ]
+        if self.bond_equity_map is None or self.quarterly_financials is None:
+            return pd.DataFrame(columns=columns).rename_axis('Bond_Ticker')
+
+        base_tickers = pd.unique(pd.Series(bond_tickers, dtype=object).str.split().str[0].dropna())
+
+        # Resolve bond -> equity mapping; as in the issuer cache, the last
+        # valid mapping with quarterly data wins for duplicated bond tickers
+        mapping = self.bond_equity_map[self.bond_equity_map['Bond_Ticker'].isin(base_tickers)]
+        equity = mapping['Equity_Ticker']
+        mapping = mapping[
+            equity.notna()
+            & (equity.astype(str).str.strip() != '')
+            & (equity != 'N/A')
+            & equity.isin(self.quarterly_financials['Equity_Ticker'])
+        ].drop_duplicates(subset=['Bond_Ticker'], keep='last')
+
+        # Latest two quarters per equity ticker (data is pre-sorted by ticker, date)
+        quarters = self.quarterly_financials[
+            self.quarterly_financials['Equity_Ticker'].isin(mapping['Equity_Ticker'])
+        ]
+        prev_revenue = quarters.groupby('Equity_Ticker')['Revenue'].shift(1)
+        latest_mask = ~quarters['Equity_Ticker'].duplicated(keep='last')
+        latest = quarters[latest_mask].assign(Prev_Revenue=prev_revenue[latest_mask])
+
+        latest = mapping[['Bond_Ticker', 'Equity_Ticker', 'Issuer_Name']].merge(
+            latest, on='Equity_Ticker', how='inner'
+        ).set_index('Bond_Ticker')
+
+        revenue = latest['Revenue'].to_numpy(dtype=np.float64)
+        ebitda = latest['EBITDA'].to_numpy(dtype=np.float64)
+        net_int_exp = latest['Net_Int_Exp'].to_numpy(dtype=np.float64)
+        prev = latest['Prev_Revenue'].to_numpy(dtype=np.float64)
+        net_debt = latest['Total_Liabilities'].to_numpy(dtype=np.float64) - latest['Cash'].to_numpy(dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            latest['Net_Leverage'] = np.where(ebitda > 0, net_debt / ebitda, np.nan)
+            latest['Interest_Coverage'] = np.where(net_int_exp != 0, ebitda / np.abs(net_int_exp), np.nan)
+            latest['EBITDA_Margin'] = np.where((revenue > 0) & (ebitda > 0), ebitda / revenue * 100, np.nan)
+            latest['Revenue_QoQ_Growth'] = np.where(prev > 0, (revenue - prev) / prev, np.nan)
+
+        return latest[columns]
+
+    def dump_latest_parquet(self, path: Path, latest: Optional[pd.DataFrame] = None) -> bool:
+        """
+        Persist latest-quarter metrics for every mapped issuer to Parquet.
+
+        Args:
+            path: Destination Parquet file
+            latest: Precomputed metrics to write. If None, computed for all mapped bonds.
+
+        Returns:
+            True if written, False if no data or no Parquet engine is available
+        """
+        if latest is None:
+            if self.bond_equity_map is None:
+                return False
+            latest = self.get_latest_metrics_batch(self.bond_equity_map['Bond_Ticker'].dropna().tolist())
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            latest.to_parquet(path)
+            return True
+        except (ImportError, OSError) as e:
+            logger.warning(f"Could not write latest metrics cache {path}: {e}")
+            return False
+
+    def load_latest_metrics(self) -> pd.DataFrame:
+        """
+        Get latest-quarter metrics for every mapped issuer, backed by a Parquet cache.
+
+        The cache entry is named after the (size, mtime_ns) of both source CSVs
+        as they were loaded, so repeat sessions skip recomputing the per-issuer
+        metrics, while a replaced file (even one with an older timestamp) never
+        hits a stale entry.
+
+        Returns:
+            DataFrame indexed by Bond_Ticker (see get_latest_metrics_batch)
+        """
+        if self.bond_equity_map is None:
+            return self.get_latest_metrics_batch([])
+
+        cache_path = self._latest_cache_path()
+        if cache_path is not None and cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable latest metrics cache {cache_path}: {e}")
+
+        latest = self.get_latest_metrics_batch(self.bond_equity_map['Bond_Ticker'].dropna().tolist())
+
+        if cache_path is not None and self.dump_latest_parquet(cache_path, latest):
+            # Drop entries built from older versions of the sources
+            source_prefix = cache_path.name.rsplit("-", 1)[0]
+            for stale in cache_path.parent.glob(f"{source_prefix}-*.parquet"):
+                if stale != cache_path:
+                    stale.unlink(missing_ok=True)
+
+        return latest
+
+    def _latest_cache_path(self) -> Optional[Path]:
+        """
+        Parquet cache file for the loaded source versions, or None if caching is off.
+
+        Named ``latest_metrics-<source id>-<version id>.parquet``: the source id
+        hashes the resolved data directory, the version id hashes the
+        (size, mtime_ns) of both CSVs recorded by load_data.
+        """
+        if self.cache_dir is None or self._source_version is None:
+            return None
+
+        source_id = hashlib.sha1(str(self.data_dir.resolve()).encode("utf-8")).hexdigest()[:12]
+        version_id = hashlib.sha1(self._source_version.encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"latest_metrics-{source_id}-{version_id}.parquet"
+
     def has_fundamentals(self, bond_ticker: str) -> bool:
         """Check if fundamental data exists for a bond ticker."""
         return self.get_issuer_fundamentals(bond_ticker) is not None
@@ -2,8 +2,10 @@
 Constants and configuration for Alpha-One Credit Cockpit.
 """
 
-# Column mapping from bilingual source to standardized names
-COLUMN_MAPPING = {
+from types import MappingProxyType
+
+# Column mapping from bilingual source to standardized names (read-only)
+COLUMN_MAPPING = MappingProxyType({
     "分类1": "Sector_L1",
     "分类2": "Sector_L2",
     "TICKER": "Ticker",
@@ -14,20 +16,21 @@ COLUMN_MAPPING = {
     "EffectiveYield": "Yield",
     "OAS": "OAS",
     "FTP Rate": "FTP",
-}
+})
 
 # Reverse mapping for validation
-REVERSE_COLUMN_MAPPING = {v: k for k, v in COLUMN_MAPPING.items()}
+REVERSE_COLUMN_MAPPING = MappingProxyType({v: k for k, v in COLUMN_MAPPING.items()})
 
-# Required columns after transformation
-REQUIRED_COLUMNS = [
+# Required columns after transformation (ordered for messages, frozenset for membership)
+REQUIRED_COLUMNS_ORDERED = (
     "Sector_L1",
     "Ticker",
     "Accounting",
     "Nominal_USD",
     "Duration",
     "Yield",
-]
+)
+REQUIRED_COLUMNS = frozenset(REQUIRED_COLUMNS_ORDERED)
 
 # Sector color palette for visualization
 SECTOR_COLORS = {
@@ -48,7 +51,7 @@ DEFAULT_FTP = 0.0
 
 # Liquidity score thresholds (in USD millions)
 LIQUIDITY_THRESHOLD = 10_000_000  # $10M threshold
-LIQUIDITY_HIGH = 5
+LIQUIDITY_HIGH = 5  # Scores are stored as int8, so both must fit in -128..127
 LIQUIDITY_LOW = 3
 
 # Z-Score thresholds for Rich/Cheap classification
@@ -66,7 +69,13 @@ ACCOUNTING_HTM = "HTM"      # Hold-to-Maturity (not tradeable)
 ACCOUNTING_AFS = "AFS"      # Available-for-Sale (tradeable)
 ACCOUNTING_FV = "Fair Value"  # Fair Value (tradeable)
 
-NON_TRADEABLE_ACCOUNTING = [ACCOUNTING_HTM]
+NON_TRADEABLE_ACCOUNTING = frozenset([ACCOUNTING_HTM])
+
+# Compact dtypes applied after cleaning
+CATEGORICAL_COLUMNS = ["Sector_L1", "Sector_L2", "Accounting", "Ticker_Root"]  # Low-cardinality labels and issuer keys
+ARROW_STRING_COLUMNS = ["Ticker", "Name"]  # High-cardinality identifiers
+MONEY_COLUMNS = ["Nominal_USD"]  # Currency amounts always keep float64 (float32 loses cents from ~$100k up)
+FLOAT32_EXACT_LIMIT = 2 ** 24  # Other floats above this keep float64 (float32 holds ~7 significant digits)
 
 # Regression parameters
 MIN_SAMPLES_FOR_REGRESSION = 5  # Minimum bonds per sector for curve fitting
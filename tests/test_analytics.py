@@ -10,7 +10,54 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.module_b.analytics import PortfolioAnalyzer, RegressionResult
+from src.module_b.analytics import (
+    PortfolioAnalyzer,
+    RegressionResult,
+    _nelson_siegel_jacobian,
+    _nelson_siegel_numpy,
+    nelson_siegel,
+)
+
+
+@pytest.fixture(scope="class")
+def sample_portfolio():
+    """Create a sample portfolio DataFrame for testing (built once per class; treat as read-only)."""
+    rng = np.random.default_rng(42)  # Private generator; global NumPy RNG state is left alone
+    n_bonds = 100
+
+    sectors = rng.choice(["MBS", "Corps", "Fins", "Rates"], n_bonds)
+    durations = rng.uniform(1, 10, n_bonds)
+
+    # Generate yields with sector-specific curves + noise (Rates is the default curve)
+    sector_masks = [sectors == "MBS", sectors == "Corps", sectors == "Fins"]
+    a = np.select(sector_masks, [0.001, 0.0008, 0.0012], 0.0005)
+    b = np.select(sector_masks, [0.005, 0.008, 0.006], 0.004)
+    c = np.select(sector_masks, [0.035, 0.032, 0.038], 0.030)
+    yields = a * durations**2 + b * durations + c + rng.normal(0, 0.005, n_bonds)
+
+    data = {
+        "Sector_L1": sectors,
+        "Sector_L2": ["Sub"] * n_bonds,
+        "Ticker": [f"BOND{i}" for i in range(n_bonds)],
+        "Name": [f"Bond {i}" for i in range(n_bonds)],
+        "Accounting": rng.choice(["AFS", "HTM", "Fair Value"], n_bonds, p=[0.6, 0.3, 0.1]),
+        "Nominal_USD": rng.uniform(1e6, 50e6, n_bonds),
+        "Duration": durations,
+        "Yield": yields,
+        "OAS": rng.uniform(20, 150, n_bonds),
+        "FTP": rng.uniform(0.03, 0.045, n_bonds),
+        "FTP_Missing": [False] * n_bonds,
+        "Liquidity_Proxy": rng.choice([3, 5], n_bonds),
+        "Net_Carry": yields - rng.uniform(0.03, 0.045, n_bonds),
+        "Carry_Efficiency": np.zeros(n_bonds),  # Will be calculated
+        "Is_Tradeable": np.zeros(n_bonds, dtype=bool),  # Will be derived from Accounting
+    }
+
+    df = pd.DataFrame(data)
+    df["Carry_Efficiency"] = df["Net_Carry"] / df["Duration"]
+    df["Is_Tradeable"] = df["Accounting"] != "HTM"
+
+    return df
 
 
 class TestRegressionResult:
@@ -34,6 +81,21 @@ class TestRegressionResult:
 
         assert predicted[0] == pytest.approx(expected, rel=1e-6)
 
+    def test_predict_matches_numpy_horner(self):
+        """Test prediction is bit-identical to the NumPy Horner form."""
+        a, b, c = 0.0013, -0.0071, 0.0342
+        result = RegressionResult(
+            sector="Corps",
+            coefficients=(a, b, c),
+            r_squared=0.9,
+            sample_count=50,
+            duration_range=(0.0, 30.0),
+            residual_std=0.005,
+        )
+        duration = np.random.default_rng(7).uniform(0, 30, 100_000)
+
+        assert np.array_equal(result.predict(duration), (a * duration + b) * duration + c)
+
     def test_coefficients_properties(self):
         """Test coefficient property accessors."""
         result = RegressionResult(
@@ -50,58 +112,35 @@ class TestRegressionResult:
         assert result.c == 0.025
 
 
-class TestPortfolioAnalyzer:
-    """Test suite for PortfolioAnalyzer."""
+class TestNelsonSiegel:
+    """Test suite for the Nelson-Siegel model functions."""
 
-    @pytest.fixture
-    def sample_portfolio(self):
-        """Create a sample portfolio DataFrame for testing."""
-        np.random.seed(42)
-        n_bonds = 100
+    def test_jacobian_matches_finite_differences(self):
+        """Test the analytic Jacobian against central finite differences."""
+        tau = np.array([0.25, 1.0, 3.0, 7.5, 20.0])
+        params = np.array([0.045, -0.01, 0.02, 2.5])
+        jac = _nelson_siegel_jacobian(tau, *params)
 
-        sectors = np.random.choice(["MBS", "Corps", "Fins", "Rates"], n_bonds)
-        durations = np.random.uniform(1, 10, n_bonds)
+        assert jac.shape == (5, 4)
+        for k in range(4):
+            step = np.zeros(4)
+            step[k] = 1e-6
+            numeric = (nelson_siegel(tau, *(params + step)) - nelson_siegel(tau, *(params - step))) / 2e-6
+            np.testing.assert_allclose(jac[:, k], numeric, rtol=1e-5, atol=1e-9)
 
-        # Generate yields with sector-specific curves + noise
-        yields = []
-        for i in range(n_bonds):
-            sector = sectors[i]
-            dur = durations[i]
 
-            if sector == "MBS":
-                base_yield = 0.001 * dur**2 + 0.005 * dur + 0.035
-            elif sector == "Corps":
-                base_yield = 0.0008 * dur**2 + 0.008 * dur + 0.032
-            elif sector == "Fins":
-                base_yield = 0.0012 * dur**2 + 0.006 * dur + 0.038
-            else:  # Rates
-                base_yield = 0.0005 * dur**2 + 0.004 * dur + 0.030
+    def test_kernel_matches_numpy_for_negative_and_nan_tau(self):
+        """Test the fused evaluation agrees with the NumPy path on edge-case inputs."""
+        tau = np.array([-5.0, -1e-9, 0.0, 1e-8, 1e-6, 0.5, 5.0, 30.0, np.nan])
+        params = (0.05, -0.02, 0.01, 2.0)
 
-            yields.append(base_yield + np.random.normal(0, 0.005))
+        # atol covers 1-ulp exp differences amplified by (1 - e^-u)/u cancellation near the floor
+        np.testing.assert_allclose(nelson_siegel(tau, *params), _nelson_siegel_numpy(tau, *params), rtol=0, atol=1e-10)
+        assert np.isnan(nelson_siegel(tau, 0.05, -0.02, 0.01, np.nan)).all()
 
-        data = {
-            "Sector_L1": sectors,
-            "Sector_L2": ["Sub"] * n_bonds,
-            "Ticker": [f"BOND{i}" for i in range(n_bonds)],
-            "Name": [f"Bond {i}" for i in range(n_bonds)],
-            "Accounting": np.random.choice(["AFS", "HTM", "Fair Value"], n_bonds, p=[0.6, 0.3, 0.1]),
-            "Nominal_USD": np.random.uniform(1e6, 50e6, n_bonds),
-            "Duration": durations,
-            "Yield": yields,
-            "OAS": np.random.uniform(20, 150, n_bonds),
-            "FTP": np.random.uniform(0.03, 0.045, n_bonds),
-            "FTP_Missing": [False] * n_bonds,
-            "Liquidity_Proxy": np.random.choice([3, 5], n_bonds),
-            "Net_Carry": np.array(yields) - np.random.uniform(0.03, 0.045, n_bonds),
-            "Carry_Efficiency": np.zeros(n_bonds),  # Will be calculated
-            "Is_Tradeable": [acc != "HTM" for acc in np.random.choice(["AFS", "HTM", "Fair Value"], n_bonds, p=[0.6, 0.3, 0.1])],
-        }
-
-        df = pd.DataFrame(data)
-        df["Carry_Efficiency"] = df["Net_Carry"] / df["Duration"]
-        df["Is_Tradeable"] = df["Accounting"] != "HTM"
 
-        return df
+class TestPortfolioAnalyzer:
+    """Test suite for PortfolioAnalyzer."""
 
     def test_fit_sector_curves(self, sample_portfolio):
         """Test fitting curves for each sector."""
@@ -117,6 +156,34 @@ class TestPortfolioAnalyzer:
             assert 0 <= result.r_squared <= 1
             assert result.residual_std > 0
 
+    def test_fit_leaves_input_frame_untouched(self, sample_portfolio):
+        """Test the analyzer adds derived columns without copying or modifying the input."""
+        columns = sample_portfolio.columns.tolist()
+        analyzer = PortfolioAnalyzer(sample_portfolio)
+        analyzer.fit_sector_curves()
+
+        assert sample_portfolio.columns.tolist() == columns
+        assert {"Model_Yield", "Residual", "Z_Score"} <= set(analyzer.df.columns)
+        assert np.shares_memory(
+            analyzer.df["Duration"].to_numpy(), sample_portfolio["Duration"].to_numpy()
+        )
+
+    def test_batched_quadratic_fit_matches_polyfit(self, sample_portfolio):
+        """Test the batched per-sector solve agrees with a per-sector np.polyfit."""
+        analyzer = PortfolioAnalyzer(sample_portfolio)
+        results = analyzer.fit_sector_curves()
+
+        for sector, result in results.items():
+            sector_df = sample_portfolio[sample_portfolio["Sector_L1"] == sector]
+            x = sector_df["Duration"].to_numpy()
+            y = sector_df["Yield"].to_numpy()
+            coeffs = np.polyfit(x, y, deg=2)
+            residuals = y - np.polyval(coeffs, x)
+
+            assert result.coefficients == pytest.approx(tuple(coeffs), rel=1e-8, abs=1e-12)
+            assert result.residual_std == pytest.approx(np.std(residuals), rel=1e-8)
+            assert result.duration_range == (x.min(), x.max())
+
     def test_z_score_calculation(self, sample_portfolio):
         """Test Z-score calculation after curve fitting."""
         analyzer = PortfolioAnalyzer(sample_portfolio)
@@ -143,6 +210,20 @@ class TestPortfolioAnalyzer:
             # All candidates should be tradeable
             assert candidates["Is_Tradeable"].all()
 
+    def test_default_screens_match_explicit_filters(self, sample_portfolio):
+        """Test flag-backed default screens select the same bonds as direct column filters."""
+        analyzer = PortfolioAnalyzer(sample_portfolio)
+        analyzer.fit_sector_curves()
+        df = analyzer.df
+
+        sell = analyzer.get_sell_candidates(max_net_carry=0.0)
+        expected = df[(df["Z_Score"] < -1.5) & (df["Net_Carry"] < 0) & df["Is_Tradeable"]]
+        assert set(sell["Ticker"]) == set(expected["Ticker"])
+
+        buy = analyzer.get_buy_candidates()
+        expected = df[(df["Z_Score"] > 1.5) & (df["Liquidity_Proxy"] >= 3)]
+        assert set(buy["Ticker"]) == set(expected["Ticker"])
+
     def test_get_bleeding_assets(self, sample_portfolio):
         """Test identification of negative carry assets."""
         # Modify some bonds to have negative carry
@@ -181,6 +262,10 @@ class TestPortfolioAnalyzer:
         assert 0 < metrics.weighted_yield < 0.15
         assert len(metrics.sector_exposures) > 0
 
+        names, values = metrics.sector_exposure_arrays
+        assert names == tuple(metrics.sector_exposures)
+        assert values.tolist() == list(metrics.sector_exposures.values())
+
     def test_get_sector_summary(self, sample_portfolio):
         """Test sector summary generation."""
         analyzer = PortfolioAnalyzer(sample_portfolio)
@@ -192,6 +277,27 @@ class TestPortfolioAnalyzer:
         assert "Count" in summary.columns
         assert "Avg_Z_Score" in summary.columns
 
+    def test_derived_results_cached_until_refit(self, sample_portfolio):
+        """Test metrics, summary and curve points are reused until curves are refit."""
+        analyzer = PortfolioAnalyzer(sample_portfolio)
+        analyzer.fit_sector_curves()
+
+        metrics = analyzer.calculate_portfolio_metrics()
+        summary = analyzer.get_sector_summary()
+        x, y = analyzer.get_curve_points("MBS", n_points=20)
+        report = analyzer.generate_executive_summary()
+
+        assert analyzer.calculate_portfolio_metrics() is metrics
+        assert analyzer.generate_executive_summary() is report
+        pd.testing.assert_frame_equal(analyzer.get_sector_summary(), summary)
+        assert analyzer.get_curve_points("MBS", n_points=20)[1] is y
+        assert not y.flags.writeable
+
+        analyzer.fit_sector_curves()
+        assert analyzer.calculate_portfolio_metrics() is not metrics
+        assert analyzer.generate_executive_summary() is not report
+        assert analyzer.get_curve_points("MBS", n_points=20)[1] is not y
+
     def test_generate_executive_summary(self, sample_portfolio):
         """Test executive summary generation."""
         analyzer = PortfolioAnalyzer(sample_portfolio)
@@ -220,6 +326,14 @@ class TestPortfolioAnalyzer:
         filtered = analyzer.get_filtered_data(min_liquidity=5)
         assert (filtered["Liquidity_Proxy"] >= 5).all()
 
+        # Unfiltered result does not share data with the analyzer
+        filtered = analyzer.get_filtered_data(exclude_htm=False, min_liquidity=0)
+        assert len(filtered) == len(analyzer.df)
+        filtered["OAS"] = 0.0
+        filtered.loc[filtered.index[0], "Duration"] = 99.0
+        assert (analyzer.df["OAS"] != 0.0).all()
+        assert analyzer.df["Duration"].iloc[0] != 99.0
+
     def test_get_curve_points(self, sample_portfolio):
         """Test curve points generation for plotting."""
         analyzer = PortfolioAnalyzer(sample_portfolio)
@@ -242,6 +356,48 @@ class TestPortfolioAnalyzer:
         assert isinstance(sectors, list)
         assert len(sectors) > 0
 
+    def test_fit_sector_curves_reuses_previous(self, sample_portfolio):
+        """Test incremental refit reuses curves for sectors with unchanged data."""
+        base = PortfolioAnalyzer(sample_portfolio)
+        base_results = base.fit_sector_curves()
+
+        # Drop one MBS bond: only MBS should be refit
+        changed = sample_portfolio.drop(sample_portfolio.index[sample_portfolio["Sector_L1"] == "MBS"][0])
+        analyzer = PortfolioAnalyzer(changed)
+        results = analyzer.fit_sector_curves(previous=base)
+
+        fresh = PortfolioAnalyzer(changed)
+        fresh_results = fresh.fit_sector_curves()
+
+        assert results.keys() == fresh_results.keys()
+        for sector, result in results.items():
+            if sector == "MBS":
+                assert result is not base_results[sector]
+            else:
+                assert result is base_results[sector]
+            assert result.coefficients == pytest.approx(fresh_results[sector].coefficients)
+
+        np.testing.assert_allclose(analyzer.df["Z_Score"], fresh.df["Z_Score"])
+
+    def test_nelson_siegel_fit_independent_of_fit_history(self, sample_portfolio):
+        """Test NS fits only warm-start from an explicit previous analyzer, and never get worse."""
+        cold = PortfolioAnalyzer(sample_portfolio, model_type="nelson_siegel").fit_sector_curves()
+
+        short_end = PortfolioAnalyzer(
+            sample_portfolio[sample_portfolio["Duration"] < 4].reset_index(drop=True), model_type="nelson_siegel"
+        )
+        short_end.fit_sector_curves()
+
+        # An unrelated earlier fit leaves a fresh analyzer's curves untouched
+        fresh = PortfolioAnalyzer(sample_portfolio, model_type="nelson_siegel").fit_sector_curves()
+        for sector, result in cold.items():
+            assert (fresh[sector].beta_0, fresh[sector].lambda_) == (result.beta_0, result.lambda_)
+
+        # Warm starts from an explicit previous fit are kept only when they fit no worse
+        warm = PortfolioAnalyzer(sample_portfolio, model_type="nelson_siegel").fit_sector_curves(previous=short_end)
+        for sector, result in cold.items():
+            assert warm[sector].r_squared >= result.r_squared - 1e-6
+
     def test_min_samples_threshold(self):
         """Test that sectors with few bonds are skipped."""
         # Create data with one sector having only 2 bonds
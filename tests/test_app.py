@@ -0,0 +1,38 @@
+"""
+Tests for the dashboard's pure helpers.
+"""
+
+import io
+
+import numpy as np
+import pandas as pd
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app import encode_csv
+
+
+class TestCsvExport:
+    """Test suite for the CSV download serializer."""
+
+    def test_encode_csv_matches_to_csv_and_round_trips(self):
+        """Export keeps pandas' CSV format and reads back to the same frame."""
+        df = pd.DataFrame({
+            "Ticker": ["AAPL 3.45 02/09/45", "JPM, Series B", None],
+            "Sector": pd.Categorical(["Corps", "Fins", "Corps"]),
+            "Is_HTM": [True, False, True],
+            "OAS": [120.0, 85.5, np.nan],
+            "Nominal_USD": [1_000_000, 250_000, 0],
+        })
+
+        data = encode_csv(df)
+
+        assert data == df.to_csv(index=False).encode("utf-8")
+        assert data.decode("utf-8").splitlines()[1] == "AAPL 3.45 02/09/45,Corps,True,120.0,1000000"
+
+        restored = pd.read_csv(io.BytesIO(data))
+        pd.testing.assert_frame_equal(
+            restored, df.astype({"Sector": object}), check_dtype=False
+        )
@@ -6,17 +6,46 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.module_b.data_loader import DataLoader, DataValidationError
+from src.module_b.data_loader import (
+    DataLoader,
+    DataValidationError,
+    NOMINAL_STRIP_PATTERN,
+    RATE_STRIP_PATTERN,
+    _strings_to_float,
+    _strings_to_float_polars,
+)
+
+# Minimal raw export row; tests override only the fields they exercise
+_BASE_ROW = {
+    "分类1": "MBS",
+    "TICKER": "A",
+    "AccSection": "AFS",
+    "Nominal（USD）": 1000000,
+    "Duration": 5.0,
+    "EffectiveYield": "4.5%",
+}
+
+
+def make_df(row_overrides):
+    """Build a raw input DataFrame with one row per overrides dict."""
+    return pd.DataFrame.from_records([{**_BASE_ROW, **overrides} for overrides in row_overrides])
+
+
+@pytest.fixture(scope="module")
+def shared_loader():
+    """One DataLoader for tests that only inspect the returned frame."""
+    return DataLoader()
 
 
 class TestDataLoader:
     """Test suite for DataLoader."""
 
-    def test_load_from_dataframe(self):
+    def test_load_from_dataframe(self, shared_loader):
         """Test loading from an existing DataFrame."""
         # Create sample data with bilingual columns
         data = {
@@ -33,8 +62,7 @@ class TestDataLoader:
         }
         df_input = pd.DataFrame(data)
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
 
         # Check column renaming
         assert "Sector_L1" in df.columns
@@ -46,8 +74,8 @@ class TestDataLoader:
         assert "Yield" in df.columns
 
         # Check data cleaning
-        assert df["Nominal_USD"].iloc[0] == 1000000.0
-        assert df["Yield"].iloc[0] == pytest.approx(0.045, rel=1e-3)
+        assert df["Nominal_USD"].to_numpy()[0] == 1000000.0
+        assert df["Yield"].to_numpy()[0] == pytest.approx(0.045, rel=1e-3)
 
         # Check enrichment
         assert "Net_Carry" in df.columns
@@ -55,130 +83,125 @@ class TestDataLoader:
         assert "Is_Tradeable" in df.columns
         assert "Liquidity_Proxy" in df.columns
 
-    def test_nominal_cleaning(self):
+    def test_nominal_cleaning(self, shared_loader):
         """Test cleaning of Nominal_USD column."""
-        data = {
-            "分类1": ["MBS", "Corps"],
-            "TICKER": ["A", "B"],
-            "AccSection": ["AFS", "AFS"],
-            "Nominal（USD）": ["1,234,567.89", "$2,000,000"],
-            "Duration": [5.0, 3.0],
-            "EffectiveYield": ["4.5%", "3.8%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([
+            {"Nominal（USD）": "1,234,567.89"},
+            {"分类1": "Corps", "TICKER": "B", "Nominal（USD）": "$2,000,000", "Duration": 3.0, "EffectiveYield": "3.8%"},
+        ])
 
-        loader = DataLoader()
-        df = loader.load(df_input)
-
-        assert df["Nominal_USD"].iloc[0] == pytest.approx(1234567.89, rel=1e-3)
-        assert df["Nominal_USD"].iloc[1] == pytest.approx(2000000.0, rel=1e-3)
+        df = shared_loader.load(df_input)
 
-    def test_yield_cleaning(self):
-        """Test cleaning of Yield column."""
-        data = {
-            "分类1": ["MBS", "Corps", "Fins"],
-            "TICKER": ["A", "B", "C"],
-            "AccSection": ["AFS", "AFS", "AFS"],
-            "Nominal（USD）": [1000000, 2000000, 3000000],
-            "Duration": [5.0, 3.0, 2.5],
-            "EffectiveYield": ["4.5%", "0.038", "5"],  # Various formats
-        }
-        df_input = pd.DataFrame(data)
+        assert df["Nominal_USD"].to_numpy()[0] == pytest.approx(1234567.89, rel=1e-3)
+        assert df["Nominal_USD"].to_numpy()[1] == pytest.approx(2000000.0, rel=1e-3)
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+    @pytest.mark.parametrize(
+        "raw_yield, expected",
+        [("4.5%", 0.045), ("0.038", 0.038), ("5", 0.05), ("5\u3000", 0.05)],  # Full-width space
+    )
+    def test_yield_cleaning(self, raw_yield, expected, shared_loader):
+        """Test cleaning of Yield column across export formats."""
+        df = shared_loader.load(make_df([{"EffectiveYield": raw_yield}]))
 
-        assert df["Yield"].iloc[0] == pytest.approx(0.045, rel=1e-3)
-        assert df["Yield"].iloc[1] == pytest.approx(0.038, rel=1e-3)
-        assert df["Yield"].iloc[2] == pytest.approx(0.05, rel=1e-3)
+        assert df["Yield"].to_numpy()[0] == pytest.approx(expected, rel=1e-3)
 
-    def test_accounting_standardization(self):
+    def test_accounting_standardization(self, shared_loader):
         """Test standardization of Accounting values."""
-        data = {
-            "分类1": ["MBS", "Corps", "Fins", "Rates"],
-            "TICKER": ["A", "B", "C", "D"],
-            "AccSection": ["htm", "AFS", "FAIR VALUE", "fv"],
-            "Nominal（USD）": [1000000, 2000000, 3000000, 4000000],
-            "Duration": [5.0, 3.0, 2.5, 4.0],
-            "EffectiveYield": ["4.5%", "3.8%", "4.2%", "4.0%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"AccSection": accounting} for accounting in ["htm", "AFS", "FAIR VALUE", "fv"]])
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
+
+        assert df["Accounting"].to_numpy()[0] == "HTM"
+        assert df["Accounting"].to_numpy()[1] == "AFS"
+        assert df["Accounting"].to_numpy()[2] == "Fair Value"
+        assert df["Accounting"].to_numpy()[3] == "Fair Value"
+
+    def test_polars_string_parsing_matches_pandas(self):
+        """Test the Polars string-parsing path agrees with pandas, NaNs included."""
+        pytest.importorskip("polars")
+        values = pd.Series([None, "1,234.5", "$2,000", "(1,000)", "4.5%", " 7 ", "8\u3000", "abc", "", "1e6"])
+
+        for pattern, negate_parens in [(NOMINAL_STRIP_PATTERN, True), (RATE_STRIP_PATTERN, False)]:
+            pd.testing.assert_series_equal(
+                _strings_to_float_polars(values, pattern, negate_parens),
+                _strings_to_float(values, pattern, negate_parens),
+            )
+
+    @pytest.mark.parametrize("storage", ["python", "pyarrow"])
+    def test_string_parsing_across_string_storages(self, storage):
+        """Test the strip patterns work in both Python re and Arrow regex engines."""
+        values = pd.Series(["1,234.5", "$2,000", "(1,000)", "4.5%\xa0", " 7 ", "8\u3000", "abc", None])
+
+        with pd.option_context("mode.string_storage", storage):
+            assert values.astype("string").dtype.storage == storage
+            nominal = _strings_to_float(values, NOMINAL_STRIP_PATTERN, negate_parens=True)
+            rate = _strings_to_float(values, RATE_STRIP_PATTERN)
 
-        assert df["Accounting"].iloc[0] == "HTM"
-        assert df["Accounting"].iloc[1] == "AFS"
-        assert df["Accounting"].iloc[2] == "Fair Value"
-        assert df["Accounting"].iloc[3] == "Fair Value"
+        np.testing.assert_array_equal(nominal, [1234.5, 2000.0, -1000.0, np.nan, 7.0, 8.0, np.nan, np.nan])
+        np.testing.assert_array_equal(rate, [np.nan, np.nan, np.nan, 4.5, 7.0, 8.0, np.nan, np.nan])
 
-    def test_is_tradeable_flag(self):
+    def test_is_tradeable_flag(self, shared_loader):
         """Test Is_Tradeable flag based on accounting."""
-        data = {
-            "分类1": ["MBS", "Corps"],
-            "TICKER": ["A", "B"],
-            "AccSection": ["HTM", "AFS"],
-            "Nominal（USD）": [1000000, 2000000],
-            "Duration": [5.0, 3.0],
-            "EffectiveYield": ["4.5%", "3.8%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"AccSection": "HTM"}, {"TICKER": "B"}])
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
 
-        assert df["Is_Tradeable"].iloc[0] == False  # HTM
-        assert df["Is_Tradeable"].iloc[1] == True   # AFS
+        assert df["Is_Tradeable"].to_numpy()[0] == False  # HTM
+        assert df["Is_Tradeable"].to_numpy()[1] == True   # AFS
 
-    def test_liquidity_proxy(self):
+    def test_liquidity_proxy(self, shared_loader):
         """Test Liquidity_Proxy calculation."""
-        data = {
-            "分类1": ["MBS", "Corps"],
-            "TICKER": ["A", "B"],
-            "AccSection": ["AFS", "AFS"],
-            "Nominal（USD）": [5000000, 15000000],  # Below and above $10M
-            "Duration": [5.0, 3.0],
-            "EffectiveYield": ["4.5%", "3.8%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"Nominal（USD）": 5000000}, {"Nominal（USD）": 15000000}])  # Below and above $10M
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
+
+        assert df["Liquidity_Proxy"].to_numpy()[0] == 3  # Below threshold
+        assert df["Liquidity_Proxy"].to_numpy()[1] == 5  # Above threshold
+
+    def test_ticker_root(self, shared_loader):
+        """Test Ticker_Root extraction from full bond tickers."""
+        df_input = make_df([{"分类1": "Corps", "TICKER": ticker} for ticker in ["AAPL 3.85 05/04/43", "JPM"]])
+
+        df = shared_loader.load(df_input)
 
-        assert df["Liquidity_Proxy"].iloc[0] == 3  # Below threshold
-        assert df["Liquidity_Proxy"].iloc[1] == 5  # Above threshold
+        assert df["Ticker_Root"].to_numpy()[0] == "AAPL"
+        assert df["Ticker_Root"].to_numpy()[1] == "JPM"
 
-    def test_net_carry_calculation(self):
+    def test_compact_dtypes(self, shared_loader):
+        """Test numeric downcasting, categorical labels and Arrow string identifiers."""
+        df_input = make_df([
+            {"分类1": "Corps", "TICKER": "AAPL 3.85 05/04/43"},
+            {"分类1": "Fins", "TICKER": "JPM", "AccSection": "HTM"},
+            {"分类1": "Corps", "TICKER": "MSFT", "Nominal（USD）": "9,999,999.99"},
+        ])
+
+        df = shared_loader.load(df_input)
+
+        assert df["Duration"].dtype == np.float32
+        assert df["Yield"].dtype == np.float32
+        assert df["Nominal_USD"].dtype == np.float64  # Currency keeps its cents
+        assert df["Nominal_USD"].iloc[2] == 9_999_999.99
+        assert df["Liquidity_Proxy"].iloc[2] == 3  # Still below the $10M threshold
+        assert df["Liquidity_Proxy"].dtype == np.int8
+        assert isinstance(df["Sector_L1"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["Accounting"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["Ticker_Root"].dtype, pd.CategoricalDtype)
+        assert df["Ticker"].dtype == "string[pyarrow]"
+        assert (df["Sector_L1"] == "Corps").tolist() == [True, False, True]
+
+    def test_net_carry_calculation(self, shared_loader):
         """Test Net_Carry calculation."""
-        data = {
-            "分类1": ["MBS", "Corps"],
-            "TICKER": ["A", "B"],
-            "AccSection": ["AFS", "AFS"],
-            "Nominal（USD）": [1000000, 2000000],
-            "Duration": [5.0, 3.0],
-            "EffectiveYield": ["5%", "3%"],
-            "FTP Rate": ["4%", "4%"],  # Yield > FTP and Yield < FTP
-        }
-        df_input = pd.DataFrame(data)
+        # Yield > FTP and Yield < FTP
+        df_input = make_df([{"EffectiveYield": "5%", "FTP Rate": "4%"}, {"EffectiveYield": "3%", "FTP Rate": "4%"}])
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
 
-        assert df["Net_Carry"].iloc[0] == pytest.approx(0.01, rel=1e-3)   # Positive carry
-        assert df["Net_Carry"].iloc[1] == pytest.approx(-0.01, rel=1e-3)  # Negative carry
+        assert df["Net_Carry"].to_numpy()[0] == pytest.approx(0.01, rel=1e-3)   # Positive carry
+        assert df["Net_Carry"].to_numpy()[1] == pytest.approx(-0.01, rel=1e-3)  # Negative carry
 
     def test_quality_report(self):
         """Test data quality report generation."""
-        data = {
-            "分类1": ["MBS", "Corps"],
-            "TICKER": ["A", "B"],
-            "AccSection": ["AFS", "AFS"],
-            "Nominal（USD）": [1000000, 2000000],
-            "Duration": [5.0, 3.0],
-            "EffectiveYield": ["4.5%", "3.8%"],
-            "FTP Rate": [np.nan, "4%"],  # One missing FTP
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"FTP Rate": np.nan}, {"TICKER": "B", "FTP Rate": "4%"}])  # One missing FTP
 
         loader = DataLoader()
         df = loader.load(df_input)
@@ -188,6 +211,95 @@ class TestDataLoader:
         assert report.ftp_missing_count == 1
         assert "A" in report.ftp_missing_tickers
 
+    def test_get_raw_data(self):
+        """Test raw data is available with and without keeping a copy."""
+        df_input = make_df([
+            {"Nominal（USD）": "1,000,000"},
+            {"TICKER": "B", "AccSection": "HTM", "Nominal（USD）": "2,000,000"},
+        ])
+
+        assert DataLoader().get_raw_data() is None
+
+        for keep_raw in (False, True):
+            loader = DataLoader(keep_raw=keep_raw)
+            loader.load(df_input)
+            pd.testing.assert_frame_equal(loader.get_raw_data(), df_input)
+
+    def test_get_raw_data_refuses_changed_source(self, tmp_path):
+        """Test a source file changed since the load is not re-read."""
+        csv_path = tmp_path / "portfolio.csv"
+        make_df([{"Nominal（USD）": "1,000,000"}]).to_csv(csv_path, index=False)
+
+        loader = DataLoader(cache_dir=tmp_path / "cache")
+        loader.load(csv_path)
+        assert loader.get_raw_data()["TICKER"].tolist() == ["A"]
+
+        # Replaced with an older timestamp, as cp -p or unzip would
+        mtime_ns = csv_path.stat().st_mtime_ns
+        make_df([{"TICKER": "B"}]).to_csv(csv_path, index=False)
+        os.utime(csv_path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+        assert loader.get_raw_data() is None
+
+        csv_path.unlink()
+        assert loader.get_raw_data() is None
+
+        kept = DataLoader(keep_raw=True)
+        df_input = make_df([{}])
+        kept.load(df_input)
+        df_input.loc[0, "TICKER"] = "Z"
+        assert kept.get_raw_data()["TICKER"].tolist() == ["A"]
+
+    def test_load_without_copy_leaves_source_untouched(self):
+        """Test copy=False still leaves the caller's DataFrame unmodified."""
+        data = {
+            "Sector_L1": ["MBS", "Corps"],
+            "Ticker": ["A", "B"],
+            "Accounting": ["afs", "HTM"],
+            "Nominal_USD": ["1,000,000", "2,000,000"],
+            "Duration": [5.0, 3.0],
+            "Yield": ["4.5%", "3.8%"],
+        }
+        df_input = pd.DataFrame(data)
+        expected = df_input.copy()
+
+        df = DataLoader().load(df_input, copy=False)
+
+        assert df["Nominal_USD"].to_numpy()[0] == 1000000.0
+        pd.testing.assert_frame_equal(df_input, expected)
+
+    def test_csv_parquet_cache(self, tmp_path):
+        """Test repeat CSV loads are served from the Parquet cache, keyed on the file version."""
+        data_dir, cache_dir = tmp_path / "data", tmp_path / "cache"
+        data_dir.mkdir()
+        csv_path = data_dir / "portfolio.csv"
+        make_df([
+            {"Nominal（USD）": "1,000,000"},
+            {"TICKER": "B", "AccSection": "HTM", "Nominal（USD）": "2,000,000"},
+        ]).to_csv(csv_path, index=False)
+
+        # No cache directory: nothing is written anywhere
+        DataLoader().load(csv_path)
+        assert list(tmp_path.iterdir()) == [data_dir]
+        assert list(data_dir.iterdir()) == [csv_path]
+
+        first = DataLoader(cache_dir=cache_dir).load(csv_path)
+        assert len(list(cache_dir.glob("portfolio-*.parquet"))) == 1
+
+        cached = DataLoader(cache_dir=cache_dir).load(csv_path)
+        pd.testing.assert_frame_equal(cached, first)
+
+        # A replacement stamped with an older mtime is still re-read, and replaces the entry
+        mtime_ns = csv_path.stat().st_mtime_ns
+        make_df([{"TICKER": "C", "Nominal（USD）": "3,000,000"}]).to_csv(csv_path, index=False)
+        os.utime(csv_path, ns=(mtime_ns - 10**9, mtime_ns - 10**9))
+        replaced = DataLoader(cache_dir=cache_dir).load(csv_path)
+        assert replaced["Ticker"].tolist() == ["C"]
+        assert len(list(cache_dir.glob("portfolio-*.parquet"))) == 1
+
+        # A different requested encoding gets its own entry
+        loader = DataLoader(cache_dir=cache_dir)
+        assert loader._raw_cache_path(csv_path, "gbk") != loader._raw_cache_path(csv_path, "utf-8")
+
     def test_missing_required_columns(self):
         """Test error on missing required columns."""
         data = {
@@ -205,44 +317,24 @@ class TestDataLoader:
 class TestCarryEfficiency:
     """Test Carry Efficiency calculations."""
 
-    def test_carry_efficiency_normal(self):
+    def test_carry_efficiency_normal(self, shared_loader):
         """Test normal carry efficiency calculation."""
-        data = {
-            "分类1": ["MBS"],
-            "TICKER": ["A"],
-            "AccSection": ["AFS"],
-            "Nominal（USD）": [1000000],
-            "Duration": [5.0],
-            "EffectiveYield": ["5%"],
-            "FTP Rate": ["4%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"EffectiveYield": "5%", "FTP Rate": "4%"}])
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
 
         # Net Carry = 0.05 - 0.04 = 0.01
         # Carry Efficiency = 0.01 / 5.0 = 0.002
-        assert df["Carry_Efficiency"].iloc[0] == pytest.approx(0.002, rel=1e-3)
+        assert df["Carry_Efficiency"].to_numpy()[0] == pytest.approx(0.002, rel=1e-3)
 
-    def test_carry_efficiency_zero_duration(self):
+    def test_carry_efficiency_zero_duration(self, shared_loader):
         """Test carry efficiency with zero duration."""
-        data = {
-            "分类1": ["MBS"],
-            "TICKER": ["A"],
-            "AccSection": ["AFS"],
-            "Nominal（USD）": [1000000],
-            "Duration": [0.0],  # Zero duration
-            "EffectiveYield": ["5%"],
-            "FTP Rate": ["4%"],
-        }
-        df_input = pd.DataFrame(data)
+        df_input = make_df([{"Duration": 0.0, "EffectiveYield": "5%", "FTP Rate": "4%"}])  # Zero duration
 
-        loader = DataLoader()
-        df = loader.load(df_input)
+        df = shared_loader.load(df_input)
 
         # Should be NaN due to division by zero
-        assert pd.isna(df["Carry_Efficiency"].iloc[0])
+        assert pd.isna(df["Carry_Efficiency"].to_numpy()[0])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""
+Tests for the Financials module.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.module_b.financials import (
+    FinancialDataLoader,
+    _derive_quarterly_metrics,
+    _derive_quarterly_metrics_polars,
+)
+
+
+class TestFinancialDataLoader:
+    """Test suite for FinancialDataLoader."""
+
+    @pytest.fixture
+    def loader(self, tmp_path):
+        """Create a loader backed by small bond-equity map and quarterly files."""
+        pd.DataFrame({
+            "Bond_Ticker": ["AAPL", "JPM", "C", "C", "XYZ"],
+            "Equity_Ticker": ["AAPL US Equity", "JPM US Equity", "C US Equity", "8156Z US Equity", "N/A"],
+            "Issuer_Name": ["APPLE INC", "JPMORGAN", "CITIGROUP INC", "CITIBANK NA", "UNKNOWN"],
+        }).to_csv(tmp_path / "bond_equity_map.csv", index=False)
+
+        pd.DataFrame({
+            "Equity_Ticker": ["AAPL US Equity", "AAPL US Equity", "JPM US Equity", "JPM US Equity", "C US Equity"],
+            "Date": ["2024-06-30", "2024-09-30", "2024-06-30", "2024-09-30", "2024-09-30"],
+            "Year": [2024, 2024, 2024, 2024, 2024],
+            "Quarter": [2, 3, 2, 3, 3],
+            "Revenue": [100.0, 120.0, 50.0, 55.0, 80.0],
+            "EBITDA": [30.0, 40.0, np.nan, -5.0, 20.0],
+            "Total_Liabilities": [200.0, 220.0, 500.0, 510.0, 300.0],
+            "Cash": [60.0, 60.0, 100.0, 110.0, 50.0],
+            "Net_Int_Exp": [-4.0, -5.0, 2.0, 0.0, np.nan],
+        }).to_csv(tmp_path / "quarterly_financials.csv", index=False)
+
+        loader = FinancialDataLoader(data_dir=tmp_path)
+        assert loader.load_data()
+        return loader
+
+    def test_latest_metrics_batch_matches_issuer_cache(self, loader):
+        """Test batch metrics agree with per-issuer latest_quarter values."""
+        latest = loader.get_latest_metrics_batch(["AAPL 3.5 05/30/30", "JPM", "C", "XYZ", "MISSING"])
+
+        assert set(latest.index) == {"AAPL", "JPM", "C"}
+
+        for bond_ticker in latest.index:
+            quarter = loader.get_issuer_fundamentals(bond_ticker).latest_quarter
+            row = latest.loc[bond_ticker]
+            for attr, col in [
+                ("net_leverage", "Net_Leverage"),
+                ("interest_coverage", "Interest_Coverage"),
+                ("revenue_qoq_growth", "Revenue_QoQ_Growth"),
+            ]:
+                expected = getattr(quarter, attr)
+                if expected is None:
+                    assert np.isnan(row[col])
+                else:
+                    assert row[col] == pytest.approx(expected)
+
+    def test_latest_metrics_batch_derived_values(self, loader):
+        """Test derived leverage, coverage, margin and growth values."""
+        latest = loader.get_latest_metrics_batch(["AAPL", "C"])
+
+        aapl = latest.loc["AAPL"]
+        assert aapl["Net_Leverage"] == pytest.approx((220.0 - 60.0) / 40.0)
+        assert aapl["Interest_Coverage"] == pytest.approx(40.0 / 5.0)
+        assert aapl["EBITDA_Margin"] == pytest.approx(40.0 / 120.0 * 100)
+        assert aapl["Revenue_QoQ_Growth"] == pytest.approx(0.2)
+
+        # Duplicated bond ticker resolves to the mapping that has quarterly data
+        assert latest.loc["C", "Equity_Ticker"] == "C US Equity"
+
+    def test_load_latest_metrics_parquet_cache(self, loader, tmp_path):
+        """Test latest metrics round-trip through the Parquet cache."""
+        cache_dir = tmp_path / "cache"
+        loader.cache_dir = cache_dir
+
+        computed = loader.load_latest_metrics()
+        assert len(list(cache_dir.glob("latest_metrics-*.parquet"))) == 1
+
+        cached = loader.load_latest_metrics()
+        pd.testing.assert_frame_equal(cached, computed, check_freq=False)
+        assert set(cached.index) == {"AAPL", "JPM", "C"}
+
+    def test_load_latest_metrics_ignores_replaced_source(self, loader, tmp_path):
+        """Test a source rewritten with an older mtime misses the cache and prunes the old entry."""
+        cache_dir = tmp_path / "cache"
+        loader.cache_dir = cache_dir
+        loader.load_latest_metrics()
+
+        financials_path = tmp_path / "quarterly_financials.csv"
+        mtime_ns = financials_path.stat().st_mtime_ns
+        qf = pd.read_csv(financials_path)
+        qf["EBITDA"] *= 10
+        qf.to_csv(financials_path, index=False)
+        os.utime(financials_path, ns=(mtime_ns - 3_600 * 10**9, mtime_ns - 3_600 * 10**9))
+
+        reloaded = FinancialDataLoader(data_dir=tmp_path, cache_dir=cache_dir)
+        assert reloaded.load_data()
+        latest = reloaded.load_latest_metrics()
+
+        expected = reloaded.get_issuer_fundamentals("AAPL").latest_quarter.net_leverage
+        assert latest.loc["AAPL", "Net_Leverage"] == pytest.approx(expected)
+        assert latest.loc["AAPL", "Net_Leverage"] == pytest.approx((220.0 - 60.0) / 400.0)
+        assert len(list(cache_dir.glob("latest_metrics-*.parquet"))) == 1
+
+    def test_trend_frame_matches_trend_series(self, loader):
+        """Test the single-pass trend frame agrees with per-metric series."""
+        fundamentals = loader.get_issuer_fundamentals("JPM")
+        trend_frame = fundamentals.get_trend_frame()
+
+        for metric_name in ["total_liabilities", "net_leverage", "interest_coverage", "revenue_qoq_growth"]:
+            dates, values = fundamentals.get_trend_series(metric_name)
+            series = trend_frame[metric_name].dropna()
+            assert series.index.tolist() == dates
+            assert series.tolist() == pytest.approx(values)
+
+    def test_polars_derived_metrics_match_numpy(self, loader):
+        """Test the Polars build path agrees with the NumPy path, NaNs included."""
+        pytest.importorskip("polars")
+        qf = loader.quarterly_financials
+
+        for expected, actual in zip(_derive_quarterly_metrics(qf), _derive_quarterly_metrics_polars(qf)):
+            np.testing.assert_allclose(actual, expected, equal_nan=True)
+
+    def test_columnar_quarters_materialize_records(self, loader):
+        """Test per-metric arrays rebuild QuarterlyMetrics with None for undefined ratios."""
+        fundamentals = loader.get_issuer_fundamentals("JPM")
+        first, latest = fundamentals.quarterly_data
+
+        assert fundamentals.n_quarters == 2
+        assert np.isnan(fundamentals.net_leverage).all()
+        assert first.ebitda == 0.0  # Missing raw amounts are zero-filled
+        assert latest.net_leverage is None  # Negative EBITDA
+        assert latest.interest_coverage is None  # Zero interest expense
+        assert latest.revenue_qoq_growth == pytest.approx(0.1)
+        assert latest == fundamentals.latest_quarter